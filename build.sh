@@ -2,11 +2,55 @@
 # exit on error
 set -o errexit
 
+# WAL, busy timeout and persistent connections for the deployed SQLite files
+# (neu_cse/sqlite_profiles.py); the server's environment should set the same
+export SQLITE_PROFILE="${SQLITE_PROFILE:-production}"
+
 # Install dependencies
 pip install -r requirements.txt
 
+# Compile the Tailwind stylesheet from the classes used in templates
+# (the downloaded CLI must match TAILWIND_CLI_SHA256; or point TAILWIND_CLI at an installed one)
+if [ -z "${TAILWIND_CLI:-}" ] && [ -z "${TAILWIND_CLI_SHA256:-}" ] && ! command -v tailwindcss > /dev/null; then
+    echo "build.sh: cannot build static/css/tailwind.css. Set TAILWIND_CLI_SHA256 to the checksum of the" >&2
+    echo "  standalone CLI for this platform, e.g. linux-x64=<sha256> from sha256sums.txt of the release named" >&2
+    echo "  by TAILWIND_VERSION in cse_app/management/commands/build_tailwind_css.py, or set TAILWIND_CLI" >&2
+    echo "  to an installed tailwindcss executable." >&2
+    exit 1
+fi
+python manage.py build_tailwind_css
+
 # Collect static files (this includes admin CSS/JS)
 python manage.py collectstatic --no-input
 
 # Run database migrations
 python manage.py migrate
+python manage.py migrate --database analytics
+
+# Move page-view counters recorded before the analytics database existed
+python manage.py copy_analytics_data
+
+# Generate responsive WebP variants for uploaded images
+python manage.py generate_image_derivatives
+
+# Refresh the full-text search index
+python manage.py rebuild_search_index
+
+# Link publication authors to faculty members
+python manage.py backfill_publication_authors
+
+# Link faculty to the normalized research-area taxonomy (the statistics count it)
+python manage.py backfill_research_areas
+
+# Clear the is_upcoming flag of events that have ended (listings use the clock;
+# the admin filters read the flag, so also run this hourly from cron)
+python manage.py sweep_event_status
+
+# Recount the materialized department statistics
+python manage.py department_stats --rebuild
+
+# Copy the migrated database to local SQLite read replicas, if any are configured
+# (run `python manage.py refresh_sqlite_replicas --interval 60` alongside the server to keep them current)
+case "${DATABASE_REPLICA_URLS:-}" in
+    *sqlite://*) python manage.py refresh_sqlite_replicas ;;
+esac
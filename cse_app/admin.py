@@ -1,8 +1,10 @@
 from django.contrib import admin
+from django.db.models import Count
 from django.utils.html import format_html
 from django import forms
 from django.contrib.auth.models import User
 from .models import *
+from . import profile_completion, research_areas, unique_visitors
 
 
 # Custom form for FacultyMember to show only available users
@@ -61,6 +63,27 @@ class ProfessionalExperienceInline(admin.TabularInline):
 # - CourseRecordInline (use 'courses_taught' rich text field)
 # - MembershipRecordInline (use 'membership' rich text field)
 
+class ProfileCompletionFilter(admin.SimpleListFilter):
+    """Filter faculty by their stored profile-completion score"""
+    title = 'profile completion'
+    parameter_name = 'completion'
+    BUCKETS = {
+        'complete': (100, 100, 'Complete (100%)'),
+        'high': (75, 99, '75–99%'),
+        'medium': (50, 74, '50–74%'),
+        'low': (0, 49, 'Below 50%'),
+    }
+
+    def lookups(self, request, model_admin):
+        return [(key, label) for key, (_, _, label) in self.BUCKETS.items()]
+
+    def queryset(self, request, queryset):
+        if self.value() in self.BUCKETS:
+            low, high, _ = self.BUCKETS[self.value()]
+            return queryset.filter(profile_completion__gte=low, profile_completion__lte=high)
+        return queryset
+
+
 @admin.register(FacultyMember)
 class FacultyMemberAdmin(admin.ModelAdmin):
     form = FacultyMemberAdminForm  # Use custom form
@@ -74,9 +97,11 @@ class FacultyMemberAdmin(admin.ModelAdmin):
         'linked_user',
         'joined_date',
         'is_current',
-        'is_chairman'
+        'is_chairman',
+        'completion',
+        'missing_items',
     )
-    list_filter = ('designation', 'status', 'member_type', 'is_current', 'is_chairman', 'joined_date')
+    list_filter = ('designation', 'status', 'member_type', 'is_current', 'is_chairman', ProfileCompletionFilter, 'joined_date')
     search_fields = ('name', 'email', 'phone', 'research_interest', 'bio', 'user__username')
     
     # Enhanced inlines for comprehensive faculty profile management
@@ -96,6 +121,17 @@ class FacultyMemberAdmin(admin.ModelAdmin):
         return format_html('<span style="color: red;">✗ No User</span>')
     linked_user.short_description = 'Linked User'
     linked_user.admin_order_field = 'user'
+
+    def completion(self, obj):
+        """Stored profile-completion score"""
+        return f'{obj.profile_completion}%'
+    completion.short_description = 'Profile'
+    completion.admin_order_field = 'profile_completion'
+
+    def missing_items(self, obj):
+        """What the profile still lacks, from the stored breakdown"""
+        return ', '.join(profile_completion.labels(obj.profile_missing)) or '—'
+    missing_items.short_description = 'Missing'
     
     def get_form(self, request, obj=None, **kwargs):
         """Customize form display"""
@@ -201,6 +237,46 @@ class FacultyMemberAdmin(admin.ModelAdmin):
     )
 
 
+# =====================================
+# RESEARCH AREAS
+# =====================================
+
+class ResearchAreaAliasInline(admin.TabularInline):
+    model = ResearchAreaAlias
+    extra = 1
+    fields = ('normalized_name',)
+
+
+@admin.register(ResearchArea)
+class ResearchAreaAdmin(admin.ModelAdmin):
+    list_display = ('name', 'slug', 'member_count')
+    search_fields = ('name', 'normalized_name', 'aliases__normalized_name')
+    readonly_fields = ('normalized_name',)
+    prepopulated_fields = {'slug': ('name',)}
+    inlines = [ResearchAreaAliasInline]
+    actions = ['merge_areas']
+
+    def get_queryset(self, request):
+        return super().get_queryset(request).annotate(member_count=Count('faculty'))
+
+    def member_count(self, obj):
+        """Faculty members linked to this area"""
+        return obj.member_count
+    member_count.short_description = 'Faculty'
+    member_count.admin_order_field = 'member_count'
+
+    def merge_areas(self, request, queryset):
+        """Merge the selected areas into the one with the most faculty"""
+        areas = list(queryset.order_by('-member_count', 'name'))
+        if len(areas) < 2:
+            self.message_user(request, 'Select at least two research areas to merge.')
+            return
+        target, others = areas[0], areas[1:]
+        research_areas.merge(target, others)
+        self.message_user(request, f'Merged {len(others)} research areas into "{target.name}".')
+    merge_areas.short_description = "Merge selected areas (keeps the most used name)"
+
+
 # =====================================
 # DEPARTMENT STATISTICS ADMIN
 # =====================================
@@ -264,28 +340,28 @@ class DepartmentStatisticsAdmin(admin.ModelAdmin):
     get_edit_link.short_description = 'Click Any Field to Edit →'
     
     def get_faculty_display(self, obj):
-        actual = obj.get_faculty_count()
+        actual = obj.computed_faculty
         if obj.total_faculty == 0:
             return format_html('<span style="color: green;">✓ {} (Auto)</span>', actual)
         return format_html('{} <span style="color: gray;">(Actual: {})</span>', obj.total_faculty, actual)
     get_faculty_display.short_description = 'Faculty'
     
     def get_research_areas_display(self, obj):
-        actual = obj.get_research_areas_count()
+        actual = obj.computed_research_areas
         if obj.total_research_areas == 0:
             return format_html('<span style="color: green;">✓ {} (Auto)</span>', actual)
         return format_html('{} <span style="color: gray;">(Actual: {})</span>', obj.total_research_areas, actual)
     get_research_areas_display.short_description = 'Research Areas'
     
     def get_publications_display(self, obj):
-        actual = obj.get_publications_count()
+        actual = obj.computed_publications
         if obj.total_publications == 0:
             return format_html('<span style="color: green;">✓ {} (Auto)</span>', actual)
         return format_html('{} <span style="color: gray;">(Actual: {})</span>', obj.total_publications, actual)
     get_publications_display.short_description = 'Publications'
     
     def get_projects_display(self, obj):
-        actual = obj.get_projects_count()
+        actual = obj.computed_projects
         if obj.total_projects == 0:
             return format_html('<span style="color: green;">✓ {} (Auto)</span>', actual)
         return format_html('{} <span style="color: gray;">(Actual: {})</span>', obj.total_projects, actual)
@@ -360,4 +436,29 @@ admin.site.register(Chairman)
 admin.site.register(ComputerClubMember)
 admin.site.register(CarouselItem)
 admin.site.register(ImageGallery)
-admin.site.register(TechNews)
\ No newline at end of file
+admin.site.register(TechNews)
+
+
+# =====================================
+# PAGE VIEWS ADMIN
+# =====================================
+
+@admin.register(ViewCount)
+class ViewCountAdmin(admin.ModelAdmin):
+    list_display = ('page_name', 'count', 'get_unique_visitors', 'last_updated')
+    search_fields = ('page_name',)
+    ordering = ('-count',)
+    readonly_fields = ('page_name', 'count', 'last_updated')
+
+    def get_changelist_instance(self, request):
+        """Estimate the unique visitors of every page on the changelist in one query"""
+        changelist = super().get_changelist_instance(request)
+        changelist.result_list = list(changelist.result_list)
+        estimates = unique_visitors.estimate([obj.page_name for obj in changelist.result_list], days=7)
+        for obj in changelist.result_list:
+            obj.unique_visitors = estimates[obj.page_name]
+        return changelist
+
+    def get_unique_visitors(self, obj):
+        return f"~{obj.unique_visitors}"
+    get_unique_visitors.short_description = 'Unique visitors (7 days)'
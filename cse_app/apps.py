@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class CseAppConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'cse_app'
+
+    def ready(self):
+        # Register cache invalidation and index maintenance signal handlers
+        from . import signals  # noqa: F401
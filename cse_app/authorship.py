@@ -0,0 +1,115 @@
+"""
+Normalized publication authorship.
+
+``Publication.authors`` is free text ("Md. Anwarul Islam, Kohinur Parvin and
+A. Rahman"). We split it into ``PublicationAuthor`` rows and link each one to
+the FacultyMember whose normalized name matches exactly, so per-faculty
+publication lists and co-author lookups are indexed joins instead of
+``authors__icontains`` scans that also match similar names.
+"""
+import re
+
+from django.db.models import Count
+
+from .models import FacultyMember, Publication, PublicationAuthor
+
+_SEPARATORS = re.compile(r'\s*(?:;|,|&|\band\b)\s*', re.IGNORECASE)
+_HONORIFICS = re.compile(r'^(?:(?:dr|prof|professor|engr|mr|mrs|ms)\.?\s+)+', re.IGNORECASE)
+_NON_WORD = re.compile(r'[^\w\s]', re.UNICODE)
+_SPACES = re.compile(r'\s+')
+
+
+def normalize_name(name):
+    """Case- and punctuation-insensitive form used for matching: 'Dr. Md. Anwarul  Islam' -> 'md anwarul islam'."""
+    name = _HONORIFICS.sub('', (name or '').strip())
+    name = _NON_WORD.sub(' ', name.casefold())
+    return _SPACES.sub(' ', name).strip()
+
+
+def split_authors(authors):
+    """Split a free-text author list into individual names, in order."""
+    return [part.strip() for part in _SEPARATORS.split(authors or '') if part.strip()]
+
+
+def faculty_name_index():
+    """Map normalized names to FacultyMember ids, leaving out ambiguous names."""
+    index = {}
+    ambiguous = set()
+    for pk, name in FacultyMember.objects.values_list('id', 'name'):
+        key = normalize_name(name)
+        if key in index:
+            ambiguous.add(key)
+        index[key] = pk
+    for key in ambiguous:
+        del index[key]
+    return index
+
+
+def sync_publication(publication, name_index=None):
+    """Rebuild the PublicationAuthor rows of one publication."""
+    if name_index is None:
+        name_index = faculty_name_index()
+    entries = []
+    for position, name in enumerate(split_authors(publication.authors)):
+        normalized = normalize_name(name)
+        entries.append(PublicationAuthor(
+            publication=publication,
+            faculty_id=name_index.get(normalized),
+            name=name[:200],
+            normalized_name=normalized[:200],
+            position=position,
+        ))
+    PublicationAuthor.objects.filter(publication=publication).delete()
+    PublicationAuthor.objects.bulk_create(entries)
+    return len(entries)
+
+
+def faculty_with_name(key):
+    """Ids of the faculty whose normalized name is ``key``."""
+    members = FacultyMember.objects.all()
+    for word in key.split():
+        # Narrow down in SQL; the exact comparison needs the Python normalization
+        members = members.filter(name__icontains=word)
+    return [pk for pk, name in members.values_list('id', 'name') if normalize_name(name) == key]
+
+
+def relink_faculty(faculty, old_name=None):
+    """Point the author entries of ``faculty``'s current (and previous) name at whoever now owns it."""
+    keys = {normalize_name(faculty.name)}
+    if old_name is not None:
+        keys.add(normalize_name(old_name))
+    linked = 0
+    for key in keys - {''}:
+        owners = faculty_with_name(key)
+        # Two faculty sharing a name leave the entries unlinked rather than guess
+        owner = owners[0] if len(owners) == 1 else None
+        linked += PublicationAuthor.objects.filter(normalized_name=key).update(faculty_id=owner)
+    return linked
+
+
+def backfill():
+    """Parse every publication. Returns ``(publications, author entries, linked entries)``."""
+    name_index = faculty_name_index()
+    publications = 0
+    entries = 0
+    for publication in Publication.objects.all().iterator():
+        entries += sync_publication(publication, name_index)
+        publications += 1
+    linked = PublicationAuthor.objects.filter(faculty__isnull=False).count()
+    return publications, entries, linked
+
+
+def publications_for(faculty):
+    """Publications authored by ``faculty``, newest first."""
+    return Publication.objects.filter(author_entries__faculty=faculty).distinct().order_by('-publication_date')
+
+
+def co_authors(faculty):
+    """Other faculty who share publications with ``faculty``, with a ``shared_publications`` count."""
+    return (
+        FacultyMember.objects
+        .filter(authorships__publication__author_entries__faculty=faculty)
+        .exclude(pk=faculty.pk)
+        .annotate(shared_publications=Count('authorships__publication', distinct=True))
+        .order_by('-shared_publications', 'name')
+    )
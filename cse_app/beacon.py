@@ -0,0 +1,76 @@
+"""
+Page views reported by the browser.
+
+Views no longer touch the counter while building the response. They declare
+their counter name with ``@page_view('notice_{pk}')``; the
+``page_view_beacon`` context processor renders that name into base.html, and
+``static/js/page_views.js`` queues it and posts batches to the beacon endpoint
+with ``navigator.sendBeacon`` when the page is hidden or unloaded. The endpoint
+checks each event against the declared names, lets ``cse_app.traffic_filter``
+drop bot traffic, skips duplicates by event id and hands the rest to
+``cse_app.view_counter.record_view``.
+"""
+import json
+import re
+
+from django.conf import settings
+from django.core.cache import cache
+
+# Regexes for every counter name declared with @page_view
+_patterns = {}
+
+_EVENT_ID_RE = re.compile(r'^[A-Za-z0-9_-]{8,64}$')
+
+
+def page_view(name):
+    """Declare the counter a view's page is reported under; ``{kwarg}`` fields come from the URL."""
+    def decorator(view_func):
+        view_func.page_view_name = name
+        _patterns[name] = re.compile(re.sub(r'\\\{\w+\\\}', r'[\\w-]+', re.escape(name)))
+        return view_func
+    return decorator
+
+
+def page_view_name(request):
+    """The counter name of the view handling ``request``, or ``''``."""
+    match = getattr(request, 'resolver_match', None)
+    name = getattr(match.func, 'page_view_name', None) if match else None
+    return name.format(**match.kwargs) if name else ''
+
+
+def is_known_page(name):
+    return any(pattern.fullmatch(name) for pattern in _patterns.values())
+
+
+def _max_events():
+    return getattr(settings, 'PAGE_VIEW_BEACON_MAX_EVENTS', 20)
+
+
+def parse_events(body):
+    """Parse a beacon body into ``[(event_id, page_name)]``.
+
+    The body is ``{"views": [{"id": "...", "page": "notice_12"}, ...]}``. Malformed
+    input, unknown page names and repeated ids within the batch are skipped.
+    """
+    try:
+        events = json.loads(body)['views'][:_max_events()]
+    except (ValueError, KeyError, TypeError):
+        return []
+    parsed = []
+    seen = set()
+    for event in events:
+        if not isinstance(event, dict):
+            continue
+        event_id, page = event.get('id'), event.get('page')
+        if not isinstance(event_id, str) or not isinstance(page, str):
+            continue
+        if not _EVENT_ID_RE.match(event_id) or event_id in seen or not is_known_page(page):
+            continue
+        seen.add(event_id)
+        parsed.append((event_id, page))
+    return parsed
+
+
+def first_seen(events):
+    """Page names of the events whose ids were not reported in the last hour (retried beacons)."""
+    return [page for event_id, page in events if cache.add(f'cse:beacon:{event_id}', True, 3600)]
@@ -0,0 +1,78 @@
+"""
+Version-stamped cache namespaces.
+
+Every cached value lives under a key that embeds the current version of its
+namespace, e.g. ``home:1718000000000:context``. Invalidating a namespace just
+bumps its version, so stale entries are never read again and simply expire.
+Signal handlers in ``cse_app.signals`` do the bumping when content changes.
+"""
+import time
+
+from django.core.cache import cache
+from django.core.cache.backends.base import DEFAULT_TIMEOUT
+
+from .routers import pin_primary
+
+
+def _version_key(namespace):
+    return f'cse:version:{namespace}'
+
+
+def _new_version():
+    # Time based so a version evicted from the cache never comes back as an old value
+    return time.time_ns()
+
+
+def get_version(namespace):
+    """Return the current version number of ``namespace``."""
+    key = _version_key(namespace)
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, _new_version(), None)
+        version = cache.get(key)
+    return version
+
+
+def get_versions(namespaces):
+    """Return ``{namespace: version}`` for several namespaces in one cache round trip."""
+    keys = {_version_key(namespace): namespace for namespace in namespaces}
+    found = cache.get_many(keys.keys())
+    versions = {keys[key]: version for key, version in found.items()}
+    for namespace in namespaces:
+        if namespace not in versions:
+            versions[namespace] = get_version(namespace)
+    return versions
+
+
+def bump_version(namespace):
+    """Invalidate everything cached under ``namespace``."""
+    # A fresh time-based version rather than incr(), which the file cache cannot do atomically
+    key = _version_key(namespace)
+    version = _new_version()
+    current = cache.get(key)
+    if current is not None and version <= current:
+        version = current + 1  # coarse clocks can repeat a timestamp
+    cache.set(key, version, None)
+    # Keep replicas that have not seen the change from refilling the cache
+    pin_primary()
+
+
+def versioned_key(namespace, *parts):
+    """Build a cache key for ``parts`` inside the current version of ``namespace``."""
+    suffix = ':'.join(str(part) for part in parts)
+    return f'cse:{namespace}:{get_version(namespace)}:{suffix}'
+
+
+def get_or_set(namespace, parts, builder, timeout=DEFAULT_TIMEOUT):
+    """Return the cached value for ``parts`` or build, store and return it.
+
+    Entries expire after the cache's default ``TIMEOUT`` unless ``timeout`` says
+    otherwise: a bump leaves the old version's entries behind, and the file
+    cache only removes them once they have expired.
+    """
+    key = versioned_key(namespace, *parts)
+    value = cache.get(key)
+    if value is None:
+        value = builder()
+        cache.set(key, value, timeout)
+    return value
@@ -1,5 +1,25 @@
+from django.utils.functional import SimpleLazyObject
+
+from .beacon import page_view_name
+from .caching import get_or_set
 from .models import ScrollingNotice
 
+
+def _active_scrolling_notice_text():
+    notice = ScrollingNotice.objects.filter(is_active=True).only('text').first()
+    return notice.text if notice else ''
+
+
 def scrolling_notice(request):
-    notice = ScrollingNotice.objects.filter(is_active=True).first()
-    return {'scrolling_notice': notice.text if notice else ''}
\ No newline at end of file
+    # Resolved only when a template actually renders {{ scrolling_notice }}; the text is
+    # cached under the 'scrolling_notice' namespace, which signals bump on save/delete.
+    return {
+        'scrolling_notice': SimpleLazyObject(
+            lambda: get_or_set('scrolling_notice', ['text'], _active_scrolling_notice_text)
+        )
+    }
+
+
+def page_view_beacon(request):
+    # Counter name rendered into the page for static/js/page_views.js; empty for untracked views
+    return {'page_view_name': page_view_name(request)}
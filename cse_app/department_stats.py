@@ -0,0 +1,121 @@
+"""
+Materialized department statistics.
+
+The home and About pages show faculty, research-area, publication and project
+counts. Instead of counting on each request, the counts live in the
+``computed_*`` columns of the DepartmentStatistics row and are adjusted by
+signal handlers in ``cse_app.signals`` as rows are added, edited or removed.
+
+Research areas are the canonical ``ResearchArea`` rows of the taxonomy in
+``cse_app.research_areas`` (case-folded, aliases merged) that at least one
+active faculty member is linked to. ``research_area_counts`` records how many
+active faculty list each area; both are recomputed with one grouped query
+whenever a member's area links, a member's active status or an area changes.
+
+``manage.py department_stats`` compares the stored values with a full
+recount and rebuilds them on request.
+"""
+from django.db.models import Count, F
+from django.utils import timezone
+
+from .caching import bump_version
+from .models import DepartmentStatistics, FacultyMember, Project, Publication, ResearchArea
+from .page_cache import tag_for_model
+
+
+def split_research_areas(research_interest):
+    """'ML, Vision; Networks' -> {'ML', 'Vision', 'Networks'}"""
+    if not research_interest:
+        return set()
+    return {area.strip() for area in research_interest.replace(',', ';').split(';') if area.strip()}
+
+
+def is_counted(is_current, status):
+    """Faculty members included in the statistics: current and active."""
+    return bool(is_current) and status == 'active'
+
+
+def load():
+    """Return the statistics row, creating (and computing) it on first use."""
+    stats = DepartmentStatistics.objects.first()
+    if stats is None:
+        stats = DepartmentStatistics.objects.create()
+        stats.refresh_from_db()
+    return stats
+
+
+def area_counts():
+    """``{area name: active faculty}`` for every canonical area an active member lists."""
+    areas = (
+        ResearchArea.objects
+        .filter(faculty__is_current=True, faculty__status='active')
+        .annotate(members=Count('faculty'))
+        .order_by('name')
+        .values_list('name', 'members')
+    )
+    return dict(areas)
+
+
+def compute():
+    """Count everything from scratch. Returns the values for the computed fields."""
+    areas = area_counts()
+    return {
+        'computed_faculty': FacultyMember.objects.filter(is_current=True, status='active').count(),
+        'computed_research_areas': len(areas),
+        'computed_publications': Publication.objects.count(),
+        'computed_projects': Project.objects.count(),
+        'research_area_counts': areas,
+    }
+
+
+def rebuild():
+    """Recompute and store every count. Returns the new values."""
+    values = compute()
+    DepartmentStatistics.objects.update(computed_at=timezone.now(), **values)
+    return values
+
+
+def verify():
+    """Return ``{field: (stored, actual)}`` for every count that has drifted."""
+    stats = DepartmentStatistics.objects.first()
+    if stats is None:
+        return {}
+    actual = compute()
+    return {
+        field: (getattr(stats, field), value)
+        for field, value in actual.items()
+        if getattr(stats, field) != value
+    }
+
+
+def adjust(field, delta):
+    """Add ``delta`` to one of the plain counters (publications, projects)."""
+    DepartmentStatistics.objects.update(**{field: F(field) + delta, 'computed_at': timezone.now()})
+
+
+def refresh_research_areas():
+    """Recount the research areas of active faculty (one grouped query)."""
+    areas = area_counts()
+    DepartmentStatistics.objects.update(
+        computed_research_areas=len(areas), research_area_counts=areas, computed_at=timezone.now(),
+    )
+    # Queryset updates send no signals; drop the pages showing the count
+    bump_version('home')
+    bump_version(tag_for_model(DepartmentStatistics))
+
+
+def stored_faculty_state(pk):
+    """Whether the faculty member ``pk``, as currently saved, is counted."""
+    row = FacultyMember.objects.filter(pk=pk).values_list('is_current', 'status').first()
+    return is_counted(*row) if row else False
+
+
+def apply_faculty_change(was_counted, now_counted):
+    """Move the faculty count (and the areas of active faculty) when a member starts or stops being counted."""
+    if was_counted == now_counted:
+        return
+    DepartmentStatistics.objects.update(
+        computed_faculty=F('computed_faculty') + (int(now_counted) - int(was_counted)),
+        computed_at=timezone.now(),
+    )
+    refresh_research_areas()
@@ -0,0 +1,53 @@
+"""
+Event listings derived from the clock.
+
+``Event.is_upcoming`` is only recomputed when an event is saved, so an event
+that ends without being edited keeps claiming to be upcoming. Listing queries
+here compare ``end_date`` with the current time instead. ``upcoming`` and
+``past`` walk the ``(start_date, id)`` index of Event in order (backwards for
+``past``) and filter on ``end_date`` as they go, so neither needs a sort. An
+event counts as upcoming until it ends, so one that is under way still shows
+next to the future ones.
+
+``manage.py sweep_event_status`` brings the stored flag back in line for
+anything (admin filters, exports) that still reads it.
+"""
+from django.db.models import Case, F, When
+from django.utils import timezone
+
+from .caching import bump_version
+from .models import Event
+from .page_cache import tag_for_model
+
+
+def upcoming(queryset=None, now=None):
+    """Events that have not ended yet, soonest first."""
+    queryset = Event.objects.all() if queryset is None else queryset
+    return queryset.filter(end_date__gte=now or timezone.now()).order_by('start_date')
+
+
+def past(queryset=None, now=None):
+    """Events that have ended, most recent first."""
+    queryset = Event.objects.all() if queryset is None else queryset
+    return queryset.filter(end_date__lt=now or timezone.now()).order_by('-start_date')
+
+
+def upcoming_then_recent(queryset=None, limit=3, now=None):
+    """Up to ``limit`` upcoming events, soonest first, topped up with the latest past ones, in one query."""
+    queryset = Event.objects.all() if queryset is None else queryset
+    now = now or timezone.now()
+    # Past events get NULL here and sort after every upcoming one, then by recency
+    upcoming_start = Case(When(end_date__gte=now, then=F('start_date')))
+    return queryset.order_by(upcoming_start.asc(nulls_last=True), F('start_date').desc())[:limit]
+
+
+def sweep(now=None):
+    """Rewrite stale ``is_upcoming`` flags. Returns ``(marked ended, marked upcoming)``."""
+    now = now or timezone.now()
+    ended = Event.objects.filter(is_upcoming=True, end_date__lt=now).update(is_upcoming=False)
+    reopened = Event.objects.filter(is_upcoming=False, end_date__gte=now).update(is_upcoming=True)
+    if ended or reopened:
+        # Queryset updates send no signals; drop the cached pages that list events
+        bump_version(tag_for_model(Event))
+        bump_version('home')
+    return ended, reopened
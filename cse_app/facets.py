@@ -0,0 +1,103 @@
+"""
+Faceted filters for the faculty and staff directories.
+
+``faceted`` applies the ``?status=``/``?type=``... filters of a request and
+counts how many rows fall under every value of every facet. The counts come
+from one ``GROUP BY`` over all facet columns of the unfiltered listing; the
+count shown for a value respects the selections on the *other* facets, so a
+visitor filtering by status still sees how many professors, lecturers... each
+status holds. The grouped rows do not depend on the selection, so they are
+cached once per listing (under the model's page-cache tag, which signals bump
+on every change) and serve every filter combination without another query.
+"""
+import hashlib
+from collections import Counter
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.exceptions import EmptyResultSet
+from django.db.models import Count
+from django.utils.text import capfirst
+
+from .caching import versioned_key
+from .page_cache import tag_for_model
+
+ALL = 'all'
+
+# Query parameter -> model field
+FACULTY_FACETS = {'status': 'status', 'designation': 'designation', 'member_type': 'member_type'}
+# The active faculty page is already limited to active members
+ACTIVE_FACULTY_FACETS = {'designation': 'designation', 'member_type': 'member_type'}
+STAFF_FACETS = {'type': 'staff_type', 'status': 'status'}
+
+
+def grouped_counts(queryset, fields):
+    """``[(values tuple, rows)]`` for each combination of ``fields`` in ``queryset``, cached."""
+    grouped = queryset.order_by().values(*fields).annotate(rows=Count('pk'))
+    try:
+        sql, params = grouped.query.sql_with_params()
+    except EmptyResultSet:
+        return []
+    digest = hashlib.md5(f'{sql}{params}'.encode()).hexdigest()
+    key = versioned_key(tag_for_model(queryset.model), 'facets', digest)
+    counts = cache.get(key)
+    if counts is None:
+        counts = [(tuple(row[field] for field in fields), row['rows']) for row in grouped]
+        cache.set(key, counts, getattr(settings, 'FACET_CACHE_TIMEOUT', 600))
+    return counts
+
+
+def _query(request, param, value):
+    """``request``'s query string with ``param`` set to ``value`` (and back on the first page)."""
+    query = request.GET.copy()
+    query[param] = value
+    for key in ('page', 'cursor'):
+        query.pop(key, None)
+    return query.urlencode()
+
+
+def faceted(request, queryset, facets, defaults=None):
+    """Filter ``queryset`` by ``request``'s facet parameters and count every facet value.
+
+    ``facets`` maps query parameters to fields; ``defaults`` gives the value a
+    missing parameter takes (``'all'``, the default, means no filter). Returns
+    ``(filtered queryset, facet list, filters)``. Each facet in the list is a
+    dict with its ``param``, ``title``, ``total``, ``all_query`` and
+    ``all_selected`` and its ``options``: ``{'value', 'label', 'count',
+    'selected', 'query'}`` dicts in choice order, where ``query`` is the query
+    string that selects the option. ``filters`` is the ``{field: value}`` applied.
+    """
+    defaults = defaults or {}
+    fields = list(facets.values())
+    selected = {}
+    for param, field in facets.items():
+        value = request.GET.get(param, defaults.get(param, ALL)).strip() or ALL
+        if value != ALL:
+            selected[field] = value
+
+    totals = {field: Counter() for field in fields}
+    for values, rows in grouped_counts(queryset, fields):
+        row = dict(zip(fields, values))
+        for field in fields:
+            # Count the row under its own value when it passes every other selection
+            if all(row[other] == value for other, value in selected.items() if other != field):
+                totals[field][row[field]] += rows
+
+    facet_list = []
+    for param, field in facets.items():
+        model_field = queryset.model._meta.get_field(field)
+        choices = dict(model_field.flatchoices)
+        values = list(choices) + sorted(value for value in totals[field] if value not in choices)
+        facet_list.append({
+            'param': param,
+            'title': capfirst(model_field.verbose_name),
+            'total': sum(totals[field].values()),
+            'all_query': _query(request, param, ALL),
+            'all_selected': field not in selected,
+            'options': [
+                {'value': value, 'label': choices.get(value, value), 'count': totals[field][value],
+                 'selected': selected.get(field) == value, 'query': _query(request, param, value)}
+                for value in values if totals[field][value] or selected.get(field) == value
+            ],
+        })
+    return queryset.filter(**selected), facet_list, selected
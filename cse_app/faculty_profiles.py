@@ -0,0 +1,74 @@
+"""
+Faculty profiles assembled in a fixed number of queries and cached.
+
+``load`` fetches a FacultyMember together with its education and experience
+records, projects, authored publications and fellow faculty co-authors: one
+query per collection (six in all) however many rows each has, so templates can walk
+``faculty.educations.all`` in both the table and the card layout, and call
+``.count`` or ``.exists`` on it, without touching the database again.
+
+The assembled profile is cached under two version stamps: one per member,
+bumped when the member or their education/experience rows change, and one
+shared by all profiles, bumped when a project or publication changes (those
+rows appear on several profiles). The signal handlers live in
+``cse_app.signals``. The linked login account is left out of the cached
+profile so its password hash never reaches the cache.
+"""
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Prefetch
+
+from .authorship import co_authors, publications_for
+from .caching import bump_version, get_versions
+from .models import FacultyMember, Project
+
+SHARED_NAMESPACE = 'faculty_profiles'
+
+
+def member_namespace(pk):
+    return f'faculty_profile:{pk}'
+
+
+def _query(pk):
+    member = (
+        FacultyMember.objects
+        .prefetch_related(
+            'educations',
+            'professional_experiences',
+            Prefetch('projects', queryset=Project.objects.order_by('-start_date')),
+        )
+        .get(pk=pk)
+    )
+    member.authored_publications = list(publications_for(member))
+    member.co_authors = list(co_authors(member).only('name'))
+    return member
+
+
+def load(pk, cached=True):
+    """The FacultyMember ``pk`` with every profile collection loaded; raises ``DoesNotExist``."""
+    if not cached:
+        return _query(pk)
+    versions = get_versions([SHARED_NAMESPACE, member_namespace(pk)])
+    key = f'cse:faculty_profile:{versions[SHARED_NAMESPACE]}:{versions[member_namespace(pk)]}:{pk}'
+    member = cache.get(key)
+    if member is None:
+        member = _query(pk)
+        cache.set(key, member, getattr(settings, 'FACULTY_PROFILE_CACHE_TIMEOUT', 3600))
+    return member
+
+
+def load_for_user(user, cached=True):
+    """The profile of the FacultyMember linked to ``user``; raises ``FacultyMember.DoesNotExist``."""
+    pk = FacultyMember.objects.filter(user=user).values_list('pk', flat=True).first()
+    if pk is None:
+        raise FacultyMember.DoesNotExist
+    return load(pk, cached)
+
+
+def invalidate(pk):
+    if pk is not None:
+        bump_version(member_namespace(pk))
+
+
+def invalidate_all():
+    bump_version(SHARED_NAMESPACE)
@@ -0,0 +1,128 @@
+"""
+Streaming delivery of uploaded files (notice attachments, etc.).
+
+``serve_file`` never loads a file into memory: full responses go through
+``FileResponse`` (which uses the server's ``wsgi.file_wrapper``/sendfile when
+available) and byte-range requests are streamed in fixed-size chunks. ETag and
+Last-Modified headers let browsers revalidate with a 304 instead of
+re-downloading. With ``FILE_DELIVERY_BACKEND`` set, the transfer is handed to
+the front server instead:
+
+    FILE_DELIVERY_BACKEND = 'nginx'   # X-Accel-Redirect to FILE_DELIVERY_ACCEL_PREFIX + file name
+    FILE_DELIVERY_BACKEND = 'apache'  # X-Sendfile with the absolute path (also lighttpd)
+"""
+import mimetypes
+import os
+import re
+from urllib.parse import quote
+
+from django.conf import settings
+from django.http import FileResponse, Http404, HttpResponse, StreamingHttpResponse
+from django.utils.cache import get_conditional_response
+from django.utils.http import content_disposition_header, http_date, parse_http_date_safe
+
+CHUNK_SIZE = 64 * 1024
+
+_RANGE_RE = re.compile(r'^bytes=(\d*)-(\d*)$')
+
+
+def _parse_range(header, size):
+    """Return ``(start, end)`` (inclusive) for a single byte range, ``None`` to
+    ignore the header, or ``'unsatisfiable'``."""
+    match = _RANGE_RE.match(header.strip())
+    if not match:
+        # Malformed or multi-range requests get the whole file, which RFC 9110 allows
+        return None
+    first, last = match.groups()
+    if not first and not last:
+        return None
+    if not first:
+        # Suffix range: the last N bytes
+        length = int(last)
+        if length == 0:
+            return 'unsatisfiable'
+        return max(size - length, 0), size - 1
+    start = int(first)
+    end = int(last) if last else size - 1
+    if start >= size or end < start:
+        return 'unsatisfiable'
+    return start, min(end, size - 1)
+
+
+def _if_range_matches(request, etag, last_modified):
+    if_range = request.META.get('HTTP_IF_RANGE')
+    if not if_range:
+        return True
+    if if_range.startswith(('"', 'W/')):
+        return if_range == etag
+    return parse_http_date_safe(if_range) == last_modified
+
+
+def _iter_range(path, start, length):
+    with open(path, 'rb') as fh:
+        fh.seek(start)
+        remaining = length
+        while remaining > 0:
+            chunk = fh.read(min(CHUNK_SIZE, remaining))
+            if not chunk:
+                break
+            remaining -= len(chunk)
+            yield chunk
+
+
+def serve_file(request, field_file, as_attachment=False, content_type=None):
+    """Return a streaming response for ``field_file`` honouring Range and conditional headers."""
+    if not field_file:
+        raise Http404("File does not exist")
+    path = field_file.path
+    try:
+        stat = os.stat(path)
+    except OSError:
+        raise Http404("File does not exist")
+
+    size = stat.st_size
+    last_modified = int(stat.st_mtime)
+    etag = f'"{stat.st_mtime_ns:x}-{size:x}"'
+    filename = os.path.basename(path)
+    content_type = content_type or mimetypes.guess_type(filename)[0] or 'application/octet-stream'
+
+    not_modified = get_conditional_response(request, etag=etag, last_modified=last_modified)
+    if not_modified is not None:
+        return not_modified
+
+    backend = getattr(settings, 'FILE_DELIVERY_BACKEND', None)
+    if backend:
+        response = HttpResponse(content_type=content_type)
+        if backend == 'nginx':
+            prefix = getattr(settings, 'FILE_DELIVERY_ACCEL_PREFIX', '/protected-media/')
+            # Percent-encoded: header values are ASCII and nginx decodes the URI
+            response['X-Accel-Redirect'] = quote(prefix + field_file.name)
+        else:
+            response['X-Sendfile'] = quote(path)
+    else:
+        byte_range = None
+        range_header = request.META.get('HTTP_RANGE')
+        if range_header and request.method == 'GET' and _if_range_matches(request, etag, last_modified):
+            byte_range = _parse_range(range_header, size)
+
+        if byte_range == 'unsatisfiable':
+            response = HttpResponse(status=416)
+            response['Content-Range'] = f'bytes */{size}'
+            return response
+
+        if byte_range:
+            start, end = byte_range
+            length = end - start + 1
+            response = StreamingHttpResponse(_iter_range(path, start, length), status=206, content_type=content_type)
+            response['Content-Range'] = f'bytes {start}-{end}/{size}'
+            response['Content-Length'] = str(length)
+        else:
+            response = FileResponse(open(path, 'rb'), content_type=content_type)
+            response.block_size = CHUNK_SIZE
+            response['Content-Length'] = str(size)
+
+    response['Accept-Ranges'] = 'bytes'
+    response['ETag'] = etag
+    response['Last-Modified'] = http_date(last_modified)
+    response['Content-Disposition'] = content_disposition_header(as_attachment, filename)
+    return response
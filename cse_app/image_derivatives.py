@@ -0,0 +1,150 @@
+"""
+Width-bucketed image derivatives for uploaded photos.
+
+For every uploaded image we store downscaled WebP and JPEG copies under
+``MEDIA_ROOT/derivatives/`` (one of each per width in ``IMAGE_DERIVATIVE_WIDTHS``
+that is narrower than the original). Templates wrap the ``<img>`` in a
+``<picture>``: a ``<source type="image/webp">`` lists the WebP widths and the
+``<img>`` itself the JPEG ones, both through the ``srcset`` filter in
+``custom_filters`` and with the original as the widest candidate. Browsers
+download the smallest variant that fills the slot instead of the
+multi-megabyte original, and those without WebP still get responsive JPEGs.
+"""
+import os
+from io import BytesIO
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.files.base import ContentFile
+from PIL import Image, ImageOps
+
+DEFAULT_WIDTHS = (320, 640, 960, 1280)
+FORMATS = {
+    'webp': ('WEBP', 'webp'),
+    'jpeg': ('JPEG', 'jpg'),
+}
+
+# EXIF orientations that rotate the picture by 90 degrees
+_ROTATED = {5, 6, 7, 8}
+
+
+def derivative_widths():
+    return tuple(getattr(settings, 'IMAGE_DERIVATIVE_WIDTHS', DEFAULT_WIDTHS))
+
+
+def derivative_name(name, width, fmt):
+    """``gallery/IMG_2969.JPG`` -> ``derivatives/gallery/IMG_2969-640w.webp``"""
+    stem, _ = os.path.splitext(name)
+    return f"derivatives/{stem}-{width}w.{FORMATS[fmt][1]}"
+
+
+def _cache_key(name):
+    return f'cse:derivatives:v3:{name}'
+
+
+def _display_width(image):
+    """Width of ``image`` once its EXIF orientation is applied, read from the header only."""
+    width, height = image.size
+    return height if image.getexif().get(0x0112) in _ROTATED else width
+
+
+def _flatten(image):
+    """``image`` in RGB for JPEG, with any transparency laid over white."""
+    image = image.convert('RGBA')
+    background = Image.new('RGB', image.size, 'white')
+    background.paste(image, mask=image.getchannel('A'))
+    return background
+
+
+def generate_derivatives(field_file, force=False):
+    """Create any missing derivatives for ``field_file``. Returns the widths available."""
+    if not field_file:
+        return []
+    storage = field_file.storage
+    try:
+        with storage.open(field_file.name, 'rb') as fh:
+            original = Image.open(fh)
+            original_width = _display_width(original)
+            widths = [width for width in derivative_widths() if width < original_width]
+            missing = [
+                (width, fmt) for width in widths for fmt in FORMATS
+                if force or not storage.exists(derivative_name(field_file.name, width, fmt))
+            ]
+            if missing:
+                original.load()
+    except (OSError, ValueError):
+        # Missing or unreadable upload; templates fall back to the original URL
+        return []
+
+    if missing:
+        # Only decode (and rotate) the upload when a derivative has to be written
+        original = ImageOps.exif_transpose(original)
+        quality = getattr(settings, 'IMAGE_DERIVATIVE_QUALITY', 80)
+        resized = {}
+        for width, fmt in missing:
+            if width not in resized:
+                height = round(original.height * width / original.width)
+                resized[width] = original.resize((width, height), Image.LANCZOS)
+            image = resized[width]
+            if fmt == 'jpeg' and image.mode != 'RGB':
+                image = _flatten(image)
+            buffer = BytesIO()
+            image.save(buffer, FORMATS[fmt][0], quality=quality, optimize=True)
+            name = derivative_name(field_file.name, width, fmt)
+            if storage.exists(name):
+                storage.delete(name)
+            storage.save(name, ContentFile(buffer.getvalue()))
+
+    cache.set(_cache_key(field_file.name), (widths, original_width), None)
+    return widths
+
+
+def delete_derivatives(field_file, name=None):
+    """Remove every derivative of ``field_file`` (or of its earlier file ``name``) from storage."""
+    name = name or (field_file.name if field_file else None)
+    if not name:
+        return
+    storage = field_file.storage
+    for width in derivative_widths():
+        for derivative in (derivative_name(name, width, fmt) for fmt in FORMATS):
+            if storage.exists(derivative):
+                storage.delete(derivative)
+    cache.delete(_cache_key(name))
+
+
+def available_widths(field_file):
+    """``(widths stored in every format, original width)``, looked up once and then cached."""
+    if not field_file:
+        return [], None
+    key = _cache_key(field_file.name)
+    found = cache.get(key)
+    if found is None:
+        storage = field_file.storage
+        widths = [
+            width for width in derivative_widths()
+            if all(storage.exists(derivative_name(field_file.name, width, fmt)) for fmt in FORMATS)
+        ]
+        try:
+            with storage.open(field_file.name, 'rb') as fh:
+                original_width = _display_width(Image.open(fh))
+        except (OSError, ValueError):
+            original_width = None
+        found = (widths, original_width)
+        cache.set(key, found, None)
+    return found
+
+
+def srcset(field_file, fmt='webp'):
+    """Build a ``srcset`` attribute value such as ``a-320w.webp 320w, a-640w.webp 640w, a.jpg 1600w``.
+
+    ``fmt`` is a key of ``FORMATS``: ``'webp'`` for the ``<source>``, ``'jpeg'`` for the ``<img>``.
+    """
+    widths, original_width = available_widths(field_file)
+    if not widths:
+        return ''
+    storage = field_file.storage
+    candidates = [f"{storage.url(derivative_name(field_file.name, width, fmt))} {width}w" for width in widths]
+    if original_width:
+        # The upload itself serves slots wider than the largest derivative
+        candidates.append(f"{field_file.url} {original_width}w")
+    return ', '.join(candidates)
@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from cse_app.research_areas import backfill
+
+
+class Command(BaseCommand):
+    help = 'Parse FacultyMember.research_interest into linked ResearchArea rows'
+
+    def handle(self, *args, **options):
+        members, areas, links = backfill()
+        self.stdout.write(f"  ✓ Faculty members parsed: {members}")
+        self.stdout.write(f"  ✓ Research areas: {areas}")
+        self.stdout.write(f"  ✓ Member-area links: {links}")
+        self.stdout.write(self.style.SUCCESS('Research-area index is up to date.'))
@@ -0,0 +1,157 @@
+import random
+import statistics
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from django.core.management.base import BaseCommand
+from django.db import DEFAULT_DB_ALIAS, OperationalError, connections, transaction
+from django.db.backends.signals import connection_created
+
+from neu_cse.sqlite_profiles import PROFILES, sqlite_database, write_transaction
+
+
+class Command(BaseCommand):
+    help = 'Compare the SQLite connection profiles (neu_cse.sqlite_profiles) under a concurrent read/write workload'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--threads', type=int, default=8, help='Concurrent simulated workers')
+        parser.add_argument('--seconds', type=float, default=5, help='How long to run each profile')
+        parser.add_argument('--write-ratio', type=float, default=0.2, help='Share of requests that write')
+        parser.add_argument('--rows', type=int, default=2000, help='Rows in the benchmark table')
+
+    def handle(self, *args, **options):
+        threads = options['threads']
+        seconds = options['seconds']
+
+        self.stdout.write(self.style.SUCCESS(
+            f"\n=== SQLITE PROFILE BENCHMARK ({threads} workers x {seconds:g}s, "
+            f"{options['write_ratio']:.0%} writes) ===\n"
+        ))
+
+        with tempfile.TemporaryDirectory() as directory:
+            for profile in PROFILES:
+                result = self._run(profile, Path(directory) / f'{profile}.sqlite3', options)
+                self.stdout.write(f"--- {profile} ---")
+                self.stdout.write(f"  Requests: {result['requests']} ({result['requests'] / seconds:.0f}/s)")
+                self.stdout.write(f"  Read latency p50/p95: {result['read_p50']:.3f} / {result['read_p95']:.3f} ms")
+                self.stdout.write(f"  Write latency p50/p95: {result['write_p50']:.3f} / {result['write_p95']:.3f} ms")
+                self.stdout.write(f"  'database is locked' errors: {result['lock_errors']}")
+                self.stdout.write(f"  Writes lost: {result['writes_lost']}")
+                self.stdout.write(f"  Connections opened: {result['connections']}\n")
+
+        self.stdout.write(self.style.SUCCESS('=== END OF BENCHMARK ===\n'))
+
+    def _configure(self, alias, profile, path):
+        # configure_settings fills in the defaults Django expects on every alias
+        configured = connections.configure_settings({
+            DEFAULT_DB_ALIAS: connections.settings[DEFAULT_DB_ALIAS],
+            alias: sqlite_database(str(path), profile),
+        })
+        connections.settings[alias] = configured[alias]
+
+    def _setup(self, alias, rows):
+        with connections[alias].cursor() as cursor:
+            cursor.execute('CREATE TABLE bench_item (id INTEGER PRIMARY KEY, counter INTEGER NOT NULL, body TEXT)')
+            cursor.executemany(
+                'INSERT INTO bench_item (id, counter, body) VALUES (%s, 0, %s)',
+                [(pk, 'x' * 500) for pk in range(1, rows + 1)],
+            )
+        connections[alias].close()
+
+    def _run(self, profile, path, options):
+        alias = f'__bench_{profile}__'
+        rows = options['rows']
+        self._configure(alias, profile, path)
+        self._setup(alias, rows)
+
+        results = {'read': [], 'write': [], 'lock_errors': 0, 'writes': 0, 'connections': 0}
+        failures = []
+        lock = threading.Lock()
+        deadline = time.perf_counter() + options['seconds']
+
+        def opened(sender, connection, **kwargs):
+            if connection.alias == alias:
+                with lock:
+                    results['connections'] += 1
+
+        def read():
+            start = random.randint(1, max(rows - 20, 1))
+            with connections[alias].cursor() as cursor:
+                cursor.execute('SELECT id, counter, body FROM bench_item WHERE id BETWEEN %s AND %s', [start, start + 20])
+                cursor.fetchall()
+
+        def write():
+            pk = random.randint(1, rows)
+            # Read-modify-write inside one transaction, like a model form save;
+            # the production setup takes the write lock up front for these
+            begin = write_transaction if profile == 'production' else transaction.atomic
+            with begin(using=alias):
+                with connections[alias].cursor() as cursor:
+                    cursor.execute('SELECT counter FROM bench_item WHERE id = %s', [pk])
+                    counter = cursor.fetchone()[0]
+                    cursor.execute('UPDATE bench_item SET counter = %s WHERE id = %s', [counter + 1, pk])
+
+        def worker():
+            local = {'read': [], 'write': []}
+            lock_errors = writes = 0
+            try:
+                while time.perf_counter() < deadline:
+                    kind = 'write' if random.random() < options['write_ratio'] else 'read'
+                    start = time.perf_counter()
+                    try:
+                        write() if kind == 'write' else read()
+                    except OperationalError as exc:
+                        if 'locked' not in str(exc):
+                            raise
+                        lock_errors += 1
+                    else:
+                        writes += kind == 'write'
+                    local[kind].append(time.perf_counter() - start)
+                    # What Django does when a request finishes
+                    connections[alias].close_if_unusable_or_obsolete()
+            except Exception as exc:
+                failures.append(exc)
+            finally:
+                connections[alias].close()
+            with lock:
+                results['read'].extend(local['read'])
+                results['write'].extend(local['write'])
+                results['lock_errors'] += lock_errors
+                results['writes'] += writes
+
+        connection_created.connect(opened)
+        try:
+            pool = [threading.Thread(target=worker) for _ in range(options['threads'])]
+            for thread in pool:
+                thread.start()
+            for thread in pool:
+                thread.join()
+        finally:
+            connection_created.disconnect(opened)
+
+        with connections[alias].cursor() as cursor:
+            cursor.execute('SELECT SUM(counter) FROM bench_item')
+            stored = cursor.fetchone()[0]
+        connections[alias].close()
+        del connections[alias]
+        del connections.settings[alias]
+        if failures:
+            raise failures[0]
+
+        return {
+            'requests': len(results['read']) + len(results['write']),
+            'read_p50': self._percentile(results['read'], 50),
+            'read_p95': self._percentile(results['read'], 95),
+            'write_p50': self._percentile(results['write'], 50),
+            'write_p95': self._percentile(results['write'], 95),
+            'lock_errors': results['lock_errors'],
+            'writes_lost': results['writes'] - stored,
+            'connections': results['connections'],
+        }
+
+    def _percentile(self, samples, percent):
+        if len(samples) < 2:
+            return samples[0] * 1000 if samples else 0.0
+        return statistics.quantiles(samples, n=100)[percent - 1] * 1000
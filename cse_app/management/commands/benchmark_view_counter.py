@@ -0,0 +1,83 @@
+import threading
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import DatabaseError, connection
+
+from cse_app import view_counter
+from cse_app.models import ViewCount
+
+
+class Command(BaseCommand):
+    help = 'Compare per-request ViewCount saves with the buffered view counter under concurrent load'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--threads', type=int, default=8, help='Concurrent simulated workers')
+        parser.add_argument('--hits', type=int, default=200, help='Page hits per worker')
+
+    def handle(self, *args, **options):
+        threads = options['threads']
+        hits = options['hits']
+        expected = threads * hits
+
+        self.stdout.write(self.style.SUCCESS(f'\n=== VIEW COUNTER BENCHMARK ({threads} workers x {hits} hits) ===\n'))
+
+        legacy = self._run('__bench_legacy__', threads, hits, self._legacy_hit)
+        buffered = self._run('__bench_buffered__', threads, hits, self._buffered_hit)
+
+        for label, (page_name, result) in (('Per-request save', legacy), ('Buffered UPSERT', buffered)):
+            stored = ViewCount.objects.filter(page_name=page_name).values_list('count', flat=True).first() or 0
+            self.stdout.write(f"--- {label} ---")
+            self.stdout.write(f"  Mean latency per hit: {result['mean_ms']:.3f} ms")
+            self.stdout.write(f"  Worst latency per hit: {result['max_ms']:.3f} ms")
+            self.stdout.write(f"  'database is locked' errors: {result['lock_errors']}")
+            self.stdout.write(f"  Stored count: {stored} / {expected} (lost {expected - stored})\n")
+
+        ViewCount.objects.filter(page_name__startswith='__bench_').delete()
+        self.stdout.write(self.style.SUCCESS('=== END OF BENCHMARK ===\n'))
+
+    def _legacy_hit(self, page_name):
+        page_view, created = ViewCount.objects.get_or_create(page_name=page_name)
+        # The original read-modify-write increment
+        page_view.count += 1
+        page_view.save()
+
+    def _buffered_hit(self, page_name):
+        view_counter.record_view(page_name)
+
+    def _run(self, page_name, threads, hits, hit):
+        ViewCount.objects.filter(page_name=page_name).delete()
+        latencies = []
+        errors = []
+        lock = threading.Lock()
+
+        def worker():
+            local = []
+            local_errors = 0
+            for _ in range(hits):
+                start = time.perf_counter()
+                try:
+                    hit(page_name)
+                except DatabaseError as exc:
+                    if 'locked' in str(exc):
+                        local_errors += 1
+                    else:
+                        raise
+                local.append(time.perf_counter() - start)
+            with lock:
+                latencies.extend(local)
+                errors.append(local_errors)
+            connection.close()
+
+        pool = [threading.Thread(target=worker) for _ in range(threads)]
+        for thread in pool:
+            thread.start()
+        for thread in pool:
+            thread.join()
+        view_counter.flush()
+
+        return page_name, {
+            'mean_ms': sum(latencies) / len(latencies) * 1000,
+            'max_ms': max(latencies) * 1000,
+            'lock_errors': sum(errors),
+        }
@@ -0,0 +1,159 @@
+import gzip
+import hashlib
+import os
+import platform
+import re
+import shutil
+import stat
+import subprocess
+import tempfile
+import time
+import urllib.request
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+TAILWIND_VERSION = 'v3.4.17'
+CDN_URL = 'https://cdn.tailwindcss.com'
+RELEASE_URL = 'https://github.com/tailwindlabs/tailwindcss/releases/download/{version}/tailwindcss-{target}'
+
+CLASS_ATTR_RE = re.compile(r'class\s*=\s*["\']([^"\']*)["\']')
+# Classes templates add from JavaScript: classList.add('opacity-0', 'translate-y-4')
+SCRIPT_CLASS_CALL_RE = re.compile(r'classList\.(?:add|remove|toggle|replace)\(([^)]*)\)')
+QUOTED_RE = re.compile(r'["\']([^"\']+)["\']')
+STYLE_BLOCK_RE = re.compile(r'<style[^>]*>(.*?)</style>', re.DOTALL)
+
+
+class Command(BaseCommand):
+    help = 'Compile a minified Tailwind stylesheet from the classes used in templates/ into static/css/tailwind.css'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--cli', help='Path to the tailwindcss executable (default: TAILWIND_CLI, PATH, or a downloaded standalone build)')
+        parser.add_argument('--compare-cdn', action='store_true', help='Download the CDN compiler to report the page-weight difference')
+
+    def handle(self, *args, **options):
+        base_dir = Path(settings.BASE_DIR)
+        config = base_dir / 'tailwind' / 'tailwind.config.js'
+        source = base_dir / 'tailwind' / 'input.css'
+        output = base_dir / 'static' / 'css' / 'tailwind.css'
+        output.parent.mkdir(parents=True, exist_ok=True)
+
+        self.stdout.write(self.style.SUCCESS('\n=== TAILWIND BUILD ===\n'))
+
+        classes = self._scan_classes(base_dir / 'templates')
+        self.stdout.write(f"  Templates scanned: {classes['files']} files, {len(classes['tokens'])} distinct class tokens")
+
+        cli = self._find_cli(options.get('cli'), base_dir)
+        start = time.perf_counter()
+        result = subprocess.run(
+            [cli, '-c', str(config), '-i', str(source), '-o', str(output), '--minify'],
+            cwd=base_dir, capture_output=True, text=True,
+        )
+        if result.returncode != 0:
+            raise CommandError(f'tailwindcss failed:\n{result.stderr}')
+        elapsed = time.perf_counter() - start
+
+        css = output.read_bytes()
+        gzipped = len(gzip.compress(css))
+        digest = hashlib.md5(css).hexdigest()[:12]
+        self.stdout.write(f"  ✓ Wrote static/css/tailwind.css in {elapsed:.2f}s (manifest name: css/tailwind.{digest}.css)")
+
+        # Classes only ever set from scripts must still be in the stylesheet (or a template <style> block)
+        script_classes = self._script_classes(base_dir / 'templates')
+        missing = self._uncovered(script_classes, css.decode('utf-8', 'ignore'), base_dir / 'templates')
+        if missing:
+            self.stdout.write(self.style.WARNING(
+                f"  ✗ Classes added from JavaScript with no CSS rule: {', '.join(sorted(missing))}"
+            ))
+        else:
+            self.stdout.write(f"  ✓ All {len(script_classes)} classes added from JavaScript have CSS rules")
+
+        self.stdout.write('\n--- PAGE WEIGHT ---')
+        self.stdout.write(f"  After:  {len(css) / 1024:.1f} KB CSS ({gzipped / 1024:.1f} KB gzipped), no runtime JavaScript")
+        if options['compare_cdn']:
+            cdn = self._download(CDN_URL)
+            self.stdout.write(
+                f"  Before: {len(cdn) / 1024:.1f} KB JS ({len(gzip.compress(cdn)) / 1024:.1f} KB gzipped) "
+                f"that scans the DOM and generates CSS in the browser on every page load"
+            )
+        else:
+            self.stdout.write('  Before: run with --compare-cdn to measure the CDN compiler script')
+
+        self.stdout.write(self.style.SUCCESS('\nRun collectstatic to publish the hashed file.\n'))
+
+    def _scan_classes(self, templates_dir):
+        tokens = set()
+        files = 0
+        for path in templates_dir.rglob('*.html'):
+            files += 1
+            for value in CLASS_ATTR_RE.findall(path.read_text(encoding='utf-8', errors='ignore')):
+                # Drop template tags inside class attributes, keep the literal classes
+                value = re.sub(r'{[{%].*?[%}]}', ' ', value)
+                tokens.update(value.split())
+        return {'files': files, 'tokens': tokens}
+
+    @staticmethod
+    def _script_classes(templates_dir):
+        classes = set()
+        for path in templates_dir.rglob('*.html'):
+            for arguments in SCRIPT_CLASS_CALL_RE.findall(path.read_text(encoding='utf-8', errors='ignore')):
+                classes.update(QUOTED_RE.findall(arguments))
+        return classes
+
+    @staticmethod
+    def _uncovered(classes, css, templates_dir):
+        """The ``classes`` with no selector in ``css`` or in a template's <style> block."""
+        styles = css + ''.join(
+            block
+            for path in templates_dir.rglob('*.html')
+            for block in STYLE_BLOCK_RE.findall(path.read_text(encoding='utf-8', errors='ignore'))
+        )
+        return {
+            name for name in classes
+            if not re.search(r'\.' + re.escape(re.sub(r'([^\w-])', r'\\\1', name)) + r'(?![\w-])', styles)
+        }
+
+    def _find_cli(self, explicit, base_dir):
+        candidate = explicit or getattr(settings, 'TAILWIND_CLI', None) or shutil.which('tailwindcss')
+        if candidate:
+            return candidate
+
+        target = self._release_target()
+        binary = base_dir / '.tailwind' / f'tailwindcss-{TAILWIND_VERSION}-{target}'
+        if not binary.exists():
+            expected = (getattr(settings, 'TAILWIND_CLI_SHA256', None) or {}).get(target)
+            if not expected:
+                raise CommandError(
+                    f'No SHA-256 pinned for the {TAILWIND_VERSION} {target} CLI; add it to TAILWIND_CLI_SHA256 '
+                    f'(from the release\'s sha256sums.txt) or pass --cli'
+                )
+            url = RELEASE_URL.format(version=TAILWIND_VERSION, target=target)
+            self.stdout.write(f"  Downloading Tailwind standalone CLI {TAILWIND_VERSION} ({target})...")
+            data = self._download(url)
+            actual = hashlib.sha256(data).hexdigest()
+            if actual != expected.lower():
+                raise CommandError(f'Checksum mismatch for {url}: expected {expected}, got {actual}')
+            binary.parent.mkdir(exist_ok=True)
+            # Written under a temporary name so an interrupted download is never run
+            fd, partial = tempfile.mkstemp(dir=binary.parent)
+            with os.fdopen(fd, 'wb') as fh:
+                fh.write(data)
+            os.chmod(partial, os.stat(partial).st_mode | stat.S_IEXEC)
+            os.replace(partial, binary)
+        return str(binary)
+
+    def _release_target(self):
+        system = {'Linux': 'linux', 'Darwin': 'macos', 'Windows': 'windows'}.get(platform.system())
+        machine = platform.machine().lower()
+        arch = 'arm64' if machine in ('arm64', 'aarch64') else 'x64'
+        if system is None:
+            raise CommandError('Unsupported platform; install tailwindcss and pass --cli')
+        return f'{system}-{arch}.exe' if system == 'windows' else f'{system}-{arch}'
+
+    def _download(self, url):
+        try:
+            with urllib.request.urlopen(url, timeout=60) as response:
+                return response.read()
+        except OSError as exc:
+            raise CommandError(f'Could not download {url}: {exc}')
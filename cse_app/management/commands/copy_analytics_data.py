@@ -0,0 +1,27 @@
+from django.apps import apps
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DEFAULT_DB_ALIAS, connections
+
+from cse_app.routers import ANALYTICS_DB, ANALYTICS_MODELS, analytics_enabled
+
+
+class Command(BaseCommand):
+    help = 'Copy analytics rows (page-view counters) left in the default database into the analytics database'
+
+    def handle(self, *args, **options):
+        if not analytics_enabled():
+            raise CommandError(f"No '{ANALYTICS_DB}' database is configured")
+
+        default_tables = connections[DEFAULT_DB_ALIAS].introspection.table_names()
+        for label in sorted(ANALYTICS_MODELS):
+            model = apps.get_model(label)
+            if model._meta.db_table not in default_tables:
+                self.stdout.write(f"  ✓ {label}: nothing in the default database")
+                continue
+            rows = list(model.objects.using(DEFAULT_DB_ALIAS).all())
+            before = model.objects.using(ANALYTICS_DB).count()
+            # Rows already present in the analytics database win
+            model.objects.using(ANALYTICS_DB).bulk_create(rows, ignore_conflicts=True)
+            copied = model.objects.using(ANALYTICS_DB).count() - before
+            self.stdout.write(f"  ✓ {label}: {copied} of {len(rows)} rows copied")
+        self.stdout.write(self.style.SUCCESS('Analytics data is in the analytics database.'))
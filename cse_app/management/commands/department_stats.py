@@ -0,0 +1,36 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from cse_app import department_stats
+
+
+class Command(BaseCommand):
+    help = 'Verify the materialized department statistics against a full recount (and optionally rebuild them)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rebuild', action='store_true', help='Recompute and store every count')
+        parser.add_argument('--check', action='store_true', help='Exit with an error when the stored counts have drifted')
+
+    def handle(self, *args, **options):
+        department_stats.load()
+
+        if options['rebuild']:
+            values = department_stats.rebuild()
+            for field, value in values.items():
+                if field != 'research_area_counts':
+                    self.stdout.write(f"  ✓ {field}: {value}")
+            self.stdout.write(self.style.SUCCESS('Department statistics rebuilt.'))
+            return
+
+        drift = department_stats.verify()
+        if not drift:
+            self.stdout.write(self.style.SUCCESS('Department statistics match a full recount.'))
+            return
+        for field, (stored, actual) in drift.items():
+            if field == 'research_area_counts':
+                self.stdout.write(f"  ✗ {field}: per-area counts differ")
+            else:
+                self.stdout.write(f"  ✗ {field}: stored {stored}, actual {actual}")
+        message = 'Department statistics have drifted; run with --rebuild to fix them.'
+        if options['check']:
+            raise CommandError(message)
+        self.stdout.write(self.style.WARNING(message))
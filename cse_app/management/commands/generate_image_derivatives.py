@@ -0,0 +1,43 @@
+from django.core.management.base import BaseCommand
+
+from cse_app.image_derivatives import generate_derivatives, derivative_name, derivative_widths
+from cse_app.signals import IMAGE_MODELS
+
+
+class Command(BaseCommand):
+    help = 'Generate width-bucketed WebP and JPEG derivatives for every uploaded image'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--force', action='store_true', help='Regenerate derivatives that already exist')
+
+    def handle(self, *args, **options):
+        force = options['force']
+        self.stdout.write(self.style.SUCCESS(f'\n=== IMAGE DERIVATIVES (widths: {", ".join(map(str, derivative_widths()))}) ===\n'))
+
+        original_bytes = 0
+        smallest_bytes = 0
+        for model in IMAGE_MODELS:
+            processed = 0
+            for obj in model.objects.exclude(image='').exclude(image__isnull=True).iterator():
+                widths = generate_derivatives(obj.image, force=force)
+                processed += 1
+                storage = obj.image.storage
+                try:
+                    size = storage.size(obj.image.name)
+                except OSError:
+                    self.stdout.write(self.style.WARNING(f"  ✗ Missing file: {obj.image.name}"))
+                    continue
+                original_bytes += size
+                if widths:
+                    smallest_bytes += storage.size(derivative_name(obj.image.name, widths[0], 'webp'))
+                else:
+                    smallest_bytes += size
+            self.stdout.write(f"  ✓ {model._meta.verbose_name_plural}: {processed} images")
+
+        if original_bytes:
+            self.stdout.write(
+                f"\nOriginals: {original_bytes / 1024 / 1024:.1f} MB, "
+                f"smallest WebP variants: {smallest_bytes / 1024 / 1024:.1f} MB "
+                f"({original_bytes / max(smallest_bytes, 1):.0f}x smaller)"
+            )
+        self.stdout.write(self.style.SUCCESS('\n=== DONE ===\n'))
@@ -0,0 +1,58 @@
+from django.core.cache import cache
+from django.core.management.base import BaseCommand
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.test import Client, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+# Public listing pages whose cards use cse_app.projections
+LISTING_ROUTES = (
+    'home', 'notice_list', 'all_tech_news', 'all_events', 'all_projects',
+    'active_faculty', 'faculty_on_leave', 'past_faculty',
+)
+
+
+def _size(value):
+    if value is None:
+        return 0
+    if isinstance(value, (bytes, memoryview)):
+        return len(value)
+    return len(str(value).encode())
+
+
+class Command(BaseCommand):
+    help = 'Report the bytes each listing page reads from the database with full rows and with list projections'
+
+    def handle(self, *args, **options):
+        self.stdout.write(self.style.SUCCESS('\n=== LIST PROJECTION REPORT (bytes fetched per request) ===\n'))
+        total_before = total_after = 0
+        for name in LISTING_ROUTES:
+            before, queries = self._measure(name, projections=False)
+            after, _ = self._measure(name, projections=True)
+            total_before += before
+            total_after += after
+            saved = 1 - after / before if before else 0
+            self.stdout.write(f"  ✓ {name}: {before:,} -> {after:,} bytes ({saved:.0%} less, {queries} queries)")
+        saved = 1 - total_after / total_before if total_before else 0
+        self.stdout.write(f"\n  Total: {total_before:,} -> {total_after:,} bytes ({saved:.0%} less)")
+        self.stdout.write(self.style.SUCCESS('=== END OF REPORT ===\n'))
+
+    def _measure(self, name, projections):
+        connection = connections[DEFAULT_DB_ALIAS]
+        with override_settings(
+            LIST_PROJECTIONS=projections,
+            CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}},
+        ):
+            # Start cold so the page and home-context caches do not hide the queries
+            cache.clear()
+            with CaptureQueriesContext(connection) as captured:
+                Client(HTTP_HOST='localhost').get(reverse(name))
+            fetched = 0
+            with connection.cursor() as cursor:
+                for query in captured.captured_queries:
+                    if not query['sql'].lstrip().upper().startswith('SELECT'):
+                        continue
+                    # Re-run the logged statement to see what it returned
+                    cursor.execute(query['sql'])
+                    fetched += sum(_size(value) for row in cursor.fetchall() for value in row)
+        return fetched, len(captured)
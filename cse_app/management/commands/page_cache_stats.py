@@ -0,0 +1,19 @@
+from django.core.management.base import BaseCommand
+
+from cse_app import page_cache
+
+
+class Command(BaseCommand):
+    help = 'Show the anonymous page cache hit ratio'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--reset', action='store_true', help='Reset the hit/miss counters after reporting')
+
+    def handle(self, *args, **options):
+        stats = page_cache.stats()
+        self.stdout.write(f"  Hits: {stats['hits']}")
+        self.stdout.write(f"  Misses: {stats['misses']}")
+        self.stdout.write(self.style.SUCCESS(f"  Hit ratio: {stats['hit_ratio']:.1%}"))
+        if options['reset']:
+            page_cache.reset_stats()
+            self.stdout.write('  Counters reset.')
@@ -0,0 +1,22 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from cse_app import search
+
+
+class Command(BaseCommand):
+    help = 'Rebuild the FTS5 full-text search index for notices, tech news, events and publications'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--kind', choices=sorted(search.SOURCES), help='Only rebuild one kind of content')
+
+    def handle(self, *args, **options):
+        start = time.perf_counter()
+        counts = search.rebuild(options.get('kind'))
+        if not counts:
+            self.stdout.write(self.style.WARNING('Search index is only available on SQLite; nothing to rebuild.'))
+            return
+        for kind, rows in counts.items():
+            self.stdout.write(f"  ✓ {kind}: {rows} documents indexed")
+        self.stdout.write(self.style.SUCCESS(f'Search index rebuilt in {time.perf_counter() - start:.2f}s'))
@@ -0,0 +1,51 @@
+import sqlite3
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DEFAULT_DB_ALIAS, connections
+
+from cse_app.routers import replica_aliases, unpin_primary
+
+SQLITE_ENGINE = 'django.db.backends.sqlite3'
+
+
+class Command(BaseCommand):
+    help = 'Copy the SQLite primary database over every SQLite replica in DATABASE_REPLICA_URLS (local replica testing)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--interval', type=int, default=0,
+                            help='Keep running and refresh every INTERVAL seconds (0 refreshes once)')
+
+    def handle(self, *args, **options):
+        interval = options['interval']
+        while True:
+            self.refresh()
+            if not interval:
+                return
+            time.sleep(interval)
+
+    def refresh(self):
+        primary = connections[DEFAULT_DB_ALIAS].settings_dict
+        if primary['ENGINE'] != SQLITE_ENGINE:
+            raise CommandError('The default database is not SQLite; replicas are kept by the database server')
+        replicas = [alias for alias in replica_aliases() if connections[alias].settings_dict['ENGINE'] == SQLITE_ENGINE]
+        if not replicas:
+            raise CommandError('No SQLite replicas are configured (set DATABASE_REPLICA_URLS)')
+
+        started = time.time()
+        source = sqlite3.connect(primary['NAME'])
+        try:
+            for alias in replicas:
+                connections[alias].close()
+                target = sqlite3.connect(connections[alias].settings_dict['NAME'])
+                try:
+                    # The backup API copies a consistent snapshot even while the primary is in use
+                    source.backup(target)
+                finally:
+                    target.close()
+                self.stdout.write(f"  ✓ {alias}: copied from {primary['NAME']}")
+        finally:
+            source.close()
+        # Writes made before the copy started are on the replicas now; let anonymous reads use them again
+        unpin_primary(started)
+        self.stdout.write(self.style.SUCCESS('Replicas match the primary database.'))
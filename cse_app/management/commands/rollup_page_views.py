@@ -0,0 +1,21 @@
+from django.core.management.base import BaseCommand
+
+from cse_app import page_analytics, view_counter
+
+
+class Command(BaseCommand):
+    help = 'Roll hourly page-view buckets up into daily and monthly totals and prune expired history'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--full', action='store_true', help='Recompute every day still covered by hourly buckets')
+        parser.add_argument('--no-prune', action='store_true', help='Keep buckets past their retention window')
+
+    def handle(self, *args, **options):
+        view_counter.flush()
+        since = page_analytics.hourly_cutoff() if options['full'] else None
+        for granularity, rows in page_analytics.rollup(since).items():
+            self.stdout.write(f"  ✓ {granularity} buckets written: {rows}")
+        if not options['no_prune']:
+            for kind, rows in page_analytics.prune().items():
+                self.stdout.write(f"  ✓ expired {kind} rows deleted: {rows}")
+        self.stdout.write(self.style.SUCCESS('Page-view history is up to date.'))
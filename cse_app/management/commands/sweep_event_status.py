@@ -0,0 +1,13 @@
+from django.core.management.base import BaseCommand
+
+from cse_app.event_schedule import sweep
+
+
+class Command(BaseCommand):
+    help = 'Recompute Event.is_upcoming for events that started or ended since they were last saved'
+
+    def handle(self, *args, **options):
+        ended, reopened = sweep()
+        self.stdout.write(f"  ✓ Marked as ended: {ended}")
+        self.stdout.write(f"  ✓ Marked as upcoming: {reopened}")
+        self.stdout.write(self.style.SUCCESS('Event status flags are up to date.'))
@@ -0,0 +1,22 @@
+from django.core.management.base import BaseCommand
+
+from cse_app import traffic_filter
+
+
+class Command(BaseCommand):
+    help = 'Show how many page-view events the bot/prefetch filter dropped before they reached the database'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--reset', action='store_true', help='Reset the counters after reporting')
+
+    def handle(self, *args, **options):
+        stats = traffic_filter.stats()
+        self.stdout.write(f"  Counted: {stats['accepted']}")
+        for reason, events in stats['dropped'].items():
+            self.stdout.write(f"  Dropped ({reason}): {events}")
+        self.stdout.write(self.style.SUCCESS(
+            f"  Counter writes avoided: {stats['writes_avoided']} ({stats['drop_ratio']:.1%} of reported views)"
+        ))
+        if options['reset']:
+            traffic_filter.reset_stats()
+            self.stdout.write('  Counters reset.')
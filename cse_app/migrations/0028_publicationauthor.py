@@ -0,0 +1,30 @@
+# Generated by Django 5.2.6 on 2026-10-18 08:03
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('cse_app', '0027_search_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PublicationAuthor',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=200)),
+                ('normalized_name', models.CharField(db_index=True, max_length=200)),
+                ('position', models.PositiveSmallIntegerField(help_text='Author order, starting at 0')),
+                ('faculty', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='authorships', to='cse_app.facultymember')),
+                ('publication', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='author_entries', to='cse_app.publication')),
+            ],
+            options={
+                'ordering': ['publication', 'position'],
+                'indexes': [models.Index(fields=['faculty', 'publication'], name='cse_app_pub_faculty_dd30c5_idx')],
+                'unique_together': {('publication', 'position')},
+            },
+        ),
+    ]
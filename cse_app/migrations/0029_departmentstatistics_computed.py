@@ -0,0 +1,75 @@
+# Generated by Django 5.2.6 on 2026-10-18 08:09
+
+from collections import Counter
+
+from django.db import migrations, models
+from django.utils import timezone
+
+
+# Frozen copy of cse_app.department_stats.split_research_areas as of this
+# migration, so later changes to the live splitter cannot change what it does
+def split_research_areas(research_interest):
+    if not research_interest:
+        return set()
+    return {area.strip() for area in research_interest.replace(',', ';').split(';') if area.strip()}
+
+
+def populate_counts(apps, schema_editor):
+    DepartmentStatistics = apps.get_model('cse_app', 'DepartmentStatistics')
+    FacultyMember = apps.get_model('cse_app', 'FacultyMember')
+    Publication = apps.get_model('cse_app', 'Publication')
+    Project = apps.get_model('cse_app', 'Project')
+
+    area_counts = Counter()
+    interests = list(FacultyMember.objects.filter(is_current=True, status='active').values_list('research_interest', flat=True))
+    for research_interest in interests:
+        area_counts.update(split_research_areas(research_interest))
+    DepartmentStatistics.objects.update(
+        computed_faculty=len(interests),
+        computed_research_areas=len(area_counts),
+        computed_publications=Publication.objects.count(),
+        computed_projects=Project.objects.count(),
+        research_area_counts=dict(sorted(area_counts.items())),
+        computed_at=timezone.now(),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('cse_app', '0028_publicationauthor'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='departmentstatistics',
+            name='computed_at',
+            field=models.DateTimeField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='departmentstatistics',
+            name='computed_faculty',
+            field=models.IntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='departmentstatistics',
+            name='computed_projects',
+            field=models.IntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='departmentstatistics',
+            name='computed_publications',
+            field=models.IntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='departmentstatistics',
+            name='computed_research_areas',
+            field=models.IntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='departmentstatistics',
+            name='research_area_counts',
+            field=models.JSONField(default=dict, editable=False, help_text='Number of active faculty members listing each research area'),
+        ),
+        migrations.RunPython(populate_counts, migrations.RunPython.noop),
+    ]
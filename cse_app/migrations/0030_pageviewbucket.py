@@ -0,0 +1,28 @@
+# Generated by Django 5.2.6 on 2026-10-18 08:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('cse_app', '0029_departmentstatistics_computed'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PageViewBucket',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('page_name', models.CharField(max_length=100)),
+                ('granularity', models.CharField(choices=[('hour', 'Hour'), ('day', 'Day'), ('month', 'Month')], max_length=5)),
+                ('bucket_start', models.DateTimeField()),
+                ('count', models.PositiveIntegerField(default=0)),
+            ],
+            options={
+                'ordering': ['-bucket_start'],
+                'indexes': [models.Index(fields=['granularity', 'bucket_start'], name='cse_app_pag_granula_43ea48_idx')],
+                'unique_together': {('granularity', 'page_name', 'bucket_start')},
+            },
+        ),
+    ]
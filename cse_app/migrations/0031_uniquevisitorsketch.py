@@ -0,0 +1,26 @@
+# Generated by Django 5.2.6 on 2026-10-18 08:14
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('cse_app', '0030_pageviewbucket'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='UniqueVisitorSketch',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('page_name', models.CharField(max_length=100)),
+                ('day', models.DateField()),
+                ('registers', models.BinaryField()),
+            ],
+            options={
+                'indexes': [models.Index(fields=['day'], name='cse_app_uni_day_1c0ab5_idx')],
+                'unique_together': {('page_name', 'day')},
+            },
+        ),
+    ]
@@ -0,0 +1,62 @@
+# Generated by Django 5.2.6 on 2026-10-18 08:25
+
+from html import unescape
+
+from django.db import migrations, models
+from django.utils.html import strip_tags
+
+# Frozen copies of cse_app.projections.EXCERPT_SOURCES and excerpt() as of this
+# migration, so later changes to the live module cannot change what it does
+EXCERPT_SOURCES = {
+    'cse_app.notice_board': 'content',
+    'cse_app.technews': 'content',
+    'cse_app.event': 'description',
+    'cse_app.project': 'description',
+}
+
+
+def excerpt(html, length=300):
+    text = ' '.join(unescape(strip_tags(html or '')).split())
+    if len(text) <= length:
+        return text
+    return text[:length - 1].rsplit(' ', 1)[0] + '…'
+
+
+def populate_excerpts(apps, schema_editor):
+    for label, source in EXCERPT_SOURCES.items():
+        model = apps.get_model(label)
+        rows = list(model.objects.only(source))
+        for row in rows:
+            row.excerpt = excerpt(getattr(row, source))
+        model.objects.bulk_update(rows, ['excerpt'], batch_size=200)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('cse_app', '0031_uniquevisitorsketch'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='event',
+            name='excerpt',
+            field=models.CharField(blank=True, editable=False, max_length=300),
+        ),
+        migrations.AddField(
+            model_name='notice_board',
+            name='excerpt',
+            field=models.CharField(blank=True, editable=False, max_length=300),
+        ),
+        migrations.AddField(
+            model_name='project',
+            name='excerpt',
+            field=models.CharField(blank=True, editable=False, max_length=300),
+        ),
+        migrations.AddField(
+            model_name='technews',
+            name='excerpt',
+            field=models.CharField(blank=True, editable=False, max_length=300),
+        ),
+        migrations.RunPython(populate_excerpts, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,64 @@
+# Generated by Django 5.2.6 on 2026-10-18 08:29
+
+from django.db import migrations, models
+
+
+# Frozen copy of the checks in cse_app.profile_completion as of this migration,
+# so later changes to the live module cannot change what it does
+FIELD_CHECKS = (
+    'name', 'email', 'phone', 'bio', 'research_interest', 'research_activities', 'publications',
+    'courses_taught', 'membership', 'awards_honors', 'image', 'cv_file',
+)
+URL_FIELDS = ('research_gate_url', 'google_scholar_url', 'orcid_url', 'linkedin_url', 'personal_website')
+CHECK_COUNT = len(FIELD_CHECKS) + 3  # links, educations, experiences
+
+
+def _filled(value):
+    return bool(value and str(value).strip())
+
+
+def missing_checks(member, education_count, experience_count):
+    missing = [key for key in FIELD_CHECKS if not _filled(getattr(member, key))]
+    if sum(_filled(getattr(member, field)) for field in URL_FIELDS) < 2:
+        missing.append('links')
+    if not education_count:
+        missing.append('educations')
+    if not experience_count:
+        missing.append('experiences')
+    return missing
+
+
+def score(missing):
+    return (CHECK_COUNT - len(missing)) * 100 // CHECK_COUNT
+
+
+def populate_completion(apps, schema_editor):
+    FacultyMember = apps.get_model('cse_app', 'FacultyMember')
+    members = list(FacultyMember.objects.all())
+    for member in members:
+        member.profile_missing = missing_checks(
+            member, member.educations.count(), member.professional_experiences.count(),
+        )
+        member.profile_completion = score(member.profile_missing)
+    FacultyMember.objects.bulk_update(members, ['profile_completion', 'profile_missing'], batch_size=200)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('cse_app', '0032_list_excerpts'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='facultymember',
+            name='profile_completion',
+            field=models.PositiveSmallIntegerField(db_index=True, default=0, editable=False, help_text='Percentage of profile checks passed'),
+        ),
+        migrations.AddField(
+            model_name='facultymember',
+            name='profile_missing',
+            field=models.JSONField(blank=True, default=list, editable=False, help_text='Keys of the profile checks not passed yet'),
+        ),
+        migrations.RunPython(populate_completion, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,43 @@
+# Generated by Django 5.2.6 on 2026-10-18 08:32
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('cse_app', '0033_faculty_profile_completion'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ResearchArea',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=100)),
+                ('normalized_name', models.CharField(max_length=100, unique=True)),
+                ('slug', models.SlugField(max_length=110, unique=True)),
+            ],
+            options={
+                'ordering': ['name'],
+            },
+        ),
+        migrations.AddField(
+            model_name='facultymember',
+            name='research_areas',
+            field=models.ManyToManyField(blank=True, editable=False, related_name='faculty', to='cse_app.researcharea'),
+        ),
+        migrations.CreateModel(
+            name='ResearchAreaAlias',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('normalized_name', models.CharField(help_text='Run backfill_research_areas to relink faculty who already use it', max_length=100, unique=True, verbose_name='spelling')),
+                ('area', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='aliases', to='cse_app.researcharea')),
+            ],
+            options={
+                'verbose_name_plural': 'Research area aliases',
+                'ordering': ['normalized_name'],
+            },
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 5.2.6 on 2026-10-18 08:35
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('cse_app', '0034_research_areas'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='event',
+            index=models.Index(fields=['end_date', 'start_date'], name='cse_app_eve_end_dat_2b83f2_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='event',
+            index=models.Index(fields=['start_date', 'id'], name='cse_app_eve_start_d_5dfb47_idx'),
+        ),
+    ]
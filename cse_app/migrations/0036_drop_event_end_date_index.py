@@ -0,0 +1,17 @@
+# Generated by Django 5.2.6 on 2026-10-18 08:58
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('cse_app', '0035_event_schedule_indexes'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='event',
+            name='cse_app_eve_end_dat_2b83f2_idx',
+        ),
+    ]
@@ -39,6 +39,7 @@ class StaffProfile(models.Model):
 class Notice_Board(models.Model):
     title = models.CharField(max_length=200)
     content = RichTextField()
+    excerpt = models.CharField(max_length=300, blank=True, editable=False)  # plain text for listings
     file = models.FileField(upload_to='notices/', blank=True, null=True)  # For download option
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
@@ -79,6 +80,25 @@ class Publication(models.Model):
         ordering = ['-publication_date']
 
 
+class PublicationAuthor(models.Model):
+    """One parsed entry of Publication.authors, linked to a FacultyMember when the name matches."""
+    publication = models.ForeignKey(Publication, on_delete=models.CASCADE, related_name='author_entries')
+    faculty = models.ForeignKey('FacultyMember', on_delete=models.SET_NULL, null=True, blank=True, related_name='authorships')
+    name = models.CharField(max_length=200)
+    normalized_name = models.CharField(max_length=200, db_index=True)
+    position = models.PositiveSmallIntegerField(help_text="Author order, starting at 0")
+
+    def __str__(self):
+        return f"{self.name} - {self.publication.title}"
+
+    class Meta:
+        ordering = ['publication', 'position']
+        unique_together = ('publication', 'position')
+        indexes = [
+            models.Index(fields=['faculty', 'publication']),
+        ]
+
+
 class Project(models.Model):
     PROJECT_TYPES = (
         ('research', 'Research Project'),
@@ -89,6 +109,7 @@ class Project(models.Model):
     
     title = models.CharField(max_length=200)
     description = RichTextField()
+    excerpt = models.CharField(max_length=300, blank=True, editable=False)  # plain text for listings
     project_type = models.CharField(max_length=20, choices=PROJECT_TYPES)
     members = models.ManyToManyField('FacultyMember', related_name='projects', blank=True)
     start_date = models.DateField()
@@ -122,6 +143,33 @@ class Education(models.Model):
         verbose_name_plural = 'Education Records'
 
 
+class ResearchArea(models.Model):
+    """One canonical research area parsed from FacultyMember.research_interest."""
+    name = models.CharField(max_length=100)
+    normalized_name = models.CharField(max_length=100, unique=True)
+    slug = models.SlugField(max_length=110, unique=True)
+
+    def __str__(self):
+        return self.name
+
+    class Meta:
+        ordering = ['name']
+
+
+class ResearchAreaAlias(models.Model):
+    """Another spelling that resolves to ``area`` ('ML' -> Machine Learning)."""
+    area = models.ForeignKey(ResearchArea, on_delete=models.CASCADE, related_name='aliases')
+    normalized_name = models.CharField(max_length=100, unique=True, verbose_name='spelling',
+                                       help_text="Run backfill_research_areas to relink faculty who already use it")
+
+    def __str__(self):
+        return f"{self.normalized_name} -> {self.area.name}"
+
+    class Meta:
+        ordering = ['normalized_name']
+        verbose_name_plural = 'Research area aliases'
+
+
 class FacultyMember(models.Model):
     DESIGNATION_CHOICES = (
         ('professor', 'Professor'),
@@ -164,7 +212,9 @@ class FacultyMember(models.Model):
     orcid_url = models.URLField(blank=True, help_text="ORCID profile URL")
     linkedin_url = models.URLField(blank=True, help_text="LinkedIn profile URL")
     personal_website = models.URLField(blank=True, help_text="Personal website URL")
-  
+    # Maintained by cse_app.research_areas from research_interest
+    research_areas = models.ManyToManyField(ResearchArea, related_name='faculty', blank=True, editable=False)
+
     # Rich text fields for information display
     research_activities = RichTextField(blank=True, help_text="Research activities and projects")
     publications = RichTextField(blank=True, help_text="List of publications")
@@ -179,6 +229,12 @@ class FacultyMember(models.Model):
     end_date = models.DateField(blank=True, null=True)
     is_current = models.BooleanField(default=True, help_text="Is this faculty member currently active?")
     is_chairman = models.BooleanField(default=False)
+
+    # Maintained by cse_app.profile_completion
+    profile_completion = models.PositiveSmallIntegerField(default=0, editable=False, db_index=True,
+                                                          help_text="Percentage of profile checks passed")
+    profile_missing = models.JSONField(default=list, blank=True, editable=False,
+                                       help_text="Keys of the profile checks not passed yet")
     
     def __str__(self):
         return f"{self.name} - {self.get_designation_display()}"
@@ -273,6 +329,7 @@ class Chairman(models.Model):
 class TechNews(models.Model):
     title = models.CharField(max_length=200)
     content = RichTextField()
+    excerpt = models.CharField(max_length=300, blank=True, editable=False)  # plain text for listings
     source = models.CharField(max_length=100, blank=True)
     url = models.URLField(blank=True)
     published_date = models.DateTimeField(default=timezone.now)
@@ -295,9 +352,53 @@ class ViewCount(models.Model):
         return f"{self.page_name}: {self.count} views"
 
     def increment(self):
-        self.count += 1
-        self.save()
-        
+        # Atomic in the database; hot paths should use view_counter.record_view
+        ViewCount.objects.filter(pk=self.pk).update(count=models.F('count') + 1, last_updated=timezone.now())
+        self.refresh_from_db(fields=['count', 'last_updated'])
+
+
+class PageViewBucket(models.Model):
+    """
+    Page views of one page in one hour, day or month (analytics database).
+    Hourly rows are written by cse_app.view_counter; cse_app.page_analytics
+    rolls them up into daily and monthly rows and prunes old buckets.
+    """
+    GRANULARITY_CHOICES = (
+        ('hour', 'Hour'),
+        ('day', 'Day'),
+        ('month', 'Month'),
+    )
+
+    page_name = models.CharField(max_length=100)
+    granularity = models.CharField(max_length=5, choices=GRANULARITY_CHOICES)
+    bucket_start = models.DateTimeField()
+    count = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        ordering = ['-bucket_start']
+        unique_together = ('granularity', 'page_name', 'bucket_start')
+        indexes = [models.Index(fields=['granularity', 'bucket_start'])]
+
+    def __str__(self):
+        return f"{self.page_name} {self.granularity} {self.bucket_start:%Y-%m-%d %H:%M}: {self.count}"
+
+
+class UniqueVisitorSketch(models.Model):
+    """
+    HyperLogLog registers estimating the distinct visitors of one page on one
+    day (analytics database). See cse_app.unique_visitors.
+    """
+    page_name = models.CharField(max_length=100)
+    day = models.DateField()
+    registers = models.BinaryField()
+
+    class Meta:
+        unique_together = ('page_name', 'day')
+        indexes = [models.Index(fields=['day'])]
+
+    def __str__(self):
+        return f"{self.page_name} {self.day}"
+
 class Event(models.Model):
     EVENT_TYPES = (
         ('conference', 'Conference'),
@@ -312,6 +413,7 @@ class Event(models.Model):
     
     title = models.CharField(max_length=200)
     description = RichTextField()
+    excerpt = models.CharField(max_length=300, blank=True, editable=False)  # plain text for listings
     event_type = models.CharField(max_length=20, choices=EVENT_TYPES)
     start_date = models.DateTimeField()
     end_date = models.DateTimeField()
@@ -319,6 +421,8 @@ class Event(models.Model):
     organizer = models.CharField(max_length=200, blank=True)
     image = models.ImageField(upload_to='events/', blank=True, null=True)
     registration_link = models.URLField(blank=True)
+    # Stored snapshot for the admin; listings use cse_app.event_schedule, and
+    # `manage.py sweep_event_status` refreshes it for events that ended since saving
     is_upcoming = models.BooleanField(default=True)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
@@ -336,6 +440,11 @@ class Event(models.Model):
     
     class Meta:
         ordering = ['start_date']
+        indexes = [
+            # Listings and their keyset pages read this in (start_date, id) order
+            # and test end_date against each row, so no sort step is needed
+            models.Index(fields=['start_date', 'id']),
+        ]
         
 class ImageGallery(models.Model):
     title = models.CharField(max_length=200)
@@ -506,6 +615,18 @@ class DepartmentStatistics(models.Model):
         help_text="Internal notes about statistics updates"
     )
     
+    # Materialized counts, kept current by signals (see cse_app/department_stats.py)
+    computed_faculty = models.IntegerField(default=0, editable=False)
+    computed_research_areas = models.IntegerField(default=0, editable=False)
+    computed_publications = models.IntegerField(default=0, editable=False)
+    computed_projects = models.IntegerField(default=0, editable=False)
+    research_area_counts = models.JSONField(
+        default=dict,
+        editable=False,
+        help_text="Number of active faculty members listing each research area"
+    )
+    computed_at = models.DateTimeField(null=True, blank=True, editable=False)
+    
     class Meta:
         verbose_name = "Department Statistics"
         verbose_name_plural = "Department Statistics"
@@ -533,15 +654,8 @@ class DepartmentStatistics(models.Model):
         return FacultyMember.objects.filter(is_current=True, status='active').count()
     
     def get_research_areas_count(self):
-        """Calculate unique research areas from faculty"""
-        from .models import FacultyMember
-        research_areas = set()
-        faculty_members = FacultyMember.objects.filter(is_current=True, status='active')
-        for faculty in faculty_members:
-            if faculty.research_interest:
-                areas = [area.strip() for area in faculty.research_interest.replace(',', ';').split(';') if area.strip()]
-                research_areas.update(areas)
-        return len(research_areas) if research_areas else 0
+        """Calculate unique research areas from faculty, after case folding and alias merging"""
+        return ResearchArea.objects.filter(faculty__is_current=True, faculty__status='active').distinct().count()
     
     def get_publications_count(self):
         """Calculate total publications"""
@@ -552,3 +666,17 @@ class DepartmentStatistics(models.Model):
         """Calculate total projects"""
         from .models import Project
         return Project.objects.count()
+    
+    def get_display_values(self):
+        """
+        Values shown on the home and About pages: the manual entry, or the
+        materialized count when the field is left at 0
+        """
+        return {
+            'total_students': self.total_students,
+            'total_faculty': self.total_faculty or self.computed_faculty,
+            'total_labs': self.total_labs,
+            'total_research_areas': self.total_research_areas or self.computed_research_areas,
+            'total_publications': self.total_publications or self.computed_publications,
+            'total_projects': self.total_projects or self.computed_projects,
+        }
@@ -0,0 +1,176 @@
+"""
+Page-view history built on ``PageViewBucket``.
+
+``cse_app.view_counter`` adds every flushed hit to an hourly bucket. ``rollup``
+sums hours into daily buckets and days into monthly ones, and ``prune`` drops
+buckets older than their retention window, so storage stays bounded even with
+one page name per notice or news item. Reports such as "top notices this week"
+read the daily rollups only.
+
+Rollups run automatically from the view-counter flush at most once every
+``PAGE_VIEW_ROLLUP_INTERVAL`` seconds and recompute every day since the last
+one rolled up, so a day whose last hours were flushed after its final rollup
+is completed by the next one. ``manage.py rollup_page_views`` runs them on
+demand (``--full`` recomputes everything still covered by hourly data).
+"""
+import logging
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DatabaseError
+from django.db.models import Max, Sum
+from django.db.models.functions import TruncDay, TruncMonth
+from django.utils import timezone
+
+from . import unique_visitors
+from .models import Notice_Board, PageViewBucket, UniqueVisitorSketch, ViewCount
+
+logger = logging.getLogger(__name__)
+
+ROLLUP_LOCK_KEY = 'cse:page_analytics:rollup'
+
+
+def _setting(name, default):
+    return getattr(settings, name, default)
+
+
+def day_start(moment):
+    return moment.replace(hour=0, minute=0, second=0, microsecond=0)
+
+
+def month_start(moment):
+    return day_start(moment).replace(day=1)
+
+
+def _months_before(moment, months):
+    index = moment.year * 12 + moment.month - 1 - months
+    return month_start(moment).replace(year=index // 12, month=index % 12 + 1)
+
+
+def _store(granularity, rows):
+    buckets = [
+        PageViewBucket(page_name=row['page_name'], granularity=granularity,
+                       bucket_start=row['period'], count=row['total'])
+        for row in rows
+    ]
+    PageViewBucket.objects.bulk_create(
+        buckets, batch_size=500, update_conflicts=True,
+        unique_fields=['granularity', 'page_name', 'bucket_start'], update_fields=['count'],
+    )
+    return len(buckets)
+
+
+def _totals(granularity, since, trunc):
+    return (
+        PageViewBucket.objects.filter(granularity=granularity, bucket_start__gte=since)
+        .order_by()
+        .annotate(period=trunc('bucket_start'))
+        .values('page_name', 'period')
+        .annotate(total=Sum('count'))
+    )
+
+
+def rollup(since=None):
+    """Recompute daily buckets from hourly ones (and monthly from daily) from ``since`` on.
+
+    Returns ``{'day': rows, 'month': rows}``.
+    """
+    if since is None:
+        since = timezone.now() - timedelta(days=1)
+        # Back to the last day rolled up, so hours flushed after that rollup are not left out
+        last = PageViewBucket.objects.filter(granularity='day').aggregate(last=Max('bucket_start'))['last']
+        if last is not None and last < since:
+            since = max(last, hourly_cutoff())
+    since = day_start(since)
+    return {
+        'day': _store('day', _totals('hour', since, TruncDay)),
+        'month': _store('month', _totals('day', month_start(since), TruncMonth)),
+    }
+
+
+def hourly_cutoff(now=None):
+    """Hourly buckets before this day boundary are pruned."""
+    now = now or timezone.now()
+    return day_start(now - timedelta(days=_setting('PAGE_VIEW_HOURLY_RETENTION_DAYS', 14)))
+
+
+def prune(now=None):
+    """Delete buckets and visitor sketches past their retention window. Returns ``{kind: rows}``.
+
+    Each kind goes in a single DELETE: no delete signal receivers are connected
+    to the analytics models, so Django never loads the expired rows.
+    """
+    now = now or timezone.now()
+    cutoffs = {
+        'hour': hourly_cutoff(now),
+        'day': month_start(now - timedelta(days=_setting('PAGE_VIEW_DAILY_RETENTION_DAYS', 400))),
+        'month': _months_before(now, _setting('PAGE_VIEW_MONTHLY_RETENTION_MONTHS', 60)),
+    }
+    deleted = {}
+    for granularity, cutoff in cutoffs.items():
+        deleted[granularity], _ = PageViewBucket.objects.filter(
+            granularity=granularity, bucket_start__lt=cutoff,
+        ).delete()
+    deleted['sketch'] = unique_visitors.prune(now)
+    return deleted
+
+
+def maybe_rollup():
+    """Roll up recent buckets unless another worker did so in the last interval."""
+    interval = _setting('PAGE_VIEW_ROLLUP_INTERVAL', 600)
+    if not interval or not cache.add(ROLLUP_LOCK_KEY, True, interval):
+        return
+    try:
+        rollup()
+        prune()
+    except DatabaseError:
+        logger.exception("Could not roll up page-view buckets")
+
+
+def forget_page(page_name):
+    """Drop the counter and history of a page that no longer exists."""
+    ViewCount.objects.filter(page_name=page_name).delete()
+    PageViewBucket.objects.filter(page_name=page_name).delete()
+    UniqueVisitorSketch.objects.filter(page_name=page_name).delete()
+
+
+def top_pages(days=7, prefix='', limit=10, now=None):
+    """``[(page_name, views)]`` over the last ``days`` days (today included), busiest first."""
+    now = now or timezone.now()
+    since = day_start(now) - timedelta(days=days - 1)
+    rows = (
+        PageViewBucket.objects.filter(granularity='day', bucket_start__gte=since, page_name__startswith=prefix)
+        .order_by()
+        .values('page_name')
+        .annotate(total=Sum('count'))
+        .order_by('-total', 'page_name')[:limit]
+    )
+    return [(row['page_name'], row['total']) for row in rows]
+
+
+def top_notices(days=7, limit=5, now=None):
+    """``[(notice, views)]`` for the most viewed notices that still exist."""
+    ranked = []
+    for page_name, views in top_pages(days, prefix='notice_', limit=limit, now=now):
+        pk = page_name[len('notice_'):]
+        if pk.isdigit():
+            ranked.append((int(pk), views))
+    notices = Notice_Board.objects.only('id', 'title', 'created_at').in_bulk([pk for pk, _ in ranked])
+    return [(notices[pk], views) for pk, views in ranked if pk in notices]
+
+
+def daily_totals(days=14, now=None):
+    """``[(date, views)]`` across all pages for each of the last ``days`` days, oldest first."""
+    now = now or timezone.now()
+    since = day_start(now) - timedelta(days=days - 1)
+    totals = dict(
+        PageViewBucket.objects.filter(granularity='day', bucket_start__gte=since)
+        .order_by()
+        .values_list('bucket_start')
+        .annotate(total=Sum('count'))
+    )
+    return [
+        (day.date(), totals.get(day, 0))
+        for day in (since + timedelta(days=offset) for offset in range(days))
+    ]
@@ -0,0 +1,118 @@
+"""
+Full-page response cache for anonymous visitors.
+
+Views opt in with ``@cache_tags(Model, ...)`` listing the models they read.
+``AnonymousPageCacheMiddleware`` keys each response by host, path and query
+string plus the current version of every tag, so saving a FacultyMember
+(which bumps the ``page:facultymember`` namespace, see ``cse_app.signals``)
+purges only the pages tagged with FacultyMember. Authenticated users,
+non-GET requests and responses that set cookies are never cached.
+
+The hit and miss tallies are best-effort: the file-based cache increments by
+reading and rewriting, so concurrent workers can lose updates.
+"""
+import hashlib
+
+from django.conf import settings
+from django.core.cache import cache
+
+from .caching import get_versions
+
+HITS_KEY = 'cse:page_cache:hits'
+MISSES_KEY = 'cse:page_cache:misses'
+
+
+def tag_for_model(model):
+    return f'page:{model._meta.model_name}'
+
+
+def cache_tags(*models, timeout_setting='PAGE_CACHE_TIMEOUT'):
+    """Mark a view as cacheable for anonymous visitors, invalidated by ``models``.
+
+    ``timeout_setting`` names the setting holding how long the page is kept,
+    for views whose content also changes with the clock.
+    """
+    def decorator(view_func):
+        view_func.page_cache_tags = tuple(sorted(tag_for_model(model) for model in models))
+        view_func.page_cache_timeout_setting = timeout_setting
+        return view_func
+    return decorator
+
+
+def _count(key):
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.add(key, 0, None)
+        cache.incr(key)
+
+
+def stats():
+    """Return ``{'hits', 'misses', 'hit_ratio'}`` since the last reset."""
+    values = cache.get_many([HITS_KEY, MISSES_KEY])
+    hits = values.get(HITS_KEY, 0)
+    misses = values.get(MISSES_KEY, 0)
+    total = hits + misses
+    return {'hits': hits, 'misses': misses, 'hit_ratio': hits / total if total else 0.0}
+
+
+def reset_stats():
+    cache.delete_many([HITS_KEY, MISSES_KEY])
+
+
+class AnonymousPageCacheMiddleware:
+    """Serve tagged views from the cache for anonymous GET requests.
+
+    Must come after AuthenticationMiddleware and MessageMiddleware.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        response = self.get_response(request)
+        key = getattr(request, '_page_cache_key', None)
+        if key is None:
+            return response
+        if self._is_cacheable(request, response):
+            cache.set(key, response, getattr(settings, request._page_cache_timeout_setting, 600))
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        tags = getattr(view_func, 'page_cache_tags', None)
+        if tags is None or self._bypass(request):
+            return None
+
+        versions = get_versions(tags)
+        url = f'{request.get_host()}{request.get_full_path()}'
+        fingerprint = ':'.join(f'{tag}={versions[tag]}' for tag in tags)
+        digest = hashlib.md5(f'{url}|{fingerprint}'.encode()).hexdigest()
+        key = f'cse:page:{view_func.__module__}.{view_func.__name__}:{digest}'
+
+        response = cache.get(key)
+        if response is not None:
+            _count(HITS_KEY)
+            return response
+
+        _count(MISSES_KEY)
+        request._page_cache_key = key
+        request._page_cache_timeout_setting = view_func.page_cache_timeout_setting
+        return None
+
+    def _bypass(self, request):
+        if request.method != 'GET':
+            return True
+        # Pending flash messages make the page visitor-specific
+        if 'messages' in request.COOKIES:
+            return True
+        user = getattr(request, 'user', None)
+        return user is not None and user.is_authenticated
+
+    def _is_cacheable(self, request, response):
+        return (
+            response.status_code == 200
+            and not response.streaming
+            and not response.cookies
+            # A rendered {% csrf_token %} is tied to this visitor's cookie
+            and not request.META.get('CSRF_COOKIE_NEEDS_UPDATE')
+        )
@@ -0,0 +1,195 @@
+"""
+Keyset ("seek") pagination for the public listings.
+
+Django's ``Paginator`` runs ``COUNT(*)`` on every request and reads page ``n``
+with ``OFFSET``, which scans and throws away every earlier row. Here the
+listing is ordered by a sort key plus ``id`` and next/previous links carry an
+opaque signed cursor holding the boundary row's ``(key, id)``; the next page is
+a ``WHERE (key, id) < (...)`` seek that reads only the rows it shows.
+
+``?page=N`` URLs keep working (they are served with ``OFFSET`` once and the
+links from there on are cursors), and listings without a usable key, such as
+relevance-ranked search results, are paginated by page number only. The total
+for the page footer is cached per query under the model's page-cache tag, so
+it is recounted after the model changes or ``PAGINATION_COUNT_TIMEOUT``
+seconds, not on every request.
+
+Pages implement the parts of ``django.core.paginator.Page`` the templates use,
+plus ``next_query``/``previous_query`` for the link URLs.
+"""
+import hashlib
+import math
+from datetime import date
+
+from django.conf import settings
+from django.core import signing
+from django.core.cache import cache
+from django.core.exceptions import EmptyResultSet, ValidationError
+from django.db.models import Q
+from django.http import QueryDict
+from django.utils.functional import cached_property
+
+from .caching import versioned_key
+from .page_cache import tag_for_model
+
+CURSOR_SALT = 'cse_app.pagination'
+
+
+class KeysetPaginator:
+    """Paginate ``queryset`` by ``key`` (e.g. ``'-created_at'``); ``key=None`` uses page numbers only."""
+
+    def __init__(self, queryset, per_page, key=None):
+        self.per_page = per_page
+        self.key = key
+        if key:
+            self.descending = key.startswith('-')
+            self.field = key.lstrip('-')
+            queryset = queryset.order_by(key, '-pk' if self.descending else 'pk')
+        self.queryset = queryset
+
+    @cached_property
+    def count(self):
+        """Cached total number of rows in the listing."""
+        try:
+            sql, params = self.queryset.query.sql_with_params()
+        except EmptyResultSet:
+            return 0
+        digest = hashlib.md5(f'{sql}{params}'.encode()).hexdigest()
+        key = versioned_key(tag_for_model(self.queryset.model), 'count', digest)
+        total = cache.get(key)
+        if total is None:
+            total = self.queryset.count()
+            cache.set(key, total, getattr(settings, 'PAGINATION_COUNT_TIMEOUT', 600))
+        return total
+
+    @property
+    def num_pages(self):
+        return max(1, math.ceil(self.count / self.per_page))
+
+    @property
+    def page_range(self):
+        return range(1, self.num_pages + 1)
+
+    def _cursor(self, row, direction, number):
+        value = getattr(row, self.field)
+        if isinstance(value, date):
+            value = value.isoformat()
+        return signing.dumps([value, row.pk, direction, number], salt=CURSOR_SALT)
+
+    def _seek(self, cursor):
+        try:
+            value, pk, direction, number = signing.loads(cursor, salt=CURSOR_SALT)
+            value = self.queryset.model._meta.get_field(self.field).to_python(value)
+        except (signing.BadSignature, ValidationError, ValueError, TypeError):
+            return None
+        forward = direction == 'next'
+        # Rows after the boundary in the listing order, or before it when going back
+        after = '__lt' if self.descending == forward else '__gt'
+        rows = self.queryset.filter(
+            Q(**{f'{self.field}{after}': value}) | Q(**{self.field: value, f'pk{after}': pk})
+        )
+        if not forward:
+            rows = rows.reverse()
+        rows = list(rows[:self.per_page + 1])
+        more = len(rows) > self.per_page
+        rows = rows[:self.per_page]
+        if forward:
+            return KeysetPage(rows, number, self, has_previous=True, has_next=more)
+        rows.reverse()
+        return KeysetPage(rows, number if more else 1, self, has_previous=more, has_next=True)
+
+    def page(self, number=None, cursor=None):
+        """The page reached through ``cursor``, else page ``number`` (clamped to the valid range)."""
+        if cursor and self.key:
+            page = self._seek(cursor)
+            if page is not None and page.object_list:
+                return page
+        try:
+            number = max(1, int(number))
+        except (TypeError, ValueError):
+            number = 1
+        if number > 1:
+            number = min(number, self.num_pages)
+        offset = (number - 1) * self.per_page
+        rows = list(self.queryset[offset:offset + self.per_page + 1])
+        return KeysetPage(
+            rows[:self.per_page], number, self,
+            has_previous=number > 1, has_next=len(rows) > self.per_page,
+        )
+
+
+class KeysetPage:
+
+    def __init__(self, object_list, number, paginator, has_previous, has_next):
+        self.object_list = object_list
+        self.number = number
+        self.paginator = paginator
+        self._has_previous = has_previous
+        self._has_next = has_next
+        self.query = QueryDict()
+
+    def __repr__(self):
+        return f'<Page {self.number} of {self.paginator.num_pages}>'
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def __getitem__(self, index):
+        return self.object_list[index]
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def has_next(self):
+        return self._has_next
+
+    def has_previous(self):
+        return self._has_previous
+
+    def has_other_pages(self):
+        return self._has_next or self._has_previous
+
+    def next_page_number(self):
+        return self.number + 1
+
+    def previous_page_number(self):
+        return self.number - 1
+
+    @property
+    def next_cursor(self):
+        if self.paginator.key and self._has_next and self.object_list:
+            return self.paginator._cursor(self.object_list[-1], 'next', self.number + 1)
+        return None
+
+    @property
+    def previous_cursor(self):
+        if self.paginator.key and self._has_previous and self.number > 2 and self.object_list:
+            return self.paginator._cursor(self.object_list[0], 'prev', self.number - 1)
+        return None
+
+    def _link(self, cursor, number):
+        query = self.query.copy()
+        query.pop('cursor', None)
+        query.pop('page', None)
+        if cursor:
+            query['cursor'] = cursor
+        elif number > 1:
+            query['page'] = str(number)
+        return query.urlencode()
+
+    @property
+    def next_query(self):
+        """Query string of the next page's URL, other GET parameters kept."""
+        return self._link(self.next_cursor, self.number + 1)
+
+    @property
+    def previous_query(self):
+        """Query string of the previous page's URL (page 1 has neither cursor nor page)."""
+        return self._link(self.previous_cursor, self.number - 1)
+
+
+def paginate(request, queryset, per_page, key=None):
+    """Page of ``queryset`` for ``request``'s ``?cursor=`` or ``?page=`` parameter."""
+    page = KeysetPaginator(queryset, per_page, key).page(request.GET.get('page'), request.GET.get('cursor'))
+    page.query = request.GET
+    return page
@@ -0,0 +1,81 @@
+"""
+Stored profile-completion scores for faculty members.
+
+A profile passes or fails each of ``CHECKS``; the score is the share passed,
+as a whole percentage. Both the score and the keys of the failed checks are
+stored on FacultyMember (``profile_completion``, ``profile_missing``) so the
+dashboard reads them for free and the admin can sort and filter on them.
+Signal handlers in ``cse_app.signals`` recompute them when a member is saved
+and when one of their education or experience records is added or removed.
+"""
+from .models import FacultyMember
+
+# (key, label) in the order the dashboard lists missing items
+CHECKS = (
+    ('name', 'Name'),
+    ('email', 'Email'),
+    ('phone', 'Phone'),
+    ('bio', 'Biography'),
+    ('research_interest', 'Research interests'),
+    ('research_activities', 'Research activities'),
+    ('publications', 'Publications'),
+    ('courses_taught', 'Courses taught'),
+    ('membership', 'Memberships'),
+    ('awards_honors', 'Awards and honors'),
+    ('image', 'Photo'),
+    ('cv_file', 'CV'),
+    ('links', 'At least two profile links'),
+    ('educations', 'Education records'),
+    ('experiences', 'Professional experience'),
+)
+LABELS = dict(CHECKS)
+
+# Checks that pass when the model field of the same name is filled in
+FIELD_CHECKS = tuple(key for key, _ in CHECKS[:12])
+
+URL_FIELDS = ('research_gate_url', 'google_scholar_url', 'orcid_url', 'linkedin_url', 'personal_website')
+
+
+def _filled(value):
+    return bool(value and str(value).strip())
+
+
+def missing_checks(member, education_count, experience_count):
+    """Keys of the checks ``member`` fails, in ``CHECKS`` order."""
+    missing = [key for key in FIELD_CHECKS if not _filled(getattr(member, key))]
+    if sum(_filled(getattr(member, field)) for field in URL_FIELDS) < 2:
+        missing.append('links')
+    if not education_count:
+        missing.append('educations')
+    if not experience_count:
+        missing.append('experiences')
+    return missing
+
+
+def score(missing):
+    return (len(CHECKS) - len(missing)) * 100 // len(CHECKS)
+
+
+def apply(member):
+    """Set ``profile_completion`` and ``profile_missing`` on an unsaved ``member``."""
+    if member.pk:
+        counts = (member.educations.count(), member.professional_experiences.count())
+    else:
+        counts = (0, 0)
+    member.profile_missing = missing_checks(member, *counts)
+    member.profile_completion = score(member.profile_missing)
+
+
+def refresh(pk):
+    """Recompute and store the score of FacultyMember ``pk`` (e.g. after its records changed)."""
+    member = FacultyMember.objects.filter(pk=pk).first()
+    if member is None:
+        return
+    apply(member)
+    FacultyMember.objects.filter(pk=pk).update(
+        profile_completion=member.profile_completion, profile_missing=member.profile_missing,
+    )
+
+
+def labels(missing):
+    return [LABELS[key] for key in missing if key in LABELS]
@@ -0,0 +1,68 @@
+"""
+Column projections for listing pages.
+
+A listing card shows a title, a date, an image and a couple of lines of text,
+but a plain queryset also loads every RichText body (notice content, event and
+project descriptions, the faculty profile sections) just to throw it away.
+Each listing names the columns its cards render in ``LIST_FIELDS`` and fetches
+them with ``for_listing``; the card text comes from the stored plain-text
+``excerpt`` column, which a ``pre_save`` handler in ``cse_app.signals`` fills
+from the body.
+
+``LIST_PROJECTIONS = False`` loads full rows again; ``manage.py
+list_projection_report`` fetches every listing both ways and reports the
+bytes read from the database.
+"""
+from html import unescape
+
+from django.conf import settings
+from django.utils.html import strip_tags
+
+# Characters kept in the stored excerpt (cards truncate it further by words)
+EXCERPT_LENGTH = 300
+
+# app_label.model_name -> RichText field the excerpt summarises
+EXCERPT_SOURCES = {
+    'cse_app.notice_board': 'content',
+    'cse_app.technews': 'content',
+    'cse_app.event': 'description',
+    'cse_app.project': 'description',
+}
+
+# Columns each kind of listing card renders (the primary key is always loaded)
+LIST_FIELDS = {
+    'notice': (
+        'title', 'excerpt', 'file', 'created_at', 'is_important',
+        'created_by__username', 'created_by__first_name', 'created_by__last_name',
+    ),
+    'home_notice': ('title', 'excerpt', 'file', 'created_at', 'is_important'),
+    'tech_news': ('title', 'excerpt', 'source', 'url', 'published_date', 'image'),
+    'event': (
+        'title', 'excerpt', 'event_type', 'start_date', 'end_date', 'location', 'image',
+        'registration_link',
+    ),
+    'project': ('title', 'excerpt', 'project_type', 'start_date', 'image'),
+    'faculty': (
+        'name', 'designation', 'status', 'email', 'room_no', 'image', 'bio',
+        'joined_date', 'end_date', 'is_current', 'is_chairman',
+    ),
+}
+
+
+def excerpt(html, length=EXCERPT_LENGTH):
+    """Plain text of ``html``, whitespace collapsed, cut at a word boundary."""
+    text = ' '.join(unescape(strip_tags(html or '')).split())
+    if len(text) <= length:
+        return text
+    return text[:length - 1].rsplit(' ', 1)[0] + '…'
+
+
+def excerpt_source(model):
+    return EXCERPT_SOURCES.get(model._meta.label_lower)
+
+
+def for_listing(queryset, card):
+    """Restrict ``queryset`` to the columns ``card`` renders."""
+    if not getattr(settings, 'LIST_PROJECTIONS', True):
+        return queryset
+    return queryset.only(*LIST_FIELDS[card])
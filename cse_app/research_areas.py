@@ -0,0 +1,152 @@
+"""
+Normalized research-area taxonomy.
+
+``FacultyMember.research_interest`` is free text ("Machine learning; ML,
+Computer  Vision"). Each entry is folded (case, whitespace, punctuation) and
+resolved to one canonical ``ResearchArea``, either through a
+``ResearchAreaAlias`` row, the built-in ``COMMON_ALIASES`` or its own folded
+name, and the member is linked to the areas through the
+``FacultyMember.research_areas`` many-to-many table. Listing pages filter on
+an area's slug and count members per area with a single aggregate query over
+that indexed table instead of splitting every member's text per request.
+
+The links are refreshed when a member is saved (see ``cse_app.signals``) and
+rebuilt by ``manage.py backfill_research_areas``.
+"""
+import re
+
+from django.db.models import Count
+from django.utils.text import slugify
+
+from neu_cse.sqlite_profiles import write_transaction
+
+from .department_stats import split_research_areas
+from .models import FacultyMember, ResearchArea, ResearchAreaAlias
+
+# Abbreviations merged into their area without needing an alias row
+COMMON_ALIASES = {
+    'ai': 'Artificial Intelligence',
+    'ml': 'Machine Learning',
+    'dl': 'Deep Learning',
+    'nlp': 'Natural Language Processing',
+    'iot': 'Internet of Things',
+    'hci': 'Human-Computer Interaction',
+}
+
+_NON_WORD = re.compile(r'[^\w\s+#]', re.UNICODE)
+_SPACES = re.compile(r'\s+')
+
+# Profiles also list areas one per line or between bullets ("ML • Vision")
+_LIST_SEPARATORS = re.compile(r'[\n|\u2022\u00b7]')
+
+
+def split_interests(research_interest):
+    """Entries of a research_interest text: comma/semicolon separated, or bulleted, or one per line."""
+    return [
+        part.strip()
+        for entry in split_research_areas(research_interest)
+        for part in _LIST_SEPARATORS.split(entry)
+        if part.strip()
+    ]
+
+
+def normalize_area(name):
+    """Folded form used for matching: ' Machine-learning ' -> 'machine learning'."""
+    name = (name or '').casefold().replace('&', ' and ')
+    return _SPACES.sub(' ', _NON_WORD.sub(' ', name)).strip()[:100]
+
+
+def _display_name(name):
+    return _SPACES.sub(' ', name).strip()[:100]
+
+
+def unique_slug(name):
+    base = slugify(name)[:100] or 'area'
+    slug, n = base, 2
+    while ResearchArea.objects.filter(slug=slug).exists():
+        slug, n = f'{base}-{n}', n + 1
+    return slug
+
+
+def resolve(names, create=True):
+    """Ids of the canonical areas for ``names``, in order and without duplicates."""
+    spellings = {}
+    for name in names:
+        key = normalize_area(name)
+        if key:
+            spellings.setdefault(key, _display_name(name))
+    if not spellings:
+        return []
+
+    aliased = dict(ResearchAreaAlias.objects.filter(normalized_name__in=spellings).values_list('normalized_name', 'area_id'))
+    order = []  # area ids (from aliases) and canonical folded names, in input order
+    wanted = {}  # canonical folded name -> display name
+    for key, display in spellings.items():
+        if key in aliased:
+            order.append(aliased[key])
+            continue
+        if key in COMMON_ALIASES:
+            display = COMMON_ALIASES[key]
+            key = normalize_area(display)
+        wanted.setdefault(key, display)
+        order.append(key)
+
+    existing = dict(ResearchArea.objects.filter(normalized_name__in=wanted).values_list('normalized_name', 'id'))
+    if create:
+        for key, display in wanted.items():
+            if key not in existing:
+                area, _ = ResearchArea.objects.get_or_create(
+                    normalized_name=key, defaults={'name': display, 'slug': unique_slug(display)},
+                )
+                existing[key] = area.pk
+    ids = (existing.get(item) if isinstance(item, str) else item for item in order)
+    return list(dict.fromkeys(pk for pk in ids if pk is not None))
+
+
+def sync_faculty(member):
+    """Link ``member`` to the areas named in its ``research_interest``."""
+    member.research_areas.set(resolve(split_interests(member.research_interest)))
+
+
+def prune():
+    """Delete areas no member lists and no alias points at. Returns how many."""
+    deleted, _ = ResearchArea.objects.filter(faculty__isnull=True, aliases__isnull=True).delete()
+    return deleted
+
+
+def backfill():
+    """Relink every member. Returns ``(members, areas, links)``."""
+    members = 0
+    for member in FacultyMember.objects.only('pk', 'research_interest').iterator():
+        sync_faculty(member)
+        members += 1
+    prune()
+    return members, ResearchArea.objects.count(), FacultyMember.research_areas.through.objects.count()
+
+
+def merge(target, areas):
+    """Fold ``areas`` into ``target``: move their members and keep their names as aliases."""
+    with write_transaction():
+        for area in areas:
+            if area.pk == target.pk:
+                continue
+            target.faculty.add(*area.faculty.all())
+            area.aliases.update(area=target)
+            ResearchAreaAlias.objects.update_or_create(normalized_name=area.normalized_name, defaults={'area': target})
+            area.delete()
+
+
+def area_counts(queryset):
+    """Areas listed by the members in ``queryset``, each with ``member_count``, most common first."""
+    return (
+        ResearchArea.objects
+        .filter(faculty__in=queryset.values('pk'))
+        .only('name', 'slug')
+        .annotate(member_count=Count('faculty'))
+        .order_by('-member_count', 'name')
+    )
+
+
+def filter_by_area(queryset, slug):
+    """Members of ``queryset`` linked to the area with ``slug``."""
+    return queryset.filter(research_areas__slug=slug)
@@ -0,0 +1,176 @@
+"""
+Database routing for analytics tables and read replicas.
+
+Anonymous traffic writes page-view counters on almost every request. SQLite
+allows one writer per file, so those writes used to queue behind (and block)
+admin edits on ``db.sqlite3``. Models listed in ``ANALYTICS_MODELS`` are read,
+written and migrated on the ``analytics`` database alias instead; everything
+else stays on ``default``. Without an ``analytics`` entry in ``DATABASES`` the
+router steps aside and all models share the default database.
+
+``ReplicaRouter`` spreads reads over the ``DATABASE_REPLICAS`` aliases. Reads
+only go to a replica inside ``replica_reads``, which ``ReplicaReadMiddleware``
+opens for anonymous GET/HEAD requests outside the admin; one replica is picked
+per request. Everything else (writes, logged-in users and therefore the staff
+and faculty dashboards, management commands, sessions and auth lookups, and
+anything inside a transaction on ``default``) stays on the primary, so a user
+always reads what they just saved.
+
+Anonymous pages are also where the shared caches are filled, so a replica
+that has not caught up with a write would put the old content back into the
+cache right after the write invalidated it. ``caching.bump_version`` therefore
+calls ``pin_primary``: until the replicas have caught up, every request reads
+from the primary. SQLite replicas are plain copies and only catch up when
+``manage.py refresh_sqlite_replicas`` runs (which lifts the pin); replicas kept
+by a database server are trusted after ``REPLICA_PIN_SECONDS``.
+"""
+import random
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.urls import reverse
+
+ANALYTICS_DB = 'analytics'
+
+# app_label.model_name of every model that belongs in the analytics database
+ANALYTICS_MODELS = {
+    'cse_app.viewcount',
+    'cse_app.pageviewbucket',
+    'cse_app.uniquevisitorsketch',
+}
+
+
+def analytics_enabled():
+    return ANALYTICS_DB in settings.DATABASES
+
+
+def is_analytics_model(model):
+    return model._meta.label_lower in ANALYTICS_MODELS
+
+
+class AnalyticsRouter:
+
+    def db_for_read(self, model, **hints):
+        if is_analytics_model(model) and analytics_enabled():
+            return ANALYTICS_DB
+        return None
+
+    def db_for_write(self, model, **hints):
+        return self.db_for_read(model, **hints)
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # No foreign keys across the two databases
+        if is_analytics_model(type(obj1)) != is_analytics_model(type(obj2)):
+            return False
+        return None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        is_analytics = f'{app_label}.{model_name}' in ANALYTICS_MODELS
+        if db == ANALYTICS_DB:
+            return is_analytics
+        if is_analytics and analytics_enabled():
+            return False
+        return None
+
+
+# Apps whose rows must be read right after they are written (logins, sessions)
+PRIMARY_ONLY_APPS = {'auth', 'sessions'}
+
+_replica = ContextVar('cse_db_replica', default=None)
+
+
+# Cache key holding the time of the last write the replicas may not have yet
+PIN_KEY = 'cse:replicas:pinned'
+
+
+def replica_aliases():
+    return getattr(settings, 'DATABASE_REPLICAS', [])
+
+
+def sqlite_replicas():
+    return [
+        alias for alias in replica_aliases()
+        if settings.DATABASES.get(alias, {}).get('ENGINE') == 'django.db.backends.sqlite3'
+    ]
+
+
+def pin_primary():
+    """Read from the primary until the replicas have caught up with a write made now."""
+    if not replica_aliases():
+        return
+    # SQLite copies stay behind until the next refresh_sqlite_replicas run
+    timeout = None if sqlite_replicas() else getattr(settings, 'REPLICA_PIN_SECONDS', 30)
+    cache.set(PIN_KEY, time.time(), timeout)
+
+
+def unpin_primary(caught_up_at):
+    """Lift the pin when no write happened after ``caught_up_at`` (when the replicas were copied)."""
+    pinned = cache.get(PIN_KEY)
+    if pinned is not None and pinned <= caught_up_at:
+        cache.delete(PIN_KEY)
+
+
+def is_pinned():
+    return cache.get(PIN_KEY) is not None
+
+
+@contextmanager
+def replica_reads(alias=None):
+    """Send reads inside the block to ``alias`` (a random replica when omitted)."""
+    replicas = replica_aliases()
+    token = _replica.set(alias or (random.choice(replicas) if replicas else None))
+    try:
+        yield
+    finally:
+        _replica.reset(token)
+
+
+class ReplicaRouter:
+
+    def db_for_read(self, model, **hints):
+        replica = _replica.get()
+        if replica is None or model._meta.app_label in PRIMARY_ONLY_APPS:
+            return DEFAULT_DB_ALIAS
+        if connections[DEFAULT_DB_ALIAS].in_atomic_block:
+            return DEFAULT_DB_ALIAS
+        return replica
+
+    def db_for_write(self, model, **hints):
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        primary = {DEFAULT_DB_ALIAS, *replica_aliases()}
+        if obj1._state.db in primary and obj2._state.db in primary:
+            return True
+        return None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        # Replicas receive the primary's schema through replication
+        if db in replica_aliases():
+            return False
+        return None
+
+
+def reads_from_replica(request):
+    """Whether ``request`` may be served from a replica."""
+    if not replica_aliases() or request.method not in ('GET', 'HEAD'):
+        return False
+    if request.path.startswith(reverse('admin:index')):
+        return False
+    return not request.user.is_authenticated and not is_pinned()
+
+
+class ReplicaReadMiddleware:
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        if not reads_from_replica(request):
+            return self.get_response(request)
+        with replica_reads():
+            return self.get_response(request)
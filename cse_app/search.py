@@ -0,0 +1,142 @@
+"""
+SQLite FTS5 full-text index for notices, tech news, events and publications.
+
+One FTS5 table (``cse_search_index``, created by migration 0027) holds a
+title/body document per object. Signal handlers in ``cse_app.signals`` keep it
+in sync and ``manage.py rebuild_search_index`` recreates it from scratch.
+Queries are prefix-matched term by term and ranked with BM25, title hits
+weighted above body hits. The index is joined into the listing query itself,
+so matching, ranking and paging happen in one SQL statement with no cap on
+the number of results.
+
+On databases without FTS5 (e.g. PostgreSQL via DATABASE_URL) ``search`` returns
+``None`` and views keep their ``icontains`` filters.
+"""
+import re
+
+from django.db import connections, router
+from django.utils.html import strip_tags
+
+from .models import Event, Notice_Board, Publication, TechNews
+
+TABLE = 'cse_search_index'
+
+# BM25 column weights: kind, object_id (unindexed), title, body
+_BM25 = f'bm25({TABLE}, 0.0, 0.0, 10.0, 1.0)'
+
+_TERM_RE = re.compile(r'\w+', re.UNICODE)
+
+# Database aliases already known to have the index table
+_available_aliases = set()
+
+
+def _text(*values):
+    return ' '.join(strip_tags(value) for value in values if value)
+
+
+# kind -> (model, function returning (title, body))
+SOURCES = {
+    'notice': (Notice_Board, lambda o: (o.title, _text(o.content))),
+    'tech_news': (TechNews, lambda o: (o.title, _text(o.content, o.source))),
+    'event': (Event, lambda o: (o.title, _text(o.description, o.location, o.organizer, o.get_event_type_display()))),
+    'publication': (Publication, lambda o: (o.title, _text(o.authors, o.journal_or_conference_name, o.abstract))),
+}
+
+KIND_FOR_MODEL = {model: kind for kind, (model, _) in SOURCES.items()}
+
+
+def create_table_sql():
+    return (
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {TABLE} USING fts5("
+        f"kind UNINDEXED, object_id UNINDEXED, title, body, "
+        f"tokenize = 'unicode61 remove_diacritics 2')"
+    )
+
+
+def _connection(model):
+    return connections[router.db_for_write(model)]
+
+
+def is_available(model):
+    """True when ``model``'s database is SQLite and the index table exists."""
+    connection = _connection(model)
+    if connection.alias in _available_aliases:
+        return True
+    if connection.vendor != 'sqlite' or TABLE not in connection.introspection.table_names():
+        return False
+    _available_aliases.add(connection.alias)
+    return True
+
+
+def match_expression(query):
+    """Turn user input into an FTS5 query: every word must match as a prefix."""
+    terms = _TERM_RE.findall(query or '')
+    return ' '.join(f'"{term}"*' for term in terms)
+
+
+def index_object(obj):
+    kind = KIND_FOR_MODEL[type(obj)]
+    model, document = SOURCES[kind]
+    if not is_available(model):
+        return
+    title, body = document(obj)
+    with _connection(model).cursor() as cursor:
+        cursor.execute(f"DELETE FROM {TABLE} WHERE kind = %s AND object_id = %s", [kind, obj.pk])
+        cursor.execute(
+            f"INSERT INTO {TABLE} (kind, object_id, title, body) VALUES (%s, %s, %s, %s)",
+            [kind, obj.pk, title, body],
+        )
+
+
+def remove_object(obj):
+    kind = KIND_FOR_MODEL[type(obj)]
+    model, _ = SOURCES[kind]
+    if not is_available(model):
+        return
+    with _connection(model).cursor() as cursor:
+        cursor.execute(f"DELETE FROM {TABLE} WHERE kind = %s AND object_id = %s", [kind, obj.pk])
+
+
+def rebuild(kind=None):
+    """Recreate the index for one kind (or all of them). Returns ``{kind: rows}``."""
+    counts = {}
+    for name, (model, document) in SOURCES.items():
+        if kind and name != kind:
+            continue
+        connection = _connection(model)
+        if connection.vendor != 'sqlite':
+            continue
+        with connection.cursor() as cursor:
+            cursor.execute(create_table_sql())
+            cursor.execute(f"DELETE FROM {TABLE} WHERE kind = %s", [name])
+            rows = [(name, obj.pk, *document(obj)) for obj in model.objects.all().iterator()]
+            cursor.executemany(
+                f"INSERT INTO {TABLE} (kind, object_id, title, body) VALUES (%s, %s, %s, %s)",
+                rows,
+            )
+            cursor.execute(f"INSERT INTO {TABLE}({TABLE}) VALUES ('optimize')")
+        counts[name] = len(rows)
+    return counts
+
+
+def search(queryset, kind, query, ranked=True):
+    """Filter ``queryset`` to FTS matches for ``query``.
+
+    Returns ``None`` when the index is unavailable so the caller can fall back
+    to ``icontains``. With ``ranked`` the result is ordered by relevance (the
+    BM25 score is selected as ``search_rank``).
+    """
+    if not is_available(queryset.model):
+        return None
+    expression = match_expression(query)
+    if not expression:
+        return queryset.none()
+    opts = queryset.model._meta
+    queryset = queryset.extra(
+        tables=[TABLE],
+        where=[f'{TABLE} MATCH %s', f'{TABLE}.kind = %s', f'{TABLE}.object_id = "{opts.db_table}"."{opts.pk.column}"'],
+        params=[expression, kind],
+    )
+    if ranked:
+        queryset = queryset.extra(select={'search_rank': _BM25}, order_by=['search_rank'])
+    return queryset
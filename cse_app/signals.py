@@ -0,0 +1,291 @@
+from django.apps import apps
+from django.db.models.signals import pre_save, post_save, post_delete, m2m_changed
+from django.dispatch import receiver
+
+from .caching import bump_version
+from .image_derivatives import generate_derivatives, delete_derivatives
+from . import department_stats, faculty_profiles, page_analytics, profile_completion, projections, research_areas, search
+from .authorship import relink_faculty, sync_publication
+from .page_cache import tag_for_model
+from .routers import is_analytics_model
+from .models import (
+    CarouselItem, Notice_Board, Event, Project, Publication, TechNews,
+    ImageGallery, Chairman, DepartmentStatistics, FacultyMember, ScrollingNotice,
+    Staff, ComputerClubMember, Education, ProfessionalExperience, PublicationAuthor,
+    ResearchArea, ResearchAreaAlias,
+)
+
+
+# Models whose changes purge the cached pages tagged with them. The analytics
+# counters are written on almost every request and no cached page shows them
+CONTENT_MODELS = tuple(
+    model for model in apps.get_app_config('cse_app').get_models() if not is_analytics_model(model)
+)
+
+# Models whose rows are shown on the home page
+HOME_PAGE_MODELS = (
+    CarouselItem, Notice_Board, Event, Project, Publication, TechNews,
+    ImageGallery, Chairman, DepartmentStatistics, FacultyMember,
+)
+
+# Models with an `image` field that get responsive derivatives
+IMAGE_MODELS = (
+    CarouselItem, ImageGallery, Project, Event, TechNews,
+    FacultyMember, Staff, ComputerClubMember,
+)
+
+# Page-view counter name of each object with its own detail-page counter
+PAGE_VIEW_NAMES = {
+    Notice_Board: 'notice_{pk}',
+    TechNews: 'tech_news_{pk}',
+}
+
+# Materialized DepartmentStatistics counter for each counted model
+COUNTED_MODELS = {
+    Publication: 'computed_publications',
+    Project: 'computed_projects',
+}
+
+
+def connect(signals, handler, models):
+    """Connect ``handler`` to each of ``signals`` for each of ``models``.
+
+    A receiver without a sender runs for every model and, for delete signals,
+    makes Django delete those rows one at a time instead of in one query.
+    """
+    for signal in signals:
+        for model in models:
+            signal.connect(handler, sender=model)
+
+
+def invalidate_home_page(sender, **kwargs):
+    """Drop the cached home page context when any content it shows changes"""
+    bump_version('home')
+
+
+connect((post_save, post_delete), invalidate_home_page, HOME_PAGE_MODELS)
+
+
+def purge_tagged_pages(sender, **kwargs):
+    """Purge cached pages tagged with the model that changed"""
+    bump_version(tag_for_model(sender))
+
+
+connect((post_save, post_delete), purge_tagged_pages, CONTENT_MODELS)
+
+
+@receiver(m2m_changed)
+def purge_tagged_pages_m2m(sender, instance, model, action, **kwargs):
+    if action.startswith('post_') and instance._meta.app_label == 'cse_app':
+        bump_version(tag_for_model(type(instance)))
+        bump_version(tag_for_model(model))
+
+
+@receiver(post_save, sender=ScrollingNotice)
+@receiver(post_delete, sender=ScrollingNotice)
+def invalidate_scrolling_notice(sender, **kwargs):
+    """Publish the new ticker text to every worker"""
+    bump_version('scrolling_notice')
+
+
+@receiver(pre_save)
+def remember_image(sender, instance, raw=False, **kwargs):
+    if sender in IMAGE_MODELS and not raw and instance.pk:
+        instance._image_before = sender.objects.filter(pk=instance.pk).values_list('image', flat=True).first()
+
+
+@receiver(post_save)
+def create_image_derivatives(sender, instance, raw=False, **kwargs):
+    """Generate resized WebP copies of a newly saved image and drop those of a replaced one"""
+    if sender in IMAGE_MODELS and not raw:
+        before = getattr(instance, '_image_before', None)
+        if before and before != instance.image.name:
+            delete_derivatives(instance.image, before)
+        generate_derivatives(instance.image)
+
+
+def remove_image_derivatives(sender, instance, **kwargs):
+    delete_derivatives(instance.image)
+
+
+connect((post_delete,), remove_image_derivatives, IMAGE_MODELS)
+
+
+@receiver(post_save)
+def update_search_index(sender, instance, raw=False, **kwargs):
+    """Keep the FTS5 search index in step with notices, news, events and publications"""
+    if sender in search.KIND_FOR_MODEL and not raw:
+        search.index_object(instance)
+
+
+def remove_from_search_index(sender, instance, **kwargs):
+    search.remove_object(instance)
+
+
+connect((post_delete,), remove_from_search_index, search.KIND_FOR_MODEL)
+
+
+@receiver(pre_save)
+def fill_excerpt(sender, instance, raw=False, **kwargs):
+    """Store the plain-text excerpt listing cards show instead of the RichText body"""
+    source = projections.excerpt_source(sender)
+    if source and not raw and source not in instance.get_deferred_fields():
+        instance.excerpt = projections.excerpt(getattr(instance, source))
+
+
+@receiver(post_save, sender=Publication)
+def parse_publication_authors(sender, instance, raw=False, **kwargs):
+    """Split the free-text author list into PublicationAuthor rows"""
+    if not raw:
+        sync_publication(instance)
+
+
+@receiver(pre_save, sender=FacultyMember)
+def remember_faculty_name(sender, instance, raw=False, **kwargs):
+    if not raw:
+        instance._name_before = FacultyMember.objects.filter(pk=instance.pk).values_list('name', flat=True).first() if instance.pk else None
+
+
+@receiver(post_save, sender=FacultyMember)
+def link_faculty_authorships(sender, instance, created, raw=False, **kwargs):
+    """Relink author entries when a member is added or renamed"""
+    before = getattr(instance, '_name_before', None)
+    if not raw and (created or before != instance.name):
+        relink_faculty(instance, before)
+        # Queryset updates send no signals; co-author lists on other profiles name this member
+        faculty_profiles.invalidate_all()
+
+
+@receiver(post_save, sender=FacultyMember)
+def link_faculty_research_areas(sender, instance, raw=False, update_fields=None, **kwargs):
+    """Resolve research_interest into ResearchArea links"""
+    if not raw and (update_fields is None or 'research_interest' in update_fields):
+        research_areas.sync_faculty(instance)
+
+
+@receiver(pre_save, sender=ResearchArea)
+@receiver(pre_save, sender=ResearchAreaAlias)
+def fold_research_area_name(sender, instance, raw=False, **kwargs):
+    """Store the folded spelling the taxonomy matches on"""
+    if raw:
+        return
+    if sender is ResearchAreaAlias:
+        instance.normalized_name = research_areas.normalize_area(instance.normalized_name)
+    elif not instance.normalized_name:
+        instance.normalized_name = research_areas.normalize_area(instance.name)
+    if sender is ResearchArea and not instance.slug:
+        instance.slug = research_areas.unique_slug(instance.name)
+
+
+@receiver(post_save, sender=DepartmentStatistics)
+def compute_department_statistics(sender, instance, created, raw=False, **kwargs):
+    """Fill in the materialized counts when the statistics row is first created"""
+    if created and not raw:
+        department_stats.rebuild()
+
+
+@receiver(pre_save, sender=FacultyMember)
+def remember_faculty_statistics(sender, instance, raw=False, **kwargs):
+    if not raw:
+        instance._stats_before = department_stats.stored_faculty_state(instance.pk) if instance.pk else False
+
+
+@receiver(post_save, sender=FacultyMember)
+def update_faculty_statistics(sender, instance, raw=False, **kwargs):
+    """Adjust the faculty count (and recount areas) when a member becomes active or inactive"""
+    if not raw:
+        after = department_stats.is_counted(instance.is_current, instance.status)
+        department_stats.apply_faculty_change(getattr(instance, '_stats_before', False), after)
+
+
+@receiver(post_delete, sender=FacultyMember)
+def remove_faculty_statistics(sender, instance, **kwargs):
+    before = department_stats.is_counted(instance.is_current, instance.status)
+    department_stats.apply_faculty_change(before, False)
+
+
+@receiver(m2m_changed, sender=FacultyMember.research_areas.through)
+def recount_research_areas(sender, action, **kwargs):
+    """Recount the department's research areas when a member's area links change (including merges)"""
+    if action in ('post_add', 'post_remove', 'post_clear'):
+        department_stats.refresh_research_areas()
+
+
+@receiver(post_save, sender=ResearchArea)
+def recount_renamed_research_area(sender, instance, created, raw=False, **kwargs):
+    if not created and not raw:
+        department_stats.refresh_research_areas()
+
+
+@receiver(post_delete, sender=ResearchArea)
+def recount_deleted_research_area(sender, instance, **kwargs):
+    department_stats.refresh_research_areas()
+
+
+@receiver(post_save, sender=Publication)
+@receiver(post_save, sender=Project)
+def count_new_item(sender, instance, created, raw=False, **kwargs):
+    if created and not raw:
+        department_stats.adjust(COUNTED_MODELS[sender], 1)
+
+
+@receiver(post_delete, sender=Publication)
+@receiver(post_delete, sender=Project)
+def uncount_deleted_item(sender, instance, **kwargs):
+    department_stats.adjust(COUNTED_MODELS[sender], -1)
+
+
+@receiver(post_delete, sender=Notice_Board)
+@receiver(post_delete, sender=TechNews)
+def forget_page_views(sender, instance, **kwargs):
+    """Drop the view counter and history of a deleted notice or news item"""
+    page_analytics.forget_page(PAGE_VIEW_NAMES[sender].format(pk=instance.pk))
+
+
+@receiver(pre_save, sender=FacultyMember)
+def score_faculty_profile(sender, instance, raw=False, **kwargs):
+    """Store the profile-completion score with the member's own fields"""
+    if not raw:
+        profile_completion.apply(instance)
+
+
+# Connected before the profile-cache handlers below so the cache is dropped after the update
+@receiver(post_save, sender=Education)
+@receiver(post_delete, sender=Education)
+@receiver(post_save, sender=ProfessionalExperience)
+@receiver(post_delete, sender=ProfessionalExperience)
+def rescore_faculty_profile(sender, instance, raw=False, **kwargs):
+    if not raw:
+        profile_completion.refresh(instance.faculty_id)
+
+
+@receiver(post_save, sender=FacultyMember)
+@receiver(post_delete, sender=FacultyMember)
+def invalidate_faculty_profile(sender, instance, **kwargs):
+    """Drop the cached profile of a member whose own fields changed"""
+    faculty_profiles.invalidate(instance.pk)
+
+
+@receiver(post_save, sender=Education)
+@receiver(post_delete, sender=Education)
+@receiver(post_save, sender=ProfessionalExperience)
+@receiver(post_delete, sender=ProfessionalExperience)
+def invalidate_faculty_profile_records(sender, instance, **kwargs):
+    faculty_profiles.invalidate(instance.faculty_id)
+
+
+@receiver(post_save, sender=Project)
+@receiver(post_delete, sender=Project)
+@receiver(post_save, sender=Publication)
+@receiver(post_delete, sender=Publication)
+@receiver(post_save, sender=PublicationAuthor)
+@receiver(post_delete, sender=PublicationAuthor)
+def invalidate_shared_faculty_profiles(sender, **kwargs):
+    """Projects and publications show up on several profiles at once"""
+    faculty_profiles.invalidate_all()
+
+
+@receiver(m2m_changed, sender=Project.members.through)
+def invalidate_project_member_profiles(sender, action, **kwargs):
+    if action.startswith('post_'):
+        faculty_profiles.invalidate_all()
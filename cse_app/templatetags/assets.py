@@ -0,0 +1,28 @@
+from functools import lru_cache
+
+from django import template
+from django.contrib.staticfiles import finders
+from django.contrib.staticfiles.storage import staticfiles_storage
+from django.templatetags.static import static
+
+register = template.Library()
+
+TAILWIND_CSS = 'css/tailwind.css'
+
+
+@lru_cache(maxsize=None)
+def compiled_tailwind_url():
+    """URL of the build-time Tailwind stylesheet (content-hashed by the manifest storage), or None."""
+    if finders.find(TAILWIND_CSS) is None and not staticfiles_storage.exists(TAILWIND_CSS):
+        return None
+    try:
+        return static(TAILWIND_CSS)
+    except ValueError:
+        # Built but not collected yet; the manifest has no entry for it
+        return None
+
+
+@register.inclusion_tag('tailwind_stylesheet.html')
+def tailwind_stylesheet():
+    """Link the compiled Tailwind CSS, falling back to the CDN compiler when it hasn't been built"""
+    return {'compiled_url': compiled_tailwind_url()}
@@ -1,5 +1,7 @@
 from django import template
 
+from cse_app.image_derivatives import srcset as build_srcset
+
 register = template.Library()
 
 @register.filter
@@ -32,4 +34,15 @@ def animation_delay(counter, base_delay=100):
     try:
         return int(counter) * int(base_delay)
     except (ValueError, TypeError):
-        return 0
\ No newline at end of file
+        return 0
+
+
+@register.filter
+def srcset(image, fmt='webp'):
+    """Responsive srcset for an ImageField: srcset="{{ item.image|srcset }}" on the WebP
+    <source>, srcset="{{ item.image|srcset:'jpeg' }}" on the <img>.
+    Empty when no derivatives exist, in which case browsers use src."""
+    try:
+        return build_srcset(image, fmt)
+    except (ValueError, OSError):
+        return ''
@@ -1,3 +1,1204 @@
-from django.test import TestCase
+import hashlib
+import json
+import os
+import sqlite3
+import tempfile
+import time
+from datetime import date, timedelta
+from io import BytesIO
+from pathlib import Path
+from unittest import mock, skipUnless
+from urllib.parse import quote
 
-# Create your tests here.
+from django.conf import settings
+from django.contrib.auth.models import AnonymousUser, User
+from django.core.cache import cache
+from django.core.cache.backends.base import DEFAULT_TIMEOUT
+from django.core.exceptions import ImproperlyConfigured
+from django.core.files.base import ContentFile
+from django.core.management.base import CommandError
+from django.db import DEFAULT_DB_ALIAS, connection, connections, router, transaction
+from django.test import Client, RequestFactory, SimpleTestCase, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import URLPattern, reverse
+from django.utils import timezone
+from PIL import Image
+
+from neu_cse.database_urls import database_from_url, replica_databases
+from neu_cse.sqlite_profiles import sqlite_database, write_transaction
+
+from . import (
+    department_stats, event_schedule, faculty_profiles, facets, file_delivery, image_derivatives, page_analytics, profile_completion, projections, research_areas, routers, traffic_filter, unique_visitors,
+    search, urls as cse_urls, view_counter,
+)
+from .caching import bump_version, get_or_set, get_version
+from .management.commands.build_tailwind_css import Command as BuildTailwindCommand
+from .hyperloglog import HyperLogLog
+from .page_cache import tag_for_model
+from .models import (
+    CarouselItem, Chairman, ComputerClubMember, DepartmentStatistics, Education, Event,
+    FacultyMember, ImageGallery, Notice_Board, ProfessionalExperience, Project,
+    PageViewBucket, Publication, ResearchArea, ResearchAreaAlias, ScrollingNotice, Staff, StaffProfile, TechNews,
+    ViewCount,
+)
+
+
+# Maximum queries per route on a cold cache, with the realistic dataset below.
+# Tighten these when a view gets cheaper; a failure prints the offending SQL.
+QUERY_BUDGETS = {
+    'test_faculty_form': 3,
+    'staff_login': 0,
+    'staff_logout': 4,
+    'staff_dashboard': 12,
+    'edit_staff_profile': 4,
+    'create_notice': 2,
+    'edit_notice': 4,
+    'delete_notice': 4,
+    'create_scrolling_notice': 2,
+    'edit_scrolling_notice': 4,
+    'delete_scrolling_notice': 4,
+    'faculty_login': 0,
+    'faculty_logout': 4,
+    'faculty_dashboard': 9,
+    'edit_faculty_profile': 9,
+    'add_education': 3,
+    'edit_education': 4,
+    'delete_education': 4,
+    'add_professional_experience': 3,
+    'edit_professional_experience': 4,
+    'delete_professional_experience': 4,
+    'home': 12,
+    'notice_list': 2,
+    'notice_detail': 2,
+    'download_notice': 1,
+    'view_notice_file': 1,
+    'faculty_list': 3,
+    'staff_list': 2,
+    'faculty_detail': 6,
+    'chairman_message': 3,
+    'publications_home': 1,
+    'all_publications': 2,
+    'publication_detail': 1,
+    'projects': 0,
+    'all_projects': 2,
+    'project_detail': 3,
+    'all_tech_news': 2,
+    'detail_tech_news': 1,
+    'about': 1,
+    'events': 2,
+    'all_events': 2,
+    'event_detail': 1,
+    'why_neu_cse': 0,
+    'message_from_department': 0,
+    'message_from_chairman': 2,
+    'facilities': 0,
+    'history_neu_cse': 0,
+    'mission_vision': 0,
+    'history_neu': 0,
+    'achievements': 0,
+    'academic_programs': 0,
+    'curriculum': 0,
+    'academic_calendar': 0,
+    'active_faculty': 3,
+    'ex_chairman': 2,
+    'faculty_on_leave': 1,
+    'past_faculty': 1,
+    'officer_and_staff': 2,
+    'alumni': 0,
+    'computer_club': 1,
+    'programming_club': 0,
+    'contact_us': 0,
+    'image_gallery_home': 1,
+    'all_images': 2,
+    'page_view_beacon': 0,
+    'fallback_404': 0,
+}
+
+# Wall-clock budget per request (seconds); generous enough for a slow CI box
+TIME_BUDGET = 1.0
+
+# Routes whose views render templates that are missing from templates/
+BROKEN_TEMPLATE_ROUTES = {'chairman_message', 'events'}
+
+STAFF_ROUTES = {
+    'staff_logout', 'staff_dashboard', 'edit_staff_profile', 'create_notice', 'edit_notice',
+    'delete_notice', 'create_scrolling_notice', 'edit_scrolling_notice', 'delete_scrolling_notice',
+}
+
+FACULTY_ROUTES = {
+    'faculty_logout', 'faculty_dashboard', 'edit_faculty_profile', 'add_education', 'edit_education',
+    'delete_education', 'add_professional_experience', 'edit_professional_experience',
+    'delete_professional_experience',
+}
+
+
+@override_settings(
+    CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}},
+    # Keep page-view flushes out of the measured requests
+    VIEW_COUNTER_FLUSH_INTERVAL=10 ** 6,
+    VIEW_COUNTER_MAX_PENDING=10 ** 6,
+)
+class URLBudgetTests(TestCase):
+    """Hit every route in cse_app/urls.py against a realistic dataset and enforce
+    per-view query-count and latency budgets."""
+
+    # Budgets count queries on the content database only
+    databases = {'default', 'analytics'}
+
+    @classmethod
+    def setUpTestData(cls):
+        now = timezone.now()
+        today = date.today()
+
+        cls.staff_user = User.objects.create_user('staff', 'staff@example.com', 'pw')
+        StaffProfile.objects.create(
+            user=cls.staff_user, staff_id='S-1', designation='Officer', phone_number='017',
+            address='Netrokona', join_date=today,
+        )
+        cls.faculty_user = User.objects.create_user('faculty', 'faculty@example.com', 'pw')
+
+        designations = [choice for choice, _ in FacultyMember.DESIGNATION_CHOICES]
+        statuses = ['active', 'active', 'active', 'on_leave', 'past_faculty']
+        faculty = []
+        for i in range(30):
+            faculty.append(FacultyMember.objects.create(
+                user=cls.faculty_user if i == 0 else None,
+                name=f'Faculty Member {i}',
+                designation=designations[i % len(designations)],
+                status=statuses[i % len(statuses)],
+                email=f'f{i}@example.com',
+                image=f'faculty/seed_{i}.jpg',
+                research_interest='Machine Learning, Computer Vision; Networks',
+                bio='<p>Bio</p>' * 20,
+                publications='<p>Paper</p>' * 50,
+                joined_date=today - timedelta(days=100 * i),
+                end_date=today if i % 5 == 4 else None,
+            ))
+        cls.faculty = faculty[0]
+        for member in faculty:
+            for j in range(3):
+                Education.objects.create(
+                    faculty=member, degree_name=f'Degree {j}', major_subject='CSE',
+                    board_institute='University', passing_year=2000 + j, order=j,
+                )
+                ProfessionalExperience.objects.create(
+                    faculty=member, position_title=f'Position {j}', organization='Org',
+                    start_date=today - timedelta(days=365 * (j + 1)), order=j,
+                )
+        cls.education = cls.faculty.educations.first()
+        cls.experience = cls.faculty.professional_experiences.first()
+
+        Chairman.objects.create(faculty=faculty[1], message='<p>Welcome</p>', from_date=today, is_current=True)
+        Chairman.objects.create(faculty=faculty[2], message='<p>Former</p>', from_date=today - timedelta(days=900),
+                                to_date=today - timedelta(days=1), is_current=False)
+        DepartmentStatistics.objects.create()
+        ScrollingNotice.objects.create(text='Admission open', created_by=cls.staff_user)
+        cls.scrolling_notice = ScrollingNotice.objects.get()
+
+        for i in range(60):
+            Notice_Board.objects.create(
+                title=f'Notice {i} exam routine', content='<p>Details</p>' * 30,
+                is_important=i % 7 == 0, created_by=cls.staff_user,
+            )
+        cls.notice = Notice_Board.objects.first()
+
+        for i in range(20):
+            Publication.objects.create(
+                title=f'Paper {i}', authors=f'Faculty Member {i % 30}, Faculty Member {(i + 1) % 30}',
+                publication_type='journal', publication_date=today - timedelta(days=30 * i),
+                abstract='Abstract ' * 50,
+            )
+            TechNews.objects.create(
+                title=f'News {i}', content='<p>News body</p>' * 30, image=f'tech_news/seed_{i}.jpg',
+                published_date=now - timedelta(days=i),
+            )
+            Event.objects.create(
+                title=f'Event {i}', description='<p>Event</p>' * 30, event_type='seminar',
+                start_date=now + timedelta(days=i - 10), end_date=now + timedelta(days=i - 10, hours=3),
+                location='Campus', image=f'events/seed_{i}.jpg',
+            )
+        cls.publication = Publication.objects.first()
+        cls.news = TechNews.objects.first()
+        cls.event = Event.objects.first()
+
+        for i in range(15):
+            project = Project.objects.create(
+                title=f'Project {i}', description='<p>Project</p>' * 30, project_type='research',
+                start_date=today - timedelta(days=40 * i), image=f'projects/seed_{i}.jpg',
+            )
+            project.members.set(faculty[i:i + 3])
+        cls.project = Project.objects.first()
+
+        for i in range(12):
+            ImageGallery.objects.create(title=f'Image {i}', image=f'gallery/seed_{i}.jpg')
+        for i in range(3):
+            CarouselItem.objects.create(title=f'Slide {i}', description='Slide', image=f'carousel/seed_{i}.jpg', order=i)
+        for i in range(10):
+            Staff.objects.create(name=f'Staff {i}', staff_type='staff', designation='Assistant', image=f'staff/seed_{i}.jpg')
+        positions = [position for position, _ in ComputerClubMember.POSITION_CHOICES]
+        for i in range(10):
+            ComputerClubMember.objects.create(name=f'Member {i}', session='2023-24', position=positions[i])
+
+    def setUp(self):
+        cache.clear()
+
+    def tearDown(self):
+        # Write buffered hits to the test database, not the real one at exit
+        view_counter.flush()
+
+    def _kwargs_for(self, name):
+        pk_map = {
+            'edit_notice': self.notice.pk, 'delete_notice': self.notice.pk,
+            'edit_scrolling_notice': self.scrolling_notice.pk, 'delete_scrolling_notice': self.scrolling_notice.pk,
+            'edit_education': self.education.pk, 'delete_education': self.education.pk,
+            'edit_professional_experience': self.experience.pk, 'delete_professional_experience': self.experience.pk,
+            'notice_detail': self.notice.pk, 'download_notice': self.notice.pk, 'view_notice_file': self.notice.pk,
+            'faculty_detail': self.faculty.pk, 'publication_detail': self.publication.pk,
+            'detail_tech_news': self.news.pk,
+        }
+        if name in pk_map:
+            return {'pk': pk_map[name]}
+        if name == 'project_detail':
+            return {'project_id': self.project.pk}
+        if name == 'event_detail':
+            return {'event_id': self.event.pk}
+        return {}
+
+    def _url_for(self, pattern):
+        if pattern.name == 'fallback_404':
+            return '/this-page-does-not-exist/'
+        return reverse(pattern.name, kwargs=self._kwargs_for(pattern.name))
+
+    def _client_for(self, name):
+        client = Client(raise_request_exception=name not in BROKEN_TEMPLATE_ROUTES)
+        if name in STAFF_ROUTES:
+            client.force_login(self.staff_user)
+        elif name in FACULTY_ROUTES:
+            client.force_login(self.faculty_user)
+        return client
+
+    def test_every_route_has_a_budget(self):
+        names = {p.name for p in cse_urls.urlpatterns if isinstance(p, URLPattern)}
+        self.assertEqual(names - set(QUERY_BUDGETS), set(), 'Add a query budget for new routes')
+
+    def test_query_and_time_budgets(self):
+        seen = set()
+        for pattern in cse_urls.urlpatterns:
+            if pattern.name in seen:
+                continue
+            seen.add(pattern.name)
+            with self.subTest(route=pattern.name):
+                self._check_route(pattern)
+
+    def _check_route(self, pattern):
+        client = self._client_for(pattern.name)
+        url = self._url_for(pattern)
+        cache.clear()
+
+        with CaptureQueriesContext(connection) as queries:
+            start = time.perf_counter()
+            response = client.get(url)
+            elapsed = time.perf_counter() - start
+
+        if pattern.name in BROKEN_TEMPLATE_ROUTES:
+            # handler500 renders the custom 404 page
+            self.assertEqual(response.status_code, 404)
+        else:
+            self.assertLess(response.status_code, 500, f'{url} failed')
+
+        budget = QUERY_BUDGETS[pattern.name]
+        if len(queries) > budget:
+            sql = '\n'.join(f"  {i}. {q['sql']}" for i, q in enumerate(queries.captured_queries, 1))
+            self.fail(f'{url} ran {len(queries)} queries (budget {budget}):\n{sql}')
+        self.assertLessEqual(elapsed, TIME_BUDGET, f'{url} took {elapsed:.3f}s (budget {TIME_BUDGET}s)')
+
+    def test_warm_public_pages_need_no_queries(self):
+        # Second anonymous hit is served from the page cache
+        client = Client()
+        for name in ('home', 'notice_list', 'active_faculty', 'all_events', 'about'):
+            with self.subTest(route=name):
+                url = reverse(name)
+                client.get(url)
+                with CaptureQueriesContext(connection) as queries:
+                    client.get(url)
+                self.assertEqual(len(queries), 0, [q['sql'] for q in queries.captured_queries])
+
+
+class DepartmentStatisticsTests(TestCase):
+    """The materialized counts follow faculty, publication and project changes."""
+
+    def setUp(self):
+        self.stats = department_stats.load()
+
+    def assertMatchesRecount(self):
+        self.assertEqual(department_stats.verify(), {})
+
+    def test_faculty_changes_adjust_counts(self):
+        member = FacultyMember.objects.create(name='A', designation='lecturer', research_interest='AI, Networks')
+        FacultyMember.objects.create(name='B', designation='lecturer', research_interest='Networks')
+        self.stats.refresh_from_db()
+        self.assertEqual((self.stats.computed_faculty, self.stats.computed_research_areas), (2, 2))
+
+        member.research_interest = 'Security'
+        member.save()
+        self.stats.refresh_from_db()
+        self.assertEqual(self.stats.research_area_counts, {'Networks': 1, 'Security': 1})
+
+        member.status = 'on_leave'
+        member.save()
+        self.stats.refresh_from_db()
+        self.assertEqual((self.stats.computed_faculty, self.stats.computed_research_areas), (1, 1))
+        self.assertMatchesRecount()
+
+        FacultyMember.objects.all().delete()
+        self.stats.refresh_from_db()
+        self.assertEqual((self.stats.computed_faculty, self.stats.research_area_counts), (0, {}))
+
+    def test_research_areas_are_canonical(self):
+        FacultyMember.objects.create(name='A', designation='lecturer', research_interest='Machine Learning • Networks')
+        member = FacultyMember.objects.create(name='B', designation='lecturer', research_interest='machine-learning, ML')
+        FacultyMember.objects.create(name='C', designation='lecturer', research_interest='Wireless Networks')
+        self.stats.refresh_from_db()
+        self.assertEqual(self.stats.research_area_counts, {'Machine Learning': 2, 'Networks': 1, 'Wireless Networks': 1})
+
+        research_areas.merge(ResearchArea.objects.get(slug='networks'), [ResearchArea.objects.get(slug='wireless-networks')])
+        self.stats.refresh_from_db()
+        self.assertEqual((self.stats.computed_research_areas, self.stats.research_area_counts['Networks']), (2, 2))
+        member.research_interest = ''
+        member.save()
+        self.stats.refresh_from_db()
+        self.assertEqual(self.stats.research_area_counts['Machine Learning'], 1)
+        self.assertMatchesRecount()
+
+    def test_publication_and_project_counts(self):
+        Publication.objects.create(title='P', authors='X', publication_type='journal', publication_date=date.today())
+        project = Project.objects.create(title='Q', description='Q', project_type='research', start_date=date.today())
+        self.stats.refresh_from_db()
+        self.assertEqual((self.stats.computed_publications, self.stats.computed_projects), (1, 1))
+        project.delete()
+        self.assertMatchesRecount()
+
+    def test_manual_values_override_computed(self):
+        FacultyMember.objects.create(name='A', designation='lecturer')
+        self.stats.refresh_from_db()
+        self.stats.total_faculty = 12
+        self.assertEqual(self.stats.get_display_values()['total_faculty'], 12)
+        self.stats.total_faculty = 0
+        self.assertEqual(self.stats.get_display_values()['total_faculty'], 1)
+
+
+class AnalyticsRoutingTests(TestCase):
+    databases = {'default', 'analytics'}
+
+    def test_view_counts_live_in_the_analytics_database(self):
+        self.assertEqual(router.db_for_write(ViewCount), 'analytics')
+        self.assertEqual(router.db_for_read(Notice_Board), 'default')
+        self.assertFalse(router.allow_migrate('default', 'cse_app', model_name='viewcount'))
+        self.assertFalse(router.allow_migrate('analytics', 'cse_app', model_name='notice_board'))
+
+    def test_flush_writes_nothing_to_the_content_database(self):
+        view_counter.record_view('home', 3)
+        with CaptureQueriesContext(connections['default']) as content, \
+                CaptureQueriesContext(connections['analytics']) as analytics:
+            view_counter.flush()
+        self.assertEqual(len(content), 0)
+        self.assertGreater(len(analytics), 0)
+        self.assertEqual(ViewCount.objects.get(page_name='home').count, 3)
+
+
+class FileDeliveryTests(TestCase):
+
+    def setUp(self):
+        media = tempfile.TemporaryDirectory()
+        self.addCleanup(media.cleanup)
+        self.enterContext(override_settings(MEDIA_ROOT=media.name))
+        self.notice = Notice_Board.objects.create(
+            title='Routine', content='x', file=ContentFile(b'0123456789' * 10, name='exam routine ২০২৫.pdf'),
+        )
+        self.factory = RequestFactory()
+
+    def _serve(self, **headers):
+        return file_delivery.serve_file(self.factory.get('/', headers=headers), self.notice.file)
+
+    def test_full_file(self):
+        response = self._serve()
+        self.assertEqual((response.status_code, response['Content-Length'], response['Accept-Ranges']), (200, '100', 'bytes'))
+        self.assertEqual(b''.join(response.streaming_content), b'0123456789' * 10)
+
+    def test_byte_ranges(self):
+        response = self._serve(Range='bytes=10-19')
+        self.assertEqual((response.status_code, response['Content-Range']), (206, 'bytes 10-19/100'))
+        self.assertEqual(b''.join(response.streaming_content), b'0123456789')
+        response = self._serve(Range='bytes=-5')
+        self.assertEqual((response['Content-Range'], b''.join(response.streaming_content)), ('bytes 95-99/100', b'56789'))
+        response = self._serve(Range='bytes=100-')
+        self.assertEqual((response.status_code, response['Content-Range']), (416, 'bytes */100'))
+        self.assertEqual(self._serve(Range='bytes=0-1,5-6').status_code, 200)  # multi-range: whole file
+
+    def test_if_range_and_revalidation(self):
+        etag = self._serve()['ETag']
+        self.assertEqual(self._serve(Range='bytes=0-9', If_Range=etag).status_code, 206)
+        self.assertEqual(self._serve(Range='bytes=0-9', If_Range='"stale"').status_code, 200)
+        self.assertEqual(self._serve(If_None_Match=etag).status_code, 304)
+
+    def test_front_server_headers_are_percent_encoded(self):
+        name = self.notice.file.name
+        with override_settings(FILE_DELIVERY_BACKEND='nginx', FILE_DELIVERY_ACCEL_PREFIX='/protected-media/'):
+            accel = self._serve()['X-Accel-Redirect']
+        self.assertEqual(accel, '/protected-media/' + quote(name))
+        self.assertTrue(accel.isascii())
+        with override_settings(FILE_DELIVERY_BACKEND='apache'):
+            self.assertEqual(self._serve()['X-Sendfile'], quote(self.notice.file.path))
+
+
+@override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}})
+class FacultyProfileTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.member = FacultyMember.objects.create(name='Md. Anwarul Islam', designation='lecturer', email='a@example.com')
+        for j in range(4):
+            Education.objects.create(
+                faculty=cls.member, degree_name=f'Degree {j}', major_subject='CSE',
+                board_institute='University', passing_year=2000 + j, order=j,
+            )
+        project = Project.objects.create(title='Vision', description='<p>x</p>', project_type='research',
+                                         start_date=date.today())
+        project.members.add(cls.member)
+        Publication.objects.create(title='Paper', authors='Md. Anwarul Islam', publication_type='journal',
+                                   publication_date=date.today())
+
+    def setUp(self):
+        cache.clear()
+
+    def test_profile_loads_in_fixed_queries_and_is_cached(self):
+        with self.assertNumQueries(6):
+            member = faculty_profiles.load(self.member.pk)
+        with self.assertNumQueries(0):
+            member = faculty_profiles.load(self.member.pk)
+            self.assertFalse(FacultyMember.user.is_cached(member))  # no password hash in the cache
+            self.assertEqual(member.educations.count(), 4)
+            self.assertEqual([project.title for project in member.projects.all()], ['Vision'])
+            self.assertEqual([publication.title for publication in member.authored_publications], ['Paper'])
+
+    def test_changes_bump_the_cached_profile(self):
+        faculty_profiles.load(self.member.pk)
+        Education.objects.create(faculty=self.member, degree_name='PhD', major_subject='CSE',
+                                 board_institute='University', passing_year=2020, order=9)
+        self.assertEqual(len(faculty_profiles.load(self.member.pk).educations.all()), 5)
+        Project.objects.update(title='Renamed')  # queryset updates send no signals
+        Project.objects.get().save()
+        self.assertEqual(faculty_profiles.load(self.member.pk).projects.all()[0].title, 'Renamed')
+
+    def test_detail_page(self):
+        with self.assertNumQueries(6):
+            response = Client().get(reverse('faculty_detail', args=[self.member.pk]))
+        self.assertContains(response, 'Degree 3')
+        self.assertEqual(Client().get(reverse('faculty_detail', args=[self.member.pk + 100])).status_code, 404)
+
+    def test_cached_detail_page_follows_publication_edits(self):
+        FacultyMember.objects.create(name='Kohinur Parvin', designation='lecturer')
+        url = reverse('faculty_detail', args=[self.member.pk])
+        self.assertNotContains(Client().get(url), 'Kohinur Parvin')
+        publication = Publication.objects.get()
+        publication.authors = 'Md. Anwarul Islam, Kohinur Parvin'
+        publication.save()
+        self.assertContains(Client().get(url), 'Kohinur Parvin <span class="opacity-75">(1)</span>')
+
+    def test_renames_relink_only_the_names_involved(self):
+        other = FacultyMember.objects.create(name='Kohinur Parvin', designation='lecturer')
+        Publication.objects.create(title='Joint', authors='Md. Anwarul Islam and K. Parvin', publication_type='journal',
+                                   publication_date=date.today())
+        self.assertEqual(faculty_profiles.load(self.member.pk).co_authors, [])
+        other.name = 'K. Parvin'
+        other.save()
+        co_authors = faculty_profiles.load(self.member.pk).co_authors
+        self.assertEqual([(member.name, member.shared_publications) for member in co_authors], [('K. Parvin', 1)])
+        self.assertContains(Client().get(reverse('faculty_detail', args=[self.member.pk])), 'K. Parvin <span class="opacity-75">(1)</span>')
+        with CaptureQueriesContext(connection) as queries:
+            other.room_no = '301'
+            other.save()
+        self.assertFalse([query for query in queries if 'publicationauthor' in query['sql']])
+
+
+@override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}})
+class ResearchAreaTests(TestCase):
+
+    def setUp(self):
+        cache.clear()
+
+    def test_interests_are_folded_and_merged(self):
+        a = FacultyMember.objects.create(name='A', designation='lecturer', research_interest='Machine Learning; Computer  Vision')
+        b = FacultyMember.objects.create(name='B', designation='lecturer', research_interest='machine-learning, ML, IoT')
+        self.assertEqual(ResearchArea.objects.count(), 3)
+        self.assertEqual(sorted(b.research_areas.values_list('name', flat=True)), ['Internet of Things', 'Machine Learning'])
+        self.assertEqual(ResearchArea.objects.get(slug='computer-vision').name, 'Computer Vision')
+        a.research_interest = 'Computer Vision'
+        a.save()
+        self.assertEqual(list(a.research_areas.values_list('slug', flat=True)), ['computer-vision'])
+
+    def test_aliases_and_merge(self):
+        member = FacultyMember.objects.create(name='A', designation='lecturer', research_interest='Cyber Security')
+        other = FacultyMember.objects.create(name='B', designation='lecturer', research_interest='Information Security')
+        target = ResearchArea.objects.get(slug='cyber-security')
+        research_areas.merge(target, [ResearchArea.objects.get(slug='information-security')])
+        self.assertEqual(list(other.research_areas.all()), [target])
+        ResearchAreaAlias.objects.create(area=target, normalized_name='  Network Security ')
+        member.research_interest = 'network security; Information security'
+        member.save()
+        self.assertEqual(list(member.research_areas.all()), [target])
+        self.assertEqual(ResearchArea.objects.count(), 1)
+
+    def test_area_filter_and_counts(self):
+        FacultyMember.objects.create(name='A', designation='lecturer', research_interest='AI, Networks')
+        FacultyMember.objects.create(name='B', designation='lecturer', research_interest='Networks')
+        FacultyMember.objects.create(name='C', designation='lecturer', research_interest='AI', status='on_leave')
+        response = Client().get(reverse('active_faculty'))
+        counts = [(area.name, area.member_count) for area in response.context['research_areas']]
+        self.assertEqual(counts, [('Networks', 2), ('Artificial Intelligence', 1)])
+        response = Client().get(reverse('active_faculty'), {'area': 'artificial-intelligence'})
+        self.assertEqual([member.name for member in response.context['faculty_members']], ['A'])
+        self.assertEqual(DepartmentStatistics.objects.create().get_research_areas_count(), 2)
+
+
+@override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}})
+class FacetTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        for name, designation, status in (
+            ('A', 'professor', 'active'), ('B', 'lecturer', 'active'),
+            ('C', 'lecturer', 'active'), ('D', 'lecturer', 'on_leave'),
+        ):
+            FacultyMember.objects.create(name=name, designation=designation, status=status)
+
+    def setUp(self):
+        cache.clear()
+
+    def _facet(self, **params):
+        request = RequestFactory().get('/', params)
+        return facets.faceted(request, FacultyMember.objects.order_by('name'), facets.FACULTY_FACETS, {'status': 'active'})
+
+    def test_counts_respect_the_other_selections(self):
+        members, values, filters = self._facet(designation='lecturer')
+        values = {facet['param']: facet['options'] for facet in values}
+        self.assertEqual(filters, {'status': 'active', 'designation': 'lecturer'})
+        self.assertEqual([member.name for member in members], ['B', 'C'])
+        self.assertEqual({o['value']: o['count'] for o in values['status']}, {'active': 2, 'on_leave': 1})
+        self.assertEqual({o['value']: o['count'] for o in values['designation']}, {'professor': 1, 'lecturer': 2})
+        self.assertEqual([o['label'] for o in values['designation'] if o['selected']], ['Lecturer'])
+
+    def test_counts_are_cached_across_filter_combinations(self):
+        with self.assertNumQueries(1):
+            self._facet()
+        with self.assertNumQueries(0):
+            _, values, _ = self._facet(status='all', member_type='full_time')
+        member_type = values[2]
+        self.assertEqual((member_type['title'], member_type['total']), ('Member type', 4))
+        self.assertEqual(member_type['options'], [{'value': 'full_time', 'label': 'Full-time', 'count': 4, 'selected': True,
+                                                   'query': 'status=all&member_type=full_time'}])
+        FacultyMember.objects.create(name='E', designation='professor')
+        _, values, _ = self._facet()
+        self.assertEqual({o['value']: o['count'] for o in values[1]['options']}, {'professor': 2, 'lecturer': 2})
+
+    def test_directory_pages_render_the_counts(self):
+        response = self.client.get(reverse('active_faculty'), {'designation': 'lecturer'})
+        self.assertContains(response, 'data-facet="designation"')
+        self.assertContains(response, 'href="?designation=all"')
+        self.assertContains(response, '>All <span class="opacity-75">(3)</span>')
+        self.assertContains(response, '>Lecturer <span class="opacity-75">(2)</span>')
+        self.assertNotContains(response, 'data-facet="status"')
+        self.assertEqual([member.name for member in response.context['faculty_members']], ['B', 'C'])
+
+        response = self.client.get(reverse('faculty_list'), {'status': 'all'})
+        self.assertContains(response, '>On Leave <span class="opacity-75">(1)</span>')
+
+        Staff.objects.create(name='S', designation='Officer', staff_type='officer', status='active')
+        Staff.objects.create(name='T', designation='Clerk', staff_type='staff', status='on_leave')
+        response = self.client.get(reverse('officer_and_staff'))
+        self.assertContains(response, 'data-facet="type"')
+        self.assertEqual(len(response.context['staff_members']), 2)
+        response = self.client.get(reverse('staff_list'))
+        self.assertEqual([staff.name for staff in response.context['staff_members']], ['S'])
+
+
+@override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}})
+class EventScheduleTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        now = timezone.now()
+        for title, days in (('Old', -30), ('Recent', -2), ('Ongoing', 0), ('Soon', 3), ('Later', 9)):
+            Event.objects.create(title=title, description='<p>x</p>', event_type='seminar', location='Campus',
+                                 start_date=now + timedelta(days=days, hours=-1),
+                                 end_date=now + timedelta(days=days, hours=2))
+
+    def test_listings_follow_the_clock_not_the_flag(self):
+        Event.objects.update(is_upcoming=True)  # flags left stale since saving
+        self.assertEqual([e.title for e in event_schedule.upcoming()], ['Ongoing', 'Soon', 'Later'])
+        self.assertEqual([e.title for e in event_schedule.past()], ['Recent', 'Old'])
+        later = timezone.now() + timedelta(days=5)
+        self.assertEqual([e.title for e in event_schedule.upcoming(now=later)], ['Later'])
+
+    def test_listings_read_the_start_date_index_without_sorting(self):
+        for listing in (event_schedule.upcoming(), event_schedule.past()):
+            plan = listing.explain()
+            self.assertIn('cse_app_eve_start_d_5dfb47_idx', plan)
+            self.assertNotIn('TEMP B-TREE', plan)
+
+    @override_settings(HOME_PAGE_CACHE_TIMEOUT=60, PAGE_CACHE_TIMEOUT=600)
+    def test_cached_home_page_expires_with_the_home_timeout(self):
+        with mock.patch.object(cache, 'set', wraps=cache.set) as cache_set:
+            self.assertEqual(Client().get(reverse('home')).status_code, 200)
+        timeouts = {call.args[0].split(':')[2].split('.')[-1]: call.args[2]
+                    for call in cache_set.call_args_list if call.args[0].startswith('cse:page:')}
+        self.assertEqual(timeouts, {'home': 60})
+
+    def test_home_selection_is_one_query(self):
+        with self.assertNumQueries(1):
+            self.assertEqual([e.title for e in event_schedule.upcoming_then_recent(limit=3)], ['Ongoing', 'Soon', 'Later'])
+        later = timezone.now() + timedelta(days=5)
+        with self.assertNumQueries(1):
+            titles = [e.title for e in event_schedule.upcoming_then_recent(limit=3, now=later)]
+        self.assertEqual(titles, ['Later', 'Soon', 'Ongoing'])
+
+    def test_sweep_rewrites_stale_flags(self):
+        Event.objects.update(is_upcoming=True)
+        Event.objects.filter(title='Later').update(is_upcoming=False)
+        self.assertEqual(event_schedule.sweep(), (2, 1))
+        self.assertEqual(sorted(Event.objects.filter(is_upcoming=True).values_list('title', flat=True)),
+                         ['Later', 'Ongoing', 'Soon'])
+        self.assertEqual(event_schedule.sweep(), (0, 0))
+
+
+class ProfileCompletionTests(TestCase):
+
+    def test_score_is_stored_on_save(self):
+        member = FacultyMember.objects.create(name='Nadia Rahman', designation='lecturer', email='n@example.com')
+        self.assertEqual(member.profile_completion, 13)  # name and email of 15 checks
+        self.assertIn('educations', member.profile_missing)
+        member.phone = '01700000000'
+        member.research_gate_url = 'https://example.com/rg'
+        member.orcid_url = 'https://example.com/orcid'
+        member.save()
+        member.refresh_from_db()
+        self.assertEqual(member.profile_completion, 26)
+        self.assertNotIn('links', member.profile_missing)
+
+    def test_related_records_rescore_the_member(self):
+        member = FacultyMember.objects.create(name='Nadia Rahman', designation='lecturer', email='n@example.com')
+        education = Education.objects.create(faculty=member, degree_name='BSc', major_subject='CSE',
+                                             board_institute='University', passing_year=2010)
+        ProfessionalExperience.objects.create(faculty=member, organization='NEU', position_title='Lecturer',
+                                              start_date=date.today())
+        member.refresh_from_db()
+        self.assertEqual(member.profile_completion, 26)
+        self.assertNotIn('experiences', member.profile_missing)
+        education.delete()
+        member.refresh_from_db()
+        self.assertIn('educations', member.profile_missing)
+        self.assertEqual(profile_completion.labels(member.profile_missing)[-1], 'Education records')
+
+    def test_admin_filter_buckets(self):
+        from .admin import ProfileCompletionFilter
+        FacultyMember.objects.create(name='A', designation='lecturer')
+        FacultyMember.objects.filter(name='A').update(profile_completion=100)
+        FacultyMember.objects.create(name='B', designation='lecturer')
+        for value, names in (('complete', ['A']), ('low', ['B'])):
+            bucket = ProfileCompletionFilter(None, {'completion': [value]}, FacultyMember, None)
+            self.assertEqual([m.name for m in bucket.queryset(None, FacultyMember.objects.order_by('name'))], names)
+
+@override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}})
+class KeysetPaginationTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        now = timezone.now()
+        for i in range(17):
+            notice = Notice_Board.objects.create(title=f'Notice {i}', content='x')
+            # Pairs share a timestamp so the id tie-breaker matters
+            Notice_Board.objects.filter(pk=notice.pk).update(created_at=now - timedelta(hours=i // 2))
+        cls.expected = list(Notice_Board.objects.order_by('-created_at', '-pk').values_list('pk', flat=True))
+
+    def setUp(self):
+        cache.clear()  # no full-page cache hits
+
+    def _page(self, **params):
+        response = Client().get(reverse('notice_list'), params)
+        self.assertEqual(response.status_code, 200)
+        return response.context['page_obj']
+
+    def test_cursors_walk_the_listing_both_ways(self):
+        seen = []
+        page = self._page()
+        while True:
+            seen.extend(notice.pk for notice in page)
+            if not page.has_next():
+                break
+            self.assertIn('cursor=', page.next_query)
+            page = self._page(cursor=page.next_cursor)
+        self.assertEqual(seen, self.expected)
+        self.assertEqual(page.number, 3)
+        back = self._page(cursor=page.previous_cursor)
+        self.assertEqual([notice.pk for notice in back], self.expected[7:14])
+        self.assertEqual(back.number, 2)
+        self.assertEqual(back.previous_query, '')
+
+    def test_page_numbers_and_bad_cursors(self):
+        self.assertEqual([notice.pk for notice in self._page(page=2)], self.expected[7:14])
+        self.assertEqual(self._page(page=99).number, 3)
+        self.assertEqual([notice.pk for notice in self._page(cursor='forged')], self.expected[:7])
+
+    def test_seek_has_no_offset_and_total_is_cached(self):
+        first = self._page()
+        self.assertEqual(first.paginator.count, 17)
+        with CaptureQueriesContext(connection) as queries:
+            page = self._page(cursor=first.next_cursor)
+        self.assertEqual(len(queries), 1)
+        self.assertNotIn('OFFSET', queries[0]['sql'])
+        self.assertEqual(page.paginator.count, 17)
+        Notice_Board.objects.create(title='New', content='x')
+        self.assertEqual(self._page().paginator.count, 18)
+
+@override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}})
+class SearchTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.body_hit = Notice_Board.objects.create(title='Lab schedule', content='<p>Exam rooms are listed below.</p>')
+        cls.title_hit = Notice_Board.objects.create(title='Exam routine', content='<p>Mid-term.</p>')
+        for i in range(600):
+            Notice_Board.objects.create(title=f'Notice {i}', content='<p>Semester exam hall</p>')
+
+    def setUp(self):
+        cache.clear()
+
+    def test_rank_is_computed_in_the_listing_query(self):
+        if not search.is_available(Notice_Board):
+            self.skipTest('SQLite FTS5 index not available')
+        with CaptureQueriesContext(connection) as queries:
+            results = list(search.search(Notice_Board.objects.all(), 'notice', 'exa')[:2])
+        self.assertEqual(len(queries), 1)
+        self.assertIn('bm25', queries[0]['sql'])
+        self.assertEqual(results[0], self.title_hit)
+        self.assertLess(results[0].search_rank, results[1].search_rank)
+
+    def test_every_match_is_paged(self):
+        if not search.is_available(Notice_Board):
+            self.skipTest('SQLite FTS5 index not available')
+        page = Client().get(reverse('notice_list'), {'search': 'exam', 'page': 86}).context['page_obj']
+        self.assertEqual(page.paginator.count, 602)
+        self.assertEqual(page.number, 86)
+        self.assertEqual(len(page), 602 - 85 * 7)
+        self.assertEqual(list(search.search(Notice_Board.objects.all(), 'notice', '!!')), [])
+
+
+@override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}})
+class ImageDerivativeTests(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        media = tempfile.TemporaryDirectory()
+        self.addCleanup(media.cleanup)
+        self.enterContext(override_settings(MEDIA_ROOT=media.name, IMAGE_DERIVATIVE_WIDTHS=(320, 640)))
+
+    def _upload(self, name):
+        buffer = BytesIO()
+        Image.new('RGB', (800, 600), 'green').save(buffer, 'JPEG')
+        return ContentFile(buffer.getvalue(), name=name)
+
+    def test_srcset_ends_with_the_original(self):
+        staff = Staff.objects.create(name='S', designation='Officer', image=self._upload('photo.jpg'))
+        self.assertEqual(
+            image_derivatives.srcset(staff.image),
+            '/media/derivatives/staff/photo-320w.webp 320w, /media/derivatives/staff/photo-640w.webp 640w, '
+            '/media/staff/photo.jpg 800w',
+        )
+        # Browsers without WebP get the same widths as JPEG
+        self.assertEqual(
+            image_derivatives.srcset(staff.image, 'jpeg'),
+            '/media/derivatives/staff/photo-320w.jpg 320w, /media/derivatives/staff/photo-640w.jpg 640w, '
+            '/media/staff/photo.jpg 800w',
+        )
+
+    def test_transparent_uploads_get_jpeg_fallbacks(self):
+        buffer = BytesIO()
+        Image.new('RGBA', (800, 600), (0, 0, 0, 0)).save(buffer, 'PNG')
+        staff = Staff.objects.create(name='S', designation='Officer', image=ContentFile(buffer.getvalue(), name='logo.png'))
+        with staff.image.storage.open('derivatives/staff/logo-320w.jpg') as fh:
+            fallback = Image.open(fh)
+            self.assertEqual((fallback.format, fallback.getpixel((0, 0))), ('JPEG', (255, 255, 255)))
+
+    def test_pages_offer_webp_with_a_jpeg_img(self):
+        Staff.objects.create(name='S', designation='Officer', image=self._upload('photo.jpg'))
+        response = Client().get(reverse('officer_and_staff'))
+        self.assertContains(response, '<source type="image/webp" srcset="/media/derivatives/staff/photo-320w.webp 320w')
+        self.assertContains(response, 'srcset="/media/derivatives/staff/photo-320w.jpg 320w')
+
+    def test_existing_derivatives_skip_decoding_and_replaced_ones_are_deleted(self):
+        staff = Staff.objects.create(name='S', designation='Officer', image=self._upload('photo.jpg'))
+        with mock.patch.object(Image.Image, 'load') as load:
+            staff.save()
+        load.assert_not_called()
+        staff.image = self._upload('new.jpg')
+        staff.save()
+        storage = staff.image.storage
+        self.assertFalse(storage.exists('derivatives/staff/photo-320w.webp'))
+        self.assertFalse(storage.exists('derivatives/staff/photo-320w.jpg'))
+        self.assertTrue(storage.exists('derivatives/staff/new-320w.webp'))
+        self.assertTrue(storage.exists('derivatives/staff/new-320w.jpg'))
+
+
+@override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}})
+class ListProjectionTests(TestCase):
+
+    def test_excerpt_is_stored_on_save(self):
+        notice = Notice_Board.objects.create(title='Exam', content='<p>Mid-term&nbsp;exams   <b>start</b> Monday.</p>')
+        self.assertEqual(notice.excerpt, 'Mid-term exams start Monday.')
+        notice.content = '<p>' + 'word ' * 200 + '</p>'
+        notice.save()
+        self.assertLessEqual(len(notice.excerpt), projections.EXCERPT_LENGTH)
+        self.assertTrue(notice.excerpt.endswith('word…'))
+
+    def test_listings_skip_rich_text_columns(self):
+        Notice_Board.objects.create(title='Exam', content='<p>Body</p>')
+        cache.clear()
+        with CaptureQueriesContext(connection) as queries:
+            response = Client().get(reverse('notice_list'))
+        self.assertContains(response, 'Body')
+        listing = [query['sql'] for query in queries if 'cse_app_notice_board' in query['sql'] and 'COUNT' not in query['sql']]
+        self.assertEqual(len(listing), 1)
+        self.assertNotIn('"content"', listing[0])
+        with override_settings(LIST_PROJECTIONS=False):
+            self.assertIn('"content"', str(projections.for_listing(Notice_Board.objects.all(), 'notice').query))
+
+@override_settings(DATABASE_REPLICAS=['replica_1'])
+class ReplicaRoutingTests(SimpleTestCase):
+
+    def test_reads_use_the_replica_only_when_allowed(self):
+        self.assertEqual(router.db_for_read(Notice_Board), 'default')
+        with routers.replica_reads():
+            self.assertEqual(router.db_for_read(Notice_Board), 'replica_1')
+            self.assertEqual(router.db_for_read(User), 'default')
+            self.assertEqual(router.db_for_read(ViewCount), 'analytics')
+            self.assertEqual(router.db_for_write(Notice_Board), 'default')
+        self.assertFalse(router.allow_migrate('replica_1', 'cse_app', model_name='notice_board'))
+
+    def test_only_anonymous_public_gets_read_from_replicas(self):
+        factory = RequestFactory()
+
+        def request(method, path, user):
+            req = getattr(factory, method)(path)
+            req.user = user
+            return req
+
+        anonymous = AnonymousUser()
+        staff = User(username='staff')
+        self.assertTrue(routers.reads_from_replica(request('get', reverse('notice_list'), anonymous)))
+        self.assertFalse(routers.reads_from_replica(request('post', reverse('notice_list'), anonymous)))
+        self.assertFalse(routers.reads_from_replica(request('get', reverse('staff_dashboard'), staff)))
+        self.assertFalse(routers.reads_from_replica(request('get', reverse('admin:index'), anonymous)))
+        with override_settings(DATABASE_REPLICAS=[]):
+            self.assertFalse(routers.reads_from_replica(request('get', reverse('notice_list'), anonymous)))
+
+    @override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}})
+    def test_writes_pin_reads_to_the_primary_until_replicas_catch_up(self):
+        request = RequestFactory().get(reverse('notice_list'))
+        request.user = AnonymousUser()
+        cache.clear()
+        self.assertTrue(routers.reads_from_replica(request))
+        before = time.time()
+        bump_version('home')
+        self.assertFalse(routers.reads_from_replica(request))
+        routers.unpin_primary(before - 1)  # copied before the write: still pinned
+        self.assertFalse(routers.reads_from_replica(request))
+        routers.unpin_primary(time.time())
+        self.assertTrue(routers.reads_from_replica(request))
+
+    def test_replica_urls(self):
+        replicas = replica_databases(' sqlite:////tmp/a.sqlite3, postgres://u:p@db2/cse ,', 'production')
+        self.assertEqual(list(replicas), ['replica_1', 'replica_2'])
+        self.assertEqual(replicas['replica_1']['OPTIONS']['timeout'], 20)
+        self.assertEqual(replicas['replica_2']['CONN_MAX_AGE'], 600)
+        self.assertEqual(replicas['replica_2']['TEST'], {'MIRROR': 'default'})
+        with mock.patch('neu_cse.database_urls.find_spec', return_value=None):
+            with self.assertRaisesMessage(ImproperlyConfigured, 'psycopg 3'):
+                database_from_url('postgres://u:p@db/cse', pool=True)  # psycopg2 has no pool
+        with mock.patch('neu_cse.database_urls.find_spec', return_value=True):
+            pooled = database_from_url('postgres://u:p@db/cse', pool=True)
+        self.assertEqual((pooled['CONN_MAX_AGE'], pooled['OPTIONS']), (0, {'pool': True}))
+
+class TailwindBuildTests(SimpleTestCase):
+
+    def test_cli_download_is_verified_before_it_can_run(self):
+        command = BuildTailwindCommand()
+        target = command._release_target()
+        with tempfile.TemporaryDirectory() as base_dir, \
+                mock.patch('shutil.which', return_value=None), \
+                mock.patch.object(command, '_download', return_value=b'tailwindcss'):
+            base_dir = Path(base_dir)
+            with override_settings(TAILWIND_CLI=None, TAILWIND_CLI_SHA256={}):
+                self.assertRaisesMessage(CommandError, 'No SHA-256 pinned', command._find_cli, None, base_dir)
+            with override_settings(TAILWIND_CLI=None, TAILWIND_CLI_SHA256={target: '0' * 64}):
+                self.assertRaisesMessage(CommandError, 'Checksum mismatch', command._find_cli, None, base_dir)
+            self.assertFalse(any((base_dir / '.tailwind').glob('*')))
+            digest = hashlib.sha256(b'tailwindcss').hexdigest()
+            with override_settings(TAILWIND_CLI=None, TAILWIND_CLI_SHA256={target: digest}):
+                binary = Path(command._find_cli(None, base_dir))
+            self.assertEqual(binary.read_bytes(), b'tailwindcss')
+            self.assertTrue(os.access(binary, os.X_OK))
+
+    def test_classes_added_from_javascript_are_checked_against_the_stylesheet(self):
+        templates = Path(settings.BASE_DIR) / 'templates'
+        classes = BuildTailwindCommand._script_classes(templates)
+        self.assertTrue({'animate-fadeIn', 'animate-fade-in', 'border-custom-green', 'opacity-0', 'translate-y-4'} <= classes)
+        css = ''.join(f'.{name}{{}}' for name in classes - {'animate-fade-in', 'ring-custom-green'})
+        # animate-fadeIn and border-custom-green are also defined in the templates' own CSS
+        self.assertEqual(BuildTailwindCommand._uncovered(classes, css, templates), {'animate-fade-in', 'ring-custom-green'})
+        self.assertEqual(BuildTailwindCommand._uncovered({'animate-fadeIn', 'border-custom-green'}, '', templates), set())
+
+
+@override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}})
+class CacheVersionTests(SimpleTestCase):
+
+    def test_bumps_set_a_new_version_without_incr(self):
+        cache.clear()
+        first = get_version('home')
+        with mock.patch('time.time_ns', return_value=first), mock.patch.object(cache, 'incr') as incr:
+            bump_version('home')
+            bump_version('home')
+        incr.assert_not_called()
+        self.assertEqual(get_version('home'), first + 2)
+
+    def test_versioned_entries_expire(self):
+        cache.clear()
+        with mock.patch.object(cache, 'set', wraps=cache.set) as cache_set:
+            get_or_set('scrolling_notice', ['text'], lambda: 'Admission open')
+        self.assertIs(cache_set.call_args.args[2], DEFAULT_TIMEOUT)  # not None, which never expires
+
+class SQLiteProfileTests(TestCase):
+    def test_profiles(self):
+        basic = sqlite_database('db.sqlite3', 'basic')
+        production = sqlite_database('db.sqlite3', 'production')
+        self.assertNotIn('OPTIONS', basic)
+        self.assertEqual(sqlite_database('db.sqlite3'), basic)
+        self.assertNotIn('transaction_mode', production['OPTIONS'])
+        self.assertIn('journal_mode=WAL', production['OPTIONS']['init_command'])
+        self.assertTrue(production['CONN_HEALTH_CHECKS'])
+        self.assertIsNot(production['OPTIONS'], sqlite_database('db.sqlite3', 'production')['OPTIONS'])
+        with self.assertRaises(ValueError):
+            sqlite_database('db.sqlite3', 'fast')
+
+    def test_write_transaction_takes_the_write_lock_up_front(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = f'{directory}/lock.sqlite3'
+            connections.settings['lock_test'] = connections.configure_settings({
+                DEFAULT_DB_ALIAS: connections.settings[DEFAULT_DB_ALIAS],
+                'lock_test': sqlite_database(path, 'production'),
+            })['lock_test']
+            other = sqlite3.connect(path, timeout=0)
+            allowed = mock.patch.object(type(self), 'databases', {DEFAULT_DB_ALIAS, 'lock_test'})
+            try:
+                allowed.start()
+                with transaction.atomic(using='lock_test'):
+                    other.execute('BEGIN IMMEDIATE')  # a plain atomic block holds no lock yet
+                    other.rollback()
+                with write_transaction('lock_test'):
+                    with self.assertRaisesMessage(sqlite3.OperationalError, 'locked'):
+                        other.execute('BEGIN IMMEDIATE')
+                self.assertIsNone(connections['lock_test'].transaction_mode)
+            finally:
+                allowed.stop()
+                other.close()
+                connections['lock_test'].close()
+                del connections['lock_test']
+                del connections.settings['lock_test']
+
+    @skipUnless(settings.SQLITE_PROFILE == 'production', 'production profile not selected')
+    def test_production_pragmas_are_applied(self):
+        with connection.cursor() as cursor:
+            cursor.execute('PRAGMA synchronous')
+            self.assertEqual(cursor.fetchone()[0], 1)  # NORMAL
+            cursor.execute('PRAGMA busy_timeout')
+            self.assertEqual(cursor.fetchone()[0], 20000)
+
+class PageViewHistoryTests(TestCase):
+    databases = {'default', 'analytics'}
+
+    def _hour(self, page_name, moment, count):
+        PageViewBucket.objects.create(page_name=page_name, granularity='hour', bucket_start=moment, count=count)
+
+    def test_rollup_and_top_notices(self):
+        now = timezone.now().replace(minute=30)
+        hour = now.replace(minute=0, second=0, microsecond=0)
+        notice = Notice_Board.objects.create(title='Routine', content='x')
+        self._hour(f'notice_{notice.pk}', hour, 4)
+        self._hour(f'notice_{notice.pk}', hour - timedelta(days=2), 6)
+        self._hour('notice_999999', hour, 50)  # deleted notice
+        self._hour('home', hour, 7)
+
+        page_analytics.rollup(now - timedelta(days=3))
+        self.assertEqual(page_analytics.top_notices(days=7, now=now), [(notice, 10)])
+        self.assertEqual(page_analytics.top_pages(days=1, prefix='home', now=now), [('home', 7)])
+        self.assertEqual(page_analytics.daily_totals(days=1, now=now)[0][1], 61)
+        month = PageViewBucket.objects.filter(granularity='month', page_name='home').get()
+        self.assertEqual(month.count, 7)
+
+    def test_flush_writes_hourly_buckets(self):
+        with mock.patch.object(view_counter, '_arm_timer') as arm:
+            view_counter.record_view('about', 2)
+        arm.assert_called_once()  # an idle worker still flushes after the interval
+        view_counter.flush()
+        self.assertEqual(PageViewBucket.objects.get(granularity='hour', page_name='about').count, 2)
+        last_updated = ViewCount.objects.get(page_name='about').last_updated
+        self.assertLess(abs(timezone.now() - last_updated), timedelta(minutes=1))
+
+    def test_rollup_completes_days_flushed_after_their_last_rollup(self):
+        now = timezone.now()
+        evening = page_analytics.day_start(now - timedelta(days=3)) + timedelta(hours=22)
+        self._hour('home', evening, 5)
+        page_analytics.rollup(evening)
+        self._hour('home', evening + timedelta(hours=1), 2)  # flushed after that day's last rollup
+        page_analytics.rollup()
+        day = PageViewBucket.objects.get(granularity='day', page_name='home', bucket_start=page_analytics.day_start(evening))
+        self.assertEqual(day.count, 7)
+
+    def test_prune_drops_expired_buckets(self):
+        now = timezone.now()
+        self._hour('home', now - timedelta(days=60), 1)
+        self._hour('home', now, 1)
+        self.assertEqual(page_analytics.prune(now)['hour'], 1)
+        self.assertEqual(PageViewBucket.objects.filter(granularity='hour').count(), 1)
+
+    def test_prune_deletes_without_loading_rows(self):
+        old = timezone.now() - timedelta(days=60)
+        for n in range(50):
+            self._hour(f'notice_{n}', old, 1)
+        # One DELETE per granularity and one for the sketches, however many rows expire
+        with self.assertNumQueries(4, using='analytics'):
+            self.assertEqual(page_analytics.prune()['hour'], 50)
+
+    @override_settings(DATABASE_REPLICAS=['replica_1'],
+                       CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}})
+    def test_counter_writes_leave_page_caches_and_replicas_alone(self):
+        cache.clear()
+        old = timezone.now() - timedelta(days=60)
+        for n in range(50):
+            self._hour(f'notice_{n}', old, 1)
+        versions = {tag: get_version(tag) for tag in ('home', tag_for_model(PageViewBucket), tag_for_model(ViewCount))}
+
+        view_counter.record_view('about', 2)
+        view_counter.flush()  # rolls up and prunes the expired buckets too
+        page_analytics.prune()
+        self.assertEqual(list(PageViewBucket.objects.filter(granularity='hour').values_list('page_name', flat=True)), ['about'])
+
+        self.assertEqual({tag: get_version(tag) for tag in versions}, versions)
+        self.assertFalse(routers.is_pinned())
+
+    def test_deleting_a_notice_forgets_its_history(self):
+        notice = Notice_Board.objects.create(title='Old', content='x')
+        self._hour(f'notice_{notice.pk}', timezone.now(), 3)
+        notice.delete()
+        self.assertFalse(PageViewBucket.objects.filter(page_name__startswith='notice_').exists())
+
+
+@override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}})
+class UniqueVisitorTests(TestCase):
+    databases = {'default', 'analytics'}
+
+    def test_sketch_estimate_and_merge(self):
+        first, second = HyperLogLog(), HyperLogLog()
+        for i in range(5000):
+            first.add(f'visitor-{i}')
+            second.add(f'visitor-{i + 2500}')
+        self.assertEqual(len(bytes(first)), 2048)
+        self.assertAlmostEqual(first.count(), 5000, delta=5000 * 0.07)
+        self.assertAlmostEqual(first.merge(second).count(), 7500, delta=7500 * 0.07)
+
+    def test_repeat_visits_count_once(self):
+        client = Client()
+        for i, agent in enumerate(('A', 'A', 'A', 'B', 'B')):
+            body = json.dumps({'views': [{'id': f'event-{i:04d}', 'page': 'about'}]})
+            client.post(reverse('page_view_beacon'), body, content_type='text/plain', HTTP_USER_AGENT=agent)
+        view_counter.flush()
+        self.assertEqual(ViewCount.objects.get(page_name='about').count, 5)
+        self.assertEqual(unique_visitors.estimate(['about'], days=1), {'about': 2})
+
+    def test_admin_changelist_estimates_all_pages_at_once(self):
+        for i, page_name in enumerate(('about', 'home', 'notices', 'faculty')):
+            ViewCount.objects.create(page_name=page_name, count=i)
+            sketch = HyperLogLog()
+            sketch.add(f'visitor-{i}')
+            unique_visitors.merge_sketches({(page_name, timezone.now().date()): sketch}, 'analytics')
+        client = Client()
+        client.force_login(User.objects.create_superuser('admin', 'admin@example.com', 'x'))
+        with CaptureQueriesContext(connections['analytics']) as queries:
+            response = client.get(reverse('admin:cse_app_viewcount_changelist'))
+        self.assertContains(response, '~1', count=4)
+        self.assertEqual(len([q for q in queries if 'uniquevisitorsketch' in q['sql']]), 1)
+
+
+BROWSER = 'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/126.0 Safari/537.36'
+
+
+@override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}})
+class PageViewBeaconTests(TestCase):
+    databases = {'default', 'analytics'}
+
+    def setUp(self):
+        cache.clear()
+        self.notice = Notice_Board.objects.create(title='Routine', content='x')
+
+    def _send(self, *events, **headers):
+        headers.setdefault('HTTP_USER_AGENT', BROWSER)
+        return Client().post(reverse('page_view_beacon'), json.dumps({'views': list(events)}),
+                             content_type='text/plain', **headers)
+
+    def test_pages_render_their_counter_name_and_do_not_count(self):
+        response = Client().get(reverse('notice_detail', kwargs={'pk': self.notice.pk}))
+        self.assertContains(response, f'data-page-view="notice_{self.notice.pk}"')
+        self.assertEqual(view_counter.pending_views(), {})
+
+    def test_beacon_counts_known_pages_once_per_event(self):
+        response = self._send(
+            {'id': 'abcdefgh1', 'page': f'notice_{self.notice.pk}'},
+            {'id': 'abcdefgh1', 'page': f'notice_{self.notice.pk}'},  # duplicate in batch
+            {'id': 'abcdefgh2', 'page': 'home'},
+            {'id': 'abcdefgh3', 'page': 'not_a_page'},
+            {'id': 'bad id', 'page': 'home'},
+        )
+        self.assertEqual(response.status_code, 204)
+        self._send({'id': 'abcdefgh2', 'page': 'home'})  # retried beacon
+        self.assertEqual(view_counter.pending_views(), {f'notice_{self.notice.pk}': 1, 'home': 1})
+        view_counter.flush()
+
+    def test_malformed_beacons_are_ignored(self):
+        for body in ('', 'not json', '[]', '{"views": "home"}'):
+            response = Client().post(reverse('page_view_beacon'), body, content_type='text/plain', HTTP_USER_AGENT=BROWSER)
+            self.assertEqual(response.status_code, 204)
+        self.assertEqual(view_counter.pending_views(), {})
+        self.assertEqual(Client().get(reverse('page_view_beacon')).status_code, 405)
+
+    def test_bots_prefetches_and_floods_are_dropped(self):
+        traffic_filter.reset_stats()
+        page = f'notice_{self.notice.pk}'
+        self._send({'id': 'crawler01', 'page': page}, HTTP_USER_AGENT='Googlebot/2.1 (+http://www.google.com/bot.html)')
+        self._send({'id': 'preview1', 'page': page}, HTTP_USER_AGENT='facebookexternalhit/1.1')
+        self._send({'id': 'prefetch1', 'page': page}, HTTP_SEC_PURPOSE='prefetch;prerender')
+        self._send({'id': 'noagent1', 'page': page}, HTTP_USER_AGENT='')
+        with override_settings(TRAFFIC_FILTER_MAX_EVENTS=2):
+            for i in range(4):
+                self._send({'id': f'flood{i:04d}', 'page': page}, REMOTE_ADDR='203.0.113.9')
+        self.assertEqual(view_counter.pending_views(), {page: 2})
+        stats = traffic_filter.stats()
+        self.assertEqual(stats['accepted'], 2)
+        self.assertEqual(stats['dropped'], {'method': 0, 'prefetch': 1, 'bot': 3, 'rate': 2})
+        self.assertEqual(stats['writes_avoided'], 6)
+        view_counter.flush()
+
+    def test_rate_windows_are_bounded(self):
+        with override_settings(TRAFFIC_FILTER_MAX_CLIENTS=3):
+            for i in range(10):
+                self._send({'id': f'client{i:04d}', 'page': 'home'}, REMOTE_ADDR=f'198.51.100.{i}')
+        self.assertLessEqual(len(traffic_filter._windows), 3)
+        view_counter.flush()
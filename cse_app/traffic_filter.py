@@ -0,0 +1,125 @@
+"""
+Drop non-human page-view events before they reach the counter.
+
+``classify`` looks at the beacon request and returns why its events should be
+ignored, or ``None`` for a human visitor:
+
+* ``method``: anything but GET/POST (HEAD, OPTIONS, ...)
+* ``prefetch``: speculative prefetch/prerender and link-preview requests
+* ``bot``: crawler, link-preview, monitoring and scripting user agents
+* ``rate``: more than ``TRAFFIC_FILTER_MAX_EVENTS`` events from one client
+  address within ``TRAFFIC_FILTER_WINDOW`` seconds
+
+Rate windows are kept per worker in an LRU bounded to
+``TRAFFIC_FILTER_MAX_CLIENTS`` addresses. Dropped events are tallied in the
+shared cache by reason; ``manage.py traffic_filter_stats`` reports them as
+counter writes avoided. The tallies are best-effort (the file-based cache does
+not increment atomically), unlike the page-view counts themselves.
+"""
+import re
+import threading
+import time
+from collections import OrderedDict
+
+from django.conf import settings
+from django.core.cache import cache
+
+REASONS = ('method', 'prefetch', 'bot', 'rate')
+ACCEPTED_KEY = 'cse:traffic_filter:accepted'
+DROPPED_KEY = 'cse:traffic_filter:dropped:{reason}'
+
+BOT_USER_AGENT_RE = re.compile(
+    r'bot|crawl|spider|slurp|scrap|archiver|facebookexternalhit|embedly|preview|'
+    r'whatsapp|telegram|skype|discord|slack|vkshare|pinterest|quora link|'
+    r'curl|wget|python|httpx|aiohttp|go-http-client|java/|okhttp|libwww|perl|ruby|'
+    r'headless|phantomjs|puppeteer|playwright|selenium|lighthouse|pagespeed|gtmetrix|'
+    r'pingdom|uptime|monitor|statuscake|site24x7|nagios',
+    re.IGNORECASE,
+)
+
+_lock = threading.Lock()
+_windows = OrderedDict()  # client address -> (window start, events)
+
+
+def _setting(name, default):
+    return getattr(settings, name, default)
+
+
+def client_address(request):
+    """The visitor's address, taking the first hop of X-Forwarded-For behind a proxy."""
+    forwarded = request.META.get('HTTP_X_FORWARDED_FOR', '')
+    return forwarded.split(',')[0].strip() or request.META.get('REMOTE_ADDR', '')
+
+
+def is_prefetch(request):
+    purpose = ' '.join(
+        request.META.get(header, '')
+        for header in ('HTTP_SEC_PURPOSE', 'HTTP_PURPOSE', 'HTTP_X_PURPOSE', 'HTTP_X_MOZ')
+    ).lower()
+    return any(word in purpose for word in ('prefetch', 'prerender', 'preview'))
+
+
+def is_bot(user_agent):
+    return not user_agent or bool(BOT_USER_AGENT_RE.search(user_agent))
+
+
+def _over_rate(address, events):
+    window = _setting('TRAFFIC_FILTER_WINDOW', 60)
+    limit = _setting('TRAFFIC_FILTER_MAX_EVENTS', 30)
+    now = time.monotonic()
+    with _lock:
+        start, seen = _windows.pop(address, (now, 0))
+        if now - start >= window:
+            start, seen = now, 0
+        seen += events
+        _windows[address] = (start, seen)
+        while len(_windows) > _setting('TRAFFIC_FILTER_MAX_CLIENTS', 10000):
+            _windows.popitem(last=False)
+    return seen > limit
+
+
+def classify(request, events=1):
+    """Return the reason to drop ``events`` reported by ``request``, or ``None`` to count them."""
+    if request.method not in ('GET', 'POST'):
+        return 'method'
+    if is_prefetch(request):
+        return 'prefetch'
+    if is_bot(request.META.get('HTTP_USER_AGENT', '')):
+        return 'bot'
+    if _over_rate(client_address(request), events):
+        return 'rate'
+    return None
+
+
+def _add(key, amount):
+    if not amount:
+        return
+    try:
+        cache.incr(key, amount)
+    except ValueError:
+        cache.add(key, 0, None)
+        cache.incr(key, amount)
+
+
+def record(reason, events):
+    """Tally ``events`` as accepted (``reason`` is ``None``) or dropped for ``reason``."""
+    _add(ACCEPTED_KEY if reason is None else DROPPED_KEY.format(reason=reason), events)
+
+
+def stats():
+    """Return ``{'accepted', 'dropped': {reason: events}, 'writes_avoided', 'drop_ratio'}``."""
+    keys = {reason: DROPPED_KEY.format(reason=reason) for reason in REASONS}
+    values = cache.get_many([ACCEPTED_KEY, *keys.values()])
+    dropped = {reason: values.get(key, 0) for reason, key in keys.items()}
+    avoided = sum(dropped.values())
+    total = avoided + values.get(ACCEPTED_KEY, 0)
+    return {
+        'accepted': values.get(ACCEPTED_KEY, 0),
+        'dropped': dropped,
+        'writes_avoided': avoided,
+        'drop_ratio': avoided / total if total else 0.0,
+    }
+
+
+def reset_stats():
+    cache.delete_many([ACCEPTED_KEY, *(DROPPED_KEY.format(reason=reason) for reason in REASONS)])
@@ -0,0 +1,72 @@
+"""
+Estimated unique visitors per page and day.
+
+Each worker keeps a HyperLogLog sketch per (page, day) next to its buffered
+hit counts; ``cse_app.view_counter.flush`` merges them into the stored
+``UniqueVisitorSketch`` rows. A visitor is identified by client IP and
+User-Agent, hashed into the sketch and never stored. Each row costs a fixed
+2 KB whatever the traffic, and sketches for several days merge into one
+estimate for the whole range.
+"""
+from datetime import timedelta
+
+from django.conf import settings
+from django.utils import timezone
+
+from .hyperloglog import HyperLogLog
+from .models import UniqueVisitorSketch
+from .traffic_filter import client_address
+
+
+def visitor_id(request):
+    """An opaque per-visitor value: client address plus User-Agent."""
+    return f"{client_address(request)}|{request.META.get('HTTP_USER_AGENT', '')}"
+
+
+def merge_sketches(sketches, using):
+    """Merge ``{(page_name, day): HyperLogLog}`` into the stored rows on database ``using``."""
+    if not sketches:
+        return
+    manager = UniqueVisitorSketch.objects.using(using)
+    empty = bytes(HyperLogLog())
+    manager.bulk_create(
+        [UniqueVisitorSketch(page_name=page_name, day=day, registers=empty) for page_name, day in sketches],
+        ignore_conflicts=True,
+    )
+    rows = manager.select_for_update().filter(
+        page_name__in={page_name for page_name, _ in sketches},
+        day__in={day for _, day in sketches},
+    )
+    changed = []
+    for row in rows:
+        sketch = sketches.get((row.page_name, row.day))
+        if sketch is not None:
+            row.registers = bytes(HyperLogLog(row.registers).merge(sketch))
+            changed.append(row)
+    manager.bulk_update(changed, ['registers'], batch_size=200)
+
+
+def _since(days, now):
+    return (now or timezone.now()).date() - timedelta(days=days - 1)
+
+
+def estimate(page_names, days=7, now=None):
+    """``{page_name: estimated unique visitors}`` over the last ``days`` days (today included)."""
+    merged = {}
+    rows = UniqueVisitorSketch.objects.filter(
+        page_name__in=list(page_names), day__gte=_since(days, now),
+    ).values_list('page_name', 'registers')
+    for page_name, registers in rows:
+        sketch = HyperLogLog(registers)
+        if page_name in merged:
+            merged[page_name].merge(sketch)
+        else:
+            merged[page_name] = sketch
+    return {page_name: merged[page_name].count() if page_name in merged else 0 for page_name in page_names}
+
+
+def prune(now=None):
+    """Delete sketches older than ``UNIQUE_VISITOR_RETENTION_DAYS``. Returns rows deleted."""
+    days = getattr(settings, 'UNIQUE_VISITOR_RETENTION_DAYS', 90)
+    deleted, _ = UniqueVisitorSketch.objects.filter(day__lt=_since(days, now)).delete()
+    return deleted
@@ -47,6 +47,7 @@ urlpatterns = [
     path('notices/<int:pk>/download/', views.download_notice, name='download_notice'),
     path('notices/<int:pk>/view/', views.view_notice_file, name='view_notice_file'),
     path('faculty/', views.faculty_list, name='faculty_list'),
+    path('staff/', views.staff_list, name='staff_list'),
     path('faculty/<int:pk>/', views.faculty_detail, name='faculty_detail'),
     path('chairman/', views.chairman_message, name='chairman_message'),
     
@@ -95,6 +96,9 @@ urlpatterns = [
     path('gallery/', views.image_gallery_home, name='image_gallery_home'),
     path('gallery/all/', views.all_images, name='all_images'),
 
+    # Page-view beacon (static/js/page_views.js)
+    path('beacon/page-views/', views.page_view_beacon, name='page_view_beacon'),
+
     # Fallback for any other route to force custom 404 template even when DEBUG=True.
     re_path(r'^(?!static/|media/|favicon\.ico$).+', views.fallback_404_view, name='fallback_404'),
 ]
\ No newline at end of file
@@ -0,0 +1,182 @@
+"""
+Buffered page-view counter.
+
+The page-view beacon endpoint (``cse_app.beacon``) calls
+``record_view('home')`` for each event the browser reports. Increments
+are collected in memory per worker process and written in a single batched
+UPSERT every ``VIEW_COUNTER_FLUSH_INTERVAL`` seconds (or once
+``VIEW_COUNTER_MAX_PENDING`` hits are waiting). The UPSERT adds to the stored
+value inside the database, so counts stay exact across gunicorn workers.
+Hits that arrive just before the site goes quiet are written by a timer armed
+with the first buffered hit, so a worker killed later (SIGKILL skips the
+``atexit`` flush) loses at most one interval of views.
+
+Each flush also adds the same hits to hourly ``PageViewBucket`` rows, which
+``cse_app.page_analytics`` rolls up into daily and monthly history, and merges
+per-day unique-visitor sketches (``cse_app.unique_visitors``) for requests
+that passed through ``PageViewVisitorMiddleware``.
+"""
+import atexit
+import contextvars
+import logging
+import threading
+import time
+from collections import Counter
+from datetime import datetime, timezone as dt_timezone
+
+from django.conf import settings
+from django.db import DatabaseError, connections, router
+from django.utils import timezone
+
+from neu_cse.sqlite_profiles import write_transaction
+
+from . import page_analytics, unique_visitors
+from .hyperloglog import HyperLogLog
+from .models import PageViewBucket, ViewCount
+
+logger = logging.getLogger(__name__)
+
+_lock = threading.Lock()
+_pending = Counter()
+_pending_hours = Counter()  # (page_name, hour start as epoch seconds) -> hits
+_pending_sketches = {}  # (page_name, date) -> HyperLogLog of visitor ids
+_pending_total = 0
+_last_flush = time.monotonic()
+_timer = None  # flushes the buffer once it has waited an interval
+
+# Identity of the visitor behind the current request, set by PageViewVisitorMiddleware
+_visitor = contextvars.ContextVar('page_view_visitor', default=None)
+
+
+def _flush_interval():
+    return getattr(settings, 'VIEW_COUNTER_FLUSH_INTERVAL', 10)
+
+
+def _max_pending():
+    return getattr(settings, 'VIEW_COUNTER_MAX_PENDING', 500)
+
+
+def _timed_flush():
+    try:
+        flush()
+    finally:
+        # The timer thread's own connections
+        connections.close_all()
+
+
+def _arm_timer():
+    """Start the idle flush timer unless one is already waiting. Call with ``_lock`` held."""
+    global _timer
+    if _timer is None or not _timer.is_alive():
+        _timer = threading.Timer(_flush_interval(), _timed_flush)
+        _timer.daemon = True
+        _timer.start()
+
+
+def record_view(page_name, count=1):
+    """Count ``count`` views of ``page_name``; flushes when the buffer is due."""
+    global _pending_total
+    hour = int(time.time()) // 3600 * 3600
+    visitor = _visitor.get()
+    with _lock:
+        _pending[page_name] += count
+        _pending_hours[page_name, hour] += count
+        _pending_total += count
+        if visitor is not None:
+            day = datetime.fromtimestamp(hour, dt_timezone.utc).date()
+            sketch = _pending_sketches.get((page_name, day))
+            if sketch is None:
+                sketch = _pending_sketches[page_name, day] = HyperLogLog()
+            sketch.add(visitor)
+        due = (
+            _pending_total >= _max_pending()
+            or time.monotonic() - _last_flush >= _flush_interval()
+        )
+        if not due:
+            _arm_timer()
+    if due:
+        flush()
+
+
+def pending_views():
+    """Return a copy of the increments not yet written to the database."""
+    with _lock:
+        return dict(_pending)
+
+
+def _upsert_sql(connection):
+    table = connection.ops.quote_name(ViewCount._meta.db_table)
+    return (
+        f"INSERT INTO {table} (page_name, count, last_updated) VALUES (%s, %s, %s) "
+        f"ON CONFLICT (page_name) DO UPDATE SET "
+        f"count = {table}.count + excluded.count, last_updated = excluded.last_updated"
+    )
+
+
+def _bucket_upsert_sql(connection):
+    table = connection.ops.quote_name(PageViewBucket._meta.db_table)
+    return (
+        f"INSERT INTO {table} (page_name, granularity, bucket_start, count) VALUES (%s, 'hour', %s, %s) "
+        f"ON CONFLICT (granularity, page_name, bucket_start) DO UPDATE SET "
+        f"count = {table}.count + excluded.count"
+    )
+
+
+def flush():
+    """Write all buffered increments in one transaction. Returns rows written."""
+    global _pending, _pending_hours, _pending_sketches, _pending_total, _last_flush
+    with _lock:
+        batch, _pending = _pending, Counter()
+        hours, _pending_hours = _pending_hours, Counter()
+        sketches, _pending_sketches = _pending_sketches, {}
+        _pending_total = 0
+        _last_flush = time.monotonic()
+    if not batch:
+        return 0
+
+    alias = router.db_for_write(ViewCount)
+    connection = connections[alias]
+    now = connection.ops.adapt_datetimefield_value(timezone.now())
+    rows = [(name, n, now) for name, n in sorted(batch.items())]
+    bucket_rows = [
+        (name, connection.ops.adapt_datetimefield_value(datetime.fromtimestamp(hour, dt_timezone.utc)), n)
+        for (name, hour), n in sorted(hours.items())
+    ]
+    try:
+        # merge_sketches reads the stored sketches before updating them
+        with write_transaction(alias):
+            with connection.cursor() as cursor:
+                cursor.executemany(_upsert_sql(connection), rows)
+                cursor.executemany(_bucket_upsert_sql(connection), bucket_rows)
+            unique_visitors.merge_sketches(sketches, using=alias)
+    except DatabaseError:
+        # Put the batch back so the next flush retries it; never fail the page.
+        logger.exception("Could not flush %d page-view counters", len(rows))
+        with _lock:
+            _pending.update(batch)
+            _pending_hours.update(hours)
+            for key, sketch in sketches.items():
+                if key in _pending_sketches:
+                    sketch.merge(_pending_sketches[key])
+                _pending_sketches[key] = sketch
+            _pending_total += sum(batch.values())
+        return 0
+    page_analytics.maybe_rollup()
+    return len(rows)
+
+
+class PageViewVisitorMiddleware:
+    """Make the visitor of each request known to ``record_view`` for unique counts."""
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        token = _visitor.set(unique_visitors.visitor_id(request))
+        try:
+            return self.get_response(request)
+        finally:
+            _visitor.reset(token)
+
+
+atexit.register(flush)
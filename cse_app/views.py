@@ -5,17 +5,28 @@ from django.utils import timezone
 from .models import *
 import os
 from django.http import HttpResponse, Http404
+from django.views.decorators.csrf import csrf_exempt
+from django.views.decorators.http import require_POST
 from django.conf import settings
 from .models import Notice_Board, FacultyMember, Chairman, Publication, Project, TechNews, ViewCount, ImageGallery, StaffProfile
-from django.core.paginator import Paginator, EmptyPage, PageNotAnInteger
 from .models import Event
 from .models import ScrollingNotice
-from django.core.paginator import Paginator
 from django.contrib.auth import login, logout, authenticate
 from django.contrib.auth.decorators import login_required
 from django.contrib import messages
 from django.core.exceptions import PermissionDenied
 from .forms import NoticeForm, ScrollingNoticeForm, FacultyMemberForm, EducationForm, ProfessionalExperienceForm, StaffProfileForm
+from .view_counter import record_view
+from .beacon import page_view, first_seen, parse_events as parse_beacon_events
+from .caching import get_or_set
+from .file_delivery import serve_file
+from .search import search as fulltext_search
+from .page_cache import cache_tags
+from .facets import ACTIVE_FACULTY_FACETS, FACULTY_FACETS, STAFF_FACETS, faceted
+from .pagination import paginate
+from .projections import for_listing
+from .profile_completion import labels as profile_check_labels
+from . import department_stats, event_schedule, faculty_profiles, page_analytics, research_areas, traffic_filter, unique_visitors
 
 def staff_login(request):
     if request.method == 'POST':
@@ -115,6 +126,10 @@ def staff_dashboard(request):
         staff_notices = user_notices.count()
         staff_scrolling_notices = user_scrolling_notices.count()
         
+        daily_views = page_analytics.daily_totals(days=14)
+        top_pages = page_analytics.top_pages(days=7, limit=8)
+        uniques = unique_visitors.estimate([page_name for page_name, _ in top_pages], days=7)
+
         # Get temporary message and remove it from session
         temp_message = None
         if 'temp_message' in request.session:
@@ -133,6 +148,11 @@ def staff_dashboard(request):
             'user_scrolling_notices': user_scrolling_notices,
             'recent_notices': Notice_Board.objects.order_by('-created_at')[:5],
             'temp_message': temp_message,  # Add temporary message to context
+            # Page-view panel, read from the daily rollups
+            'top_notices': page_analytics.top_notices(days=7),
+            'top_pages': [(page_name, views, uniques[page_name]) for page_name, views in top_pages],
+            'daily_views': daily_views,
+            'max_daily_views': max([views for _, views in daily_views] + [1]),
         }
         return render(request, 'cse/staff/dashboard.html', context)
     except StaffProfile.DoesNotExist:
@@ -355,59 +375,21 @@ def faculty_logout(request):
 @login_required(login_url='faculty_login')
 def faculty_dashboard(request):
     try:
-        faculty_member = FacultyMember.objects.get(user=request.user)
+        # Profile with every related collection loaded (cached per member)
+        faculty_member = faculty_profiles.load_for_user(request.user)
         if faculty_member.status not in ['active', 'ex_chairman']:
             messages.error(request, 'Your account is not active. Please contact the administrator.')
             logout(request)
             return redirect('faculty_login')
         
         # Get faculty's publications and projects
-        faculty_publications = Publication.objects.filter(authors__icontains=faculty_member.name).order_by('-publication_date')
-        faculty_projects = faculty_member.projects.all().order_by('-start_date')
-        
-        # Calculate profile completion percentage
-        profile_fields = [
-            faculty_member.name,
-            faculty_member.email,
-            faculty_member.phone,
-            faculty_member.bio,
-            faculty_member.research_interest,
-            faculty_member.research_activities,
-            faculty_member.publications,
-            faculty_member.courses_taught,
-            faculty_member.membership,
-            faculty_member.awards_honors,
-            faculty_member.image.name if faculty_member.image else None,
-            faculty_member.cv_file.name if faculty_member.cv_file else None,
-        ]
-        
-        # Add URL fields
-        url_fields = [
-            faculty_member.research_gate_url,
-            faculty_member.google_scholar_url,
-            faculty_member.orcid_url,
-            faculty_member.linkedin_url,
-            faculty_member.personal_website,
-        ]
-        
-        # Count URL fields - consider profile complete if at least 2 URLs are provided
-        filled_urls = sum(1 for url in url_fields if url and str(url).strip())
-        if filled_urls >= 2:
-            profile_fields.append("social_links_sufficient")
-        
-        # Add education and experience record counts
-        education_count = faculty_member.educations.count()
-        experience_count = faculty_member.professional_experiences.count()
-        
-        # Consider education and experience as "filled" if they have any records
-        if education_count > 0:
-            profile_fields.append("education_records_exist")
-        if experience_count > 0:
-            profile_fields.append("professional_experience_records_exist")
-            
-        completed_fields = sum(1 for field in profile_fields if field and str(field).strip())
-        profile_completion = int((completed_fields / len(profile_fields)) * 100)
+        faculty_publications = faculty_member.authored_publications
+        faculty_projects = faculty_member.projects.all()
         
+        # Completion score is stored on the member (cse_app.profile_completion)
+        profile_completion = faculty_member.profile_completion
+        profile_missing = profile_check_labels(faculty_member.profile_missing)
+
         # Get temporary message and remove it from session
         temp_message = None
         if 'temp_message' in request.session:
@@ -419,6 +401,7 @@ def faculty_dashboard(request):
             'faculty_publications': faculty_publications,
             'faculty_projects': faculty_projects,
             'profile_completion': profile_completion,
+            'profile_missing': profile_missing,
             'current_date': timezone.now(),
             'temp_message': temp_message,
         }
@@ -431,7 +414,8 @@ def faculty_dashboard(request):
 @login_required(login_url='faculty_login')
 def edit_faculty_profile(request):
     try:
-        faculty_member = FacultyMember.objects.get(user=request.user)
+        # Saves go through a fresh instance, never the cached copy
+        faculty_member = faculty_profiles.load_for_user(request.user, cached=request.method != 'POST')
         
         if request.method == 'POST':
             form = FacultyMemberForm(request.POST, request.FILES, instance=faculty_member)
@@ -459,82 +443,42 @@ def edit_faculty_profile(request):
         messages.error(request, 'You are not registered as faculty.')
         return redirect('faculty_login')
 
-def home(request):
+def _build_home_context():
+    """Query everything the home page shows. Results are lists so they can be cached."""
     # Get active carousel items ordered by their specified order
-    carousel_items = CarouselItem.objects.filter(is_active=True).order_by('order')
+    carousel_items = list(CarouselItem.objects.filter(is_active=True).order_by('order'))
     
     # Get the latest 6 images for the gallery section
-    latest_images = ImageGallery.objects.all().order_by('-upload_time')[:6]
+    latest_images = list(ImageGallery.objects.all().order_by('-upload_time')[:6])
 
     # Get important notices
-    important_notices = Notice_Board.objects.filter(is_important=True)[:5]
+    important_notices = list(for_listing(Notice_Board.objects.filter(is_important=True), 'home_notice')[:5])
     
-    # Get latest notices (excluding important ones to avoid duplication)
-    latest_notices = Notice_Board.objects.exclude(is_important=True)[:5]
+    # Get latest notices
+    latest_notices = list(for_listing(Notice_Board.objects.all(), 'home_notice')[:5])
     
     # Get the latest 3 projects
-    latest_projects = Project.objects.all().order_by('-start_date')[:3]
+    latest_projects = list(for_listing(Project.objects.order_by('-start_date'), 'project')[:3])
 
     # Get the latest 3 publications
-    latest_publications = Publication.objects.all().order_by('-publication_date')[:3]
-
-    # Get the latest events
-    latest_events = Event.objects.all().order_by('-start_date')[:3]
-    
-    # Get latest notices
-    latest_notices = Notice_Board.objects.all()[:5]
+    latest_publications = list(Publication.objects.all().order_by('-publication_date')[:3])
     
     # Get faculty members
-    faculty_members = FacultyMember.objects.all()[:8]
+    faculty_members = list(for_listing(FacultyMember.objects.all(), 'faculty')[:8])
     
     # Get current chairman
-    current_chairman = Chairman.objects.filter(is_current=True).first()
+    current_chairman = Chairman.objects.filter(is_current=True).select_related('faculty').first()
     
     # Get latest tech news
-    tech_news = TechNews.objects.all().order_by('-published_date')[:3]
-    
-    # Get upcoming events first, then fill with latest events if needed
-    upcoming_events = list(Event.objects.filter(
-        is_upcoming=True,
-        start_date__gte=timezone.now()
-    ).order_by('start_date')[:3])
-
-    # If we have less than 3 upcoming events, add latest events
-    if len(upcoming_events) < 3:
-        latest_events = Event.objects.exclude(
-            id__in=[event.id for event in upcoming_events]
-        ).order_by('-start_date')[:3 - len(upcoming_events)]
-        upcoming_events.extend(latest_events)
-
-    # Get department statistics for About section
-    try:
-        stats = DepartmentStatistics.objects.first()
-        if not stats:
-            stats = DepartmentStatistics.objects.create()
-    except Exception:
-        stats = None
-    
-    # Get statistics with auto-calculation for zero values
-    if stats:
-        total_students = stats.total_students
-        total_faculty = stats.get_faculty_count() if stats.total_faculty == 0 else stats.total_faculty
-        total_labs = stats.total_labs
-        total_research_areas = stats.get_research_areas_count() if stats.total_research_areas == 0 else stats.total_research_areas
-        total_publications = stats.get_publications_count() if stats.total_publications == 0 else stats.total_publications
-        total_projects = stats.get_projects_count() if stats.total_projects == 0 else stats.total_projects
-    else:
-        total_students = 150
-        total_faculty = FacultyMember.objects.filter(is_current=True, status='active').count()
-        total_labs = 3
-        total_research_areas = 8
-        total_publications = Publication.objects.count()
-        total_projects = Project.objects.count()
-    
-    # Update view count for home page
-    page_view, created = ViewCount.objects.get_or_create(page_name='home')
-    page_view.increment()
+    tech_news = list(for_listing(TechNews.objects.order_by('-published_date'), 'tech_news')[:3])
     
-    context = {
+    # Upcoming events first, topped up with the latest past ones (one query)
+    upcoming_events = list(event_schedule.upcoming_then_recent(for_listing(Event.objects.all(), 'event'), 3))
+
+    # Department statistics for the About section (one materialized row)
+    stats = department_stats.load().get_display_values()
+
+    return {
         'carousel_items': carousel_items,
         'important_notices': important_notices,
         'latest_notices': latest_notices,
@@ -546,62 +490,91 @@ def home(request):
         'latest_publications': latest_publications,
         'images': latest_images,
         # Department statistics for About section
-        'total_students': total_students,
-        'total_faculty': total_faculty,
-        'total_labs': total_labs,
-        'total_research_areas': total_research_areas,
-        'total_publications': total_publications,
-        'total_projects': total_projects,
+        **stats,
     }
+
+
+@cache_tags(CarouselItem, ImageGallery, Notice_Board, Project, Publication, Event, FacultyMember, Chairman, TechNews, DepartmentStatistics, ScrollingNotice,
+            timeout_setting='HOME_PAGE_CACHE_TIMEOUT')
+@page_view('home')
+def home(request):
+    # Served from cache; signals in cse_app.signals invalidate it when content changes.
+    # The timeout (also the cached page's) only bounds how long an event may stay listed as upcoming.
+    context = get_or_set('home', ['context'], _build_home_context,
+                         timeout=settings.HOME_PAGE_CACHE_TIMEOUT)
     
     return render(request, 'cse/home.html', context)
 
 
 #About nav bar
+@cache_tags()
 def why_neu_cse(request):
     return render(request, 'cse/about/why_neu_cse.html')
+@cache_tags()
 def message_from_department(request):
     return render(request, 'cse/about/message_from_department.html')
+@cache_tags(Chairman, FacultyMember)
+@page_view('chairman_message')
 def message_from_chairman(request):
     # Get current chairman
     current_chairman = Chairman.objects.filter(is_current=True).first()
     
-    # Update view count for chairman's message page
-    page_view, created = ViewCount.objects.get_or_create(page_name='chairman_message')
-    page_view.increment()
-    
     return render(request, 'cse/about/message_from_chairman.html', {
         'current_chairman': current_chairman
     })
+@cache_tags()
 def facilities(request):
     return render(request, 'cse/about/facilities.html')
+@cache_tags()
 def history_neu_cse(request):
     return render(request, 'cse/about/history_neu_cse.html')
+@cache_tags()
 def mission_vision(request):
     return render(request, 'cse/about/mission_vission.html')
+@cache_tags()
 def history_neu(request):
     return render(request, 'cse/about/history_neu.html')
+@cache_tags()
 def achievements(request):
     return render(request, 'cse/about/achievements.html')
 
 #Academis nav bar
+@cache_tags()
 def academic_programs(request):
     return render(request, 'cse/academics/academic_programs.html')
+@cache_tags()
 def curriculum(request):
     return render(request, 'cse/academics/curriculum.html')
+@cache_tags()
 def academic_calendar(request):
     return render(request, 'cse/academics/academic_calendar.html')
 
 #faculty and staff nav bar
+@cache_tags(FacultyMember, ResearchArea)
 def active_faculty(request):
     # Filter by both status='active' and is_current=True, ordered by joined_date (earliest first)
-    active_faculty_members = FacultyMember.objects.filter(
+    active_faculty_members = for_listing(FacultyMember.objects.filter(
         status='active', 
         is_current=True
-    ).order_by('joined_date', 'name')
+    ), 'faculty').order_by('joined_date', 'name')
+    
+    # Research-area filter narrows the list the facets count
+    area = request.GET.get('area', '').strip()
+    faculty_members = research_areas.filter_by_area(active_faculty_members, area) if area else active_faculty_members
+    
+    # Designation and member-type filters with per-value counts
+    faculty_members, facets, filters = faceted(request, faculty_members, ACTIVE_FACULTY_FACETS)
+    
+    # Member counts per area for the chosen facets
+    area_counts = research_areas.area_counts(active_faculty_members.filter(**filters))
+    
     return render(request, 'cse/faculty_and_staff/active_faculty.html', {
-        'faculty_members': active_faculty_members
+        'faculty_members': faculty_members,
+        'facets': facets,
+        'research_areas': area_counts,
+        'current_area': area,
     })
+@cache_tags(Chairman, FacultyMember)
 def ex_chairman(request):
     # Get all ex-chairmen ordered by service start date (who served first appears first)
     ex_chairmen = Chairman.objects.filter(is_current=False).order_by('from_date')
@@ -619,29 +592,36 @@ def ex_chairman(request):
     return render(request, 'cse/faculty_and_staff/ex_chariman.html', {
         'ex_chairmen': ex_chairmen
     })
+@cache_tags(FacultyMember)
 def faculty_on_leave(request):
-    faculty_on_leave = FacultyMember.objects.filter(status='on_leave')
+    faculty_on_leave = for_listing(FacultyMember.objects.filter(status='on_leave'), 'faculty')
     return render(request, 'cse/faculty_and_staff/faculty_on_leave.html', {
         'faculty_members': faculty_on_leave
     })
+@cache_tags(FacultyMember)
 def past_faculty(request):
-    past_faculty_members = FacultyMember.objects.filter(status='past_faculty').order_by('-end_date')
+    past_faculty_members = for_listing(FacultyMember.objects.filter(status='past_faculty'), 'faculty').order_by('-end_date')
     return render(request, 'cse/faculty_and_staff/past_faculty.html', {
         'faculty_members': past_faculty_members
     })
     
+@cache_tags(Staff)
 def officer_and_staff(request):
-    staff_members = Staff.objects.all()
+    # Type and status filters with per-value counts
+    staff_members, facets, filters = faceted(request, Staff.objects.all(), STAFF_FACETS)
     return render(request, 'cse/faculty_and_staff/officer_and_staff.html', {
-        'staff_members': staff_members
+        'staff_members': staff_members,
+        'facets': facets,
     })
 
+@cache_tags(Notice_Board)
+@page_view('notices')
 def notice_list(request):
     notice_type = request.GET.get('type')
     search_query = request.GET.get('search', '').strip()
     
-    # Base queryset
-    notices = Notice_Board.objects.all()
+    # Base queryset (the list shows each notice's author)
+    notices = for_listing(Notice_Board.objects.select_related('created_by'), 'notice')
     
     # Apply type filter
     if notice_type == 'important':
@@ -649,18 +629,20 @@ def notice_list(request):
     elif notice_type == 'latest':
         notices = notices.order_by('-created_at')
     
+    # Newest first, paged by (created_at, id) cursors
+    key = '-created_at'
+    
     # Apply search filter if query exists
     if search_query:
-        notices = notices.filter(title__icontains=search_query)
-    
-    # Update view count for notices page
-    page_view, created = ViewCount.objects.get_or_create(page_name='notices')
-    page_view.increment()
+        # FTS5 index with BM25 ranking; falls back to a LIKE scan without it
+        ranked = notice_type != 'latest'
+        results = fulltext_search(notices, 'notice', search_query, ranked=ranked)
+        notices = results if results is not None else notices.filter(title__icontains=search_query)
+        if results is not None and ranked:
+            key = None  # relevance order is paged by page number
     
     # Pagination - 7 notices per page
-    paginator = Paginator(notices, 7)
-    page_number = request.GET.get('page')
-    page_obj = paginator.get_page(page_number)
+    page_obj = paginate(request, notices, 7, key)
     
     context = {
         'page_obj': page_obj,
@@ -671,13 +653,11 @@ def notice_list(request):
     
     return render(request, 'cse/notice_list.html', context)
 
+@cache_tags(Notice_Board)
+@page_view('notice_{pk}')
 def notice_detail(request, pk):
     notice = get_object_or_404(Notice_Board, pk=pk)
     
-    # Update view count for notice detail page
-    page_view, created = ViewCount.objects.get_or_create(page_name=f'notice_{pk}')
-    page_view.increment()
-    
     # Check file type if a file exists
     file_type = None
     if notice.file:
@@ -694,104 +674,63 @@ def notice_detail(request, pk):
 
 def view_notice_file(request, pk):
     notice = get_object_or_404(Notice_Board, pk=pk)
-    if notice.file:
-        file_path = notice.file.path
-        if os.path.exists(file_path):
-            with open(file_path, 'rb') as fh:
-                file_name = notice.file.name.lower()
-                if file_name.endswith('.pdf'):
-                    content_type = 'application/pdf'
-                elif file_name.endswith(('.png', '.jpg', '.jpeg')):
-                    content_type = 'image/' + file_name.split('.')[-1]
-                elif file_name.endswith('.gif'):
-                    content_type = 'image/gif'
-                else:
-                    content_type = 'application/octet-stream'
-                
-                response = HttpResponse(fh.read(), content_type=content_type)
-                return response
-    raise Http404("File does not exist")
+    # Streamed with Range support so in-browser PDF viewers can fetch pages on demand
+    return serve_file(request, notice.file)
 
 def download_notice(request, pk):
     notice = get_object_or_404(Notice_Board, pk=pk)
-    if notice.file:
-        file_path = notice.file.path
-        if os.path.exists(file_path):
-            with open(file_path, 'rb') as fh:
-                response = HttpResponse(fh.read(), content_type="application/force-download")
-                response['Content-Disposition'] = 'attachment; filename=' + os.path.basename(file_path)
-                return response
-    raise Http404("File does not exist")
+    return serve_file(request, notice.file, as_attachment=True)
 
+@page_view('faculty')
 def faculty_list(request):
-    # Get filter parameter from request
-    status = request.GET.get('status', 'active')  # Default to active
+    # Start with all faculty members (card columns only)
+    all_faculty = for_listing(FacultyMember.objects.all(), 'faculty')
     
-    # Start with all faculty members
-    faculty_members = FacultyMember.objects.all()
+    # Research-area filter narrows the list the facets count
+    area = request.GET.get('area', '').strip()
+    faculty_members = research_areas.filter_by_area(all_faculty, area) if area else all_faculty
     
-    # Apply status filter
-    if status != 'all':
-        faculty_members = faculty_members.filter(status=status)
+    # Status (default active), designation and member-type filters with per-value counts
+    faculty_members, facets, filters = faceted(request, faculty_members, FACULTY_FACETS, {'status': 'active'})
     
-    # Get distinct statuses for filter options
-    statuses = FacultyMember.objects.values_list('status', flat=True).distinct()
-    
-    # Update view count for faculty page
-    page_view, created = ViewCount.objects.get_or_create(page_name='faculty')
-    page_view.increment()
+    # Member counts per area for the chosen facets
+    area_counts = research_areas.area_counts(all_faculty.filter(**filters))
     
     context = {
         'faculty_members': faculty_members,
-        'statuses': statuses,
-        'current_status': status,
+        'facets': facets,
+        'research_areas': area_counts,
+        'current_area': area,
     }
     
-    return render(request, 'cse/faculty_list.html', context)
+    return render(request, 'cse/faculty_and_staff/active_faculty.html', context)
 
+@page_view('staff')
 def staff_list(request):
-    # Get filter parameters from request
-    staff_type = request.GET.get('type', 'all')  # Default to all
-    status = request.GET.get('status', 'active')  # Default to active
-    
-    # Start with all staff members
-    staff_members = Staff.objects.all()
-    
-    # Apply filters
-    if staff_type != 'all':
-        staff_members = staff_members.filter(staff_type=staff_type)
-    
-    if status != 'all':
-        staff_members = staff_members.filter(status=status)
-    
-    # Get distinct statuses for filter options
-    statuses = Staff.objects.values_list('status', flat=True).distinct()
-    
-    # Update view count for staff page
-    page_view, created = ViewCount.objects.get_or_create(page_name='staff')
-    page_view.increment()
+    # Type (default all) and status (default active) filters with per-value counts
+    staff_members, facets, filters = faceted(request, Staff.objects.all(), STAFF_FACETS, {'status': 'active'})
     
     context = {
         'staff_members': staff_members,
-        'staff_types': dict(Staff.STAFF_TYPE_CHOICES),
-        'statuses': statuses,
-        'current_type': staff_type,
-        'current_status': status,
+        'facets': facets,
     }
     
-    return render(request, 'cse/staff_list.html', context)
+    return render(request, 'cse/faculty_and_staff/officer_and_staff.html', context)
 
+@cache_tags(FacultyMember, Education, ProfessionalExperience, Project, Publication, PublicationAuthor)
 def faculty_detail(request, pk):
-    faculty = get_object_or_404(FacultyMember, pk=pk)
+    try:
+        faculty = faculty_profiles.load(pk)
+    except FacultyMember.DoesNotExist:
+        raise Http404("Faculty member not found")
     return render(request, 'cse/faculty_and_staff/faculty_detail.html', {'faculty': faculty})
 
+@page_view('chairman')
 def chairman_message(request):
     # Get current chairman
     current_chairman = Chairman.objects.filter(is_current=True).first()
     
-    # Update view count for chairman page
-    page_view, created = ViewCount.objects.get_or_create(page_name='chairman')
-    page_view.increment()
+    page_view = ViewCount.objects.filter(page_name='chairman').first()
     
     context = {
         'current_chairman': current_chairman,
@@ -799,39 +738,36 @@ def chairman_message(request):
     }
     return render(request, 'message_from_chairman.html', context)
 
+@cache_tags(Publication)
 def publications_home(request):
     latest_publications = Publication.objects.all().order_by('-publication_date')[:3]
     return render(request, 'cse/publications.html', {'latest_publications': latest_publications})
 
+@cache_tags(Publication)
 def all_publications(request):
     publications = Publication.objects.all()
     
     # Search functionality
     search_query = request.GET.get('search')
     if search_query:
-        publications = publications.filter(title__icontains=search_query)
+        results = fulltext_search(publications, 'publication', search_query)
+        publications = results if results is not None else publications.filter(title__icontains=search_query)
     
-    # Sort publications
+    # Sort publications (search results stay in relevance order unless a sort is requested)
     sort_by = request.GET.get('sort', 'date')  # Default sort by date
-    if sort_by == 'date':
-        publications = publications.order_by('-publication_date')
+    if search_query and 'sort' not in request.GET:
+        key = None
     elif sort_by == 'title':
-        publications = publications.order_by('title')
+        key = 'title'
+    else:
+        key = '-publication_date'
     
     # Pagination
-    paginator = Paginator(publications, 8)  # Show 8 publications per page
-    page = request.GET.get('page')
-    try:
-        publications = paginator.page(page)
-    except PageNotAnInteger:
-        # If page is not an integer, deliver first page.
-        publications = paginator.page(1)
-    except EmptyPage:
-        # If page is out of range, deliver last page of results.
-        publications = paginator.page(paginator.num_pages)
+    publications = paginate(request, publications, 8, key)  # Show 8 publications per page
         
     return render(request, 'cse/all_publications.html', {'publications': publications})
 
+@cache_tags(Publication)
 def publication_detail(request, pk):
     publication = get_object_or_404(Publication, pk=pk)
     return render(request, 'cse/publication_detail.html', {'publication': publication})
@@ -839,12 +775,9 @@ def publication_detail(request, pk):
         publications = publications.order_by('-publication_date')
     elif sort_by == 'title':
         publications = publications.order_by('title')
-    # Update view count for publications page
-    page_view, created = ViewCount.objects.get_or_create(page_name='publications')
-    page_view.increment()
-    
     return render(request, 'cse/publications.html', {'publications': publications})
 
+@page_view('projects')
 def projects(request):
     projects = Project.objects.all()
     
@@ -853,41 +786,34 @@ def projects(request):
     if project_type:
         projects = projects.filter(project_type=project_type)
     
-    # Update view count for projects page
-    page_view, created = ViewCount.objects.get_or_create(page_name='projects')
-    page_view.increment()
-    
     return render(request, 'cse/projects/projects.html', {'projects': projects})
 
+@cache_tags(TechNews)
+@page_view('tech_news')
 def all_tech_news(request):
     # Get search query
     query = request.GET.get('q')
     
     # Get all tech news ordered by published date
-    news_list = TechNews.objects.all().order_by('-published_date')
+    news_list = for_listing(TechNews.objects.order_by('-published_date'), 'tech_news')
+    
+    key = '-published_date'
     
     # Apply search filter if query exists
     if query:
-        news_list = news_list.filter(
-            Q(title__icontains=query) |
-            Q(content__icontains=query) |
-            Q(source__icontains=query)
-        )
+        results = fulltext_search(news_list, 'tech_news', query)
+        if results is not None:
+            news_list = results
+            key = None  # keep relevance order
+        else:
+            news_list = news_list.filter(
+                Q(title__icontains=query) |
+                Q(content__icontains=query) |
+                Q(source__icontains=query)
+            )
     
     # Pagination - show 9 items per page
-    paginator = Paginator(news_list, 9)
-    page = request.GET.get('page')
-    
-    try:
-        tech_news = paginator.page(page)
-    except PageNotAnInteger:
-        tech_news = paginator.page(1)
-    except EmptyPage:
-        tech_news = paginator.page(paginator.num_pages)
-    
-    # Update view count for tech news page
-    page_view, created = ViewCount.objects.get_or_create(page_name='tech_news')
-    page_view.increment()
+    tech_news = paginate(request, news_list, 9, key)
     
     return render(request, 'cse/tech_news/all_tech_news.html', {
         'tech_news': tech_news,
@@ -895,79 +821,43 @@ def all_tech_news(request):
         'is_paginated': tech_news.has_other_pages()
     })
 
+@cache_tags(TechNews)
+@page_view('tech_news_{pk}')
 def detail_tech_news(request, pk):
     # Get the specific tech news item
     news = get_object_or_404(TechNews, pk=pk)
     
-    # Update view count for this specific tech news
-    page_view, created = ViewCount.objects.get_or_create(page_name=f'tech_news_{pk}')
-    page_view.increment()
-    
     return render(request, 'cse/tech_news/detail_tech_news.html', {'news': news})
 
+@cache_tags(DepartmentStatistics, FacultyMember, Publication, Project)
+@page_view('about')
 def about(request):
-    # Update view count for about page
-    page_view, created = ViewCount.objects.get_or_create(page_name='about')
-    page_view.increment()
-    
-    # Get or create department statistics
-    try:
-        stats = DepartmentStatistics.objects.first()
-        if not stats:
-            # Create default statistics if none exist
-            stats = DepartmentStatistics.objects.create()
-            print("Created new statistics instance")
-        else:
-            print(f"Found existing statistics: Students={stats.total_students}, Faculty={stats.total_faculty}")
-    except Exception as e:
-        # Fallback to default values if model doesn't exist yet
-        print(f"Error getting statistics: {e}")
-        stats = None
-    
-    # Get statistics with auto-calculation for zero values
-    if stats:
-        total_students = stats.total_students
-        total_faculty = stats.get_faculty_count() if stats.total_faculty == 0 else stats.total_faculty
-        total_labs = stats.total_labs
-        total_research_areas = stats.get_research_areas_count() if stats.total_research_areas == 0 else stats.total_research_areas
-        total_publications = stats.get_publications_count() if stats.total_publications == 0 else stats.total_publications
-        total_projects = stats.get_projects_count() if stats.total_projects == 0 else stats.total_projects
-    else:
-        # Fallback values
-        total_students = 150
-        total_faculty = FacultyMember.objects.filter(is_current=True, status='active').count()
-        total_labs = 3
-        total_research_areas = 8
-        total_publications = Publication.objects.count()
-        total_projects = Project.objects.count()
-    
-    print(f"Context values: Students={total_students}, Faculty={total_faculty}, Labs={total_labs}")
-    
-    context = {
-        'total_students': total_students,
-        'total_faculty': total_faculty,
-        'total_labs': total_labs,
-        'total_research_areas': total_research_areas,
-        'total_publications': total_publications,
-        'total_projects': total_projects,
-    }
+    # Counts are materialized on the statistics row; no per-request scans
+    context = department_stats.load().get_display_values()
     
     return render(request, 'cse/about.html', context)
 
+@csrf_exempt
+@require_POST
+def page_view_beacon(request):
+    # Batched page-view events from static/js/page_views.js (navigator.sendBeacon)
+    if len(request.body) <= settings.PAGE_VIEW_BEACON_MAX_BYTES:
+        events = parse_beacon_events(request.body)
+        # Bots, prefetches and floods are dropped before they cost a write
+        reason = traffic_filter.classify(request, len(events))
+        traffic_filter.record(reason, len(events))
+        if reason is None:
+            for page_name in first_seen(events):
+                record_view(page_name)
+    return HttpResponse(status=204)
+
+@cache_tags(Event)
 def events(request):
-    # Get all upcoming events
-    events_list = Event.objects.filter(is_upcoming=True).order_by('start_date')
+    # Get all events that have not ended yet
+    events_list = event_schedule.upcoming(for_listing(Event.objects.all(), 'event'))
     
     # Pagination - show 6 events per page
-    paginator = Paginator(events_list, 6)
-    page = request.GET.get('page')
-    
-    try:
-        events = paginator.page(page)
-    except PageNotAnInteger:
-        events = paginator.page(1)
-    except EmptyPage:
-        events = paginator.page(paginator.num_pages)
+    events = paginate(request, events_list, 6, 'start_date')
     
     context = {
         'events': events,
@@ -975,33 +865,33 @@ def events(request):
     }
     return render(request, 'events/events.html', context)
 
+@cache_tags(Event)
 def all_events(request):
     # Get search query
     query = request.GET.get('q')
     
     # Get all events, ordered by start date (upcoming first)
-    events_list = Event.objects.all().order_by('start_date')
+    events_list = for_listing(Event.objects.order_by('start_date'), 'event')
+    
+    key = 'start_date'
     
     # Apply search filter if query exists
     if query:
-        events_list = events_list.filter(
-            Q(title__icontains=query) |
-            Q(description__icontains=query) |
-            Q(location__icontains=query) |
-            Q(organizer__icontains=query) |
-            Q(event_type__icontains=query)
-        )
+        results = fulltext_search(events_list, 'event', query)
+        if results is not None:
+            events_list = results
+            key = None  # keep relevance order
+        else:
+            events_list = events_list.filter(
+                Q(title__icontains=query) |
+                Q(description__icontains=query) |
+                Q(location__icontains=query) |
+                Q(organizer__icontains=query) |
+                Q(event_type__icontains=query)
+            )
     
     # Pagination
-    paginator = Paginator(events_list, 12)
-    page = request.GET.get('page')
-    
-    try:
-        events = paginator.page(page)
-    except PageNotAnInteger:
-        events = paginator.page(1)
-    except EmptyPage:
-        events = paginator.page(paginator.num_pages)
+    events = paginate(request, events_list, 12, key)
     
     context = {
         'events': events,
@@ -1010,6 +900,7 @@ def all_events(request):
     }
     return render(request, 'cse/all_events.html', context)
 
+@cache_tags(Event)
 def event_detail(request, event_id):
     event = get_object_or_404(Event, id=event_id)
     context = {
@@ -1017,6 +908,7 @@ def event_detail(request, event_id):
     }
     return render(request, 'cse/event_detail.html', context)
 
+@cache_tags(Project, FacultyMember)
 def project_detail(request, project_id):
     project = get_object_or_404(Project, id=project_id)
     context = {
@@ -1024,19 +916,12 @@ def project_detail(request, project_id):
     }
     return render(request, 'cse/projects/project_detail.html', context)
 
+@cache_tags(Project)
 def all_projects(request):
-    projects_list = Project.objects.all().order_by('-start_date')
+    projects_list = for_listing(Project.objects.order_by('-start_date'), 'project')
     
     # Pagination
-    paginator = Paginator(projects_list, 9)  # Show 9 projects per page
-    page = request.GET.get('page')
-    
-    try:
-        projects = paginator.page(page)
-    except PageNotAnInteger:
-        projects = paginator.page(1)
-    except EmptyPage:
-        projects = paginator.page(paginator.num_pages)
+    projects = paginate(request, projects_list, 9, '-start_date')  # Show 9 projects per page
     
     context = {
         'projects': projects,
@@ -1048,6 +933,7 @@ def projects(request):
     # Redirect to all_projects view
     return redirect('all_projects')
 
+@cache_tags(Event)
 def event_detail(request, event_id):
     event = get_object_or_404(Event, id=event_id)
     context = {
@@ -1055,9 +941,11 @@ def event_detail(request, event_id):
     }
     return render(request, 'cse/event_detail.html', context)
 
+@cache_tags()
 def alumni(request):
     return render(request, 'cse/alumni.html')
 
+@cache_tags(ComputerClubMember)
 def computer_club(request):
     # Get all club members and sort them by priority level and position
     club_members = ComputerClubMember.objects.all()
@@ -1075,28 +963,24 @@ def computer_club(request):
     
     return render(request, 'cse/club/computer_club.html', context)
 
+@cache_tags()
 def programming_club(request):
     return render(request, 'cse/club/programming_club.html')
 
+@cache_tags()
 def contact_us(request):
     return render(request, 'cse/contact_us.html')
 
+@cache_tags(ImageGallery)
 def image_gallery_home(request):
     # Get the latest 6 images for the home page
     images = ImageGallery.objects.all().order_by('-upload_time')[:6]
     return render(request, 'cse/image_gallery/home_page_image.html', {'images': images})
 
+@cache_tags(ImageGallery)
 def all_images(request):
     image_list = ImageGallery.objects.all().order_by('-upload_time')
-    paginator = Paginator(image_list, 9)  # Show 9 images per page
-    
-    page = request.GET.get('page')
-    try:
-        images = paginator.page(page)
-    except PageNotAnInteger:
-        images = paginator.page(1)
-    except EmptyPage:
-        images = paginator.page(paginator.num_pages)
+    images = paginate(request, image_list, 9, '-upload_time')  # Show 9 images per page
     
     return render(request, 'cse/image_gallery/all_image.html', {'images': images})
 
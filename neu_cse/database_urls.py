@@ -0,0 +1,48 @@
+"""
+``DATABASES`` entries built from ``DATABASE_URL``-style environment variables.
+
+SQLite URLs (``sqlite:////srv/neu_cse/db.sqlite3``) get the connection profile
+from ``neu_cse.sqlite_profiles``. Other databases keep their connections open
+for ``CONN_MAX_AGE`` seconds with health checks, so each worker reuses one
+connection instead of opening one per request. With ``DATABASE_POOL=True``
+PostgreSQL connections come from Django's built-in pool instead. The pool needs
+psycopg 3 with its pool extra (``psycopg[binary,pool]``) rather than the psycopg2
+in requirements.txt, and is refused at startup when that is not installed.
+
+Replica entries mirror ``default`` under test, so the test runner does not
+try to create a database for them.
+"""
+from importlib.util import find_spec
+
+import dj_database_url
+from django.core.exceptions import ImproperlyConfigured
+
+from .sqlite_profiles import sqlite_database
+
+CONN_MAX_AGE = 600  # seconds
+
+
+def database_from_url(url, sqlite_profile='basic', pool=False, replica=False):
+    """A ``DATABASES`` entry for ``url``; ``replica`` marks a read-only copy of ``default``."""
+    database = dj_database_url.parse(url, conn_max_age=CONN_MAX_AGE, conn_health_checks=True)
+    if database['ENGINE'] == 'django.db.backends.sqlite3':
+        database = sqlite_database(database['NAME'], sqlite_profile)
+    elif pool and database['ENGINE'] == 'django.db.backends.postgresql':
+        if not (find_spec('psycopg') and find_spec('psycopg_pool')):
+            # Otherwise Django only complains at the first connection
+            raise ImproperlyConfigured('DATABASE_POOL needs psycopg 3: pip install "psycopg[binary,pool]"')
+        # The pool replaces persistent connections; Django rejects both at once
+        database['CONN_MAX_AGE'] = 0
+        database.setdefault('OPTIONS', {})['pool'] = True
+    if replica:
+        database['TEST'] = {'MIRROR': 'default'}
+    return database
+
+
+def replica_databases(urls, sqlite_profile='basic', pool=False):
+    """``{'replica_1': {...}, ...}`` for a comma-separated list of replica URLs."""
+    urls = [url.strip() for url in urls.split(',') if url.strip()]
+    return {
+        f'replica_{index}': database_from_url(url, sqlite_profile, pool, replica=True)
+        for index, url in enumerate(urls, start=1)
+    }
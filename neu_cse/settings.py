@@ -14,6 +14,9 @@ import os
 from pathlib import Path
 import dj_database_url
 
+from .database_urls import database_from_url, replica_databases
+from .sqlite_profiles import sqlite_database
+
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
 
@@ -53,6 +56,9 @@ MIDDLEWARE = [
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
+    'cse_app.routers.ReplicaReadMiddleware',  # after auth
+    'cse_app.view_counter.PageViewVisitorMiddleware',
+    'cse_app.page_cache.AnonymousPageCacheMiddleware',  # after auth and messages
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
 
@@ -71,6 +77,7 @@ TEMPLATES = [
                 'django.contrib.auth.context_processors.auth',
                 'django.contrib.messages.context_processors.messages',
                 'cse_app.context_processors.scrolling_notice',
+                'cse_app.context_processors.page_view_beacon',
             ],
         },
     },
@@ -82,13 +89,40 @@ WSGI_APPLICATION = 'neu_cse.wsgi.application'
 # Database
 # https://docs.djangoproject.com/en/5.2/ref/settings/#databases
 
-# Use SQLite for both local and production
-DATABASES = {
-    'default': {
-        'ENGINE': 'django.db.backends.sqlite3',
-        'NAME': BASE_DIR / 'db.sqlite3',
-    }
-}
+# SQLite by default; set DATABASE_URL (e.g. postgres://...) to use another
+# database. SQLITE_PROFILE=basic (default) is Django's stock setup and leaves the
+# database file's journal mode alone; set SQLITE_PROFILE=production on the server
+# (build.sh does for its own steps) for WAL, a busy timeout and persistent
+# connections (see neu_cse.sqlite_profiles and neu_cse.database_urls).
+SQLITE_PROFILE = os.environ.get('SQLITE_PROFILE', 'basic')
+DATABASE_POOL = os.environ.get('DATABASE_POOL', 'False') == 'True'  # PostgreSQL only; needs psycopg[binary,pool] installed
+
+if os.environ.get('DATABASE_URL'):
+    DATABASES = {'default': database_from_url(os.environ['DATABASE_URL'], SQLITE_PROFILE, DATABASE_POOL)}
+else:
+    DATABASES = {'default': sqlite_database(BASE_DIR / 'db.sqlite3', SQLITE_PROFILE)}
+
+# Page-view counters get their own database so anonymous traffic never takes
+# the content database's write lock (routing in cse_app.routers)
+if os.environ.get('ANALYTICS_DATABASE_URL'):
+    DATABASES['analytics'] = database_from_url(os.environ['ANALYTICS_DATABASE_URL'], SQLITE_PROFILE, DATABASE_POOL)
+else:
+    DATABASES['analytics'] = sqlite_database(
+        os.environ.get('ANALYTICS_DATABASE_PATH') or BASE_DIR / 'analytics.sqlite3', SQLITE_PROFILE,
+    )
+
+# Read replicas of the default database, comma separated. Anonymous GET requests
+# read from one of them; logins, dashboards and all writes use the primary.
+# Locally, sqlite:// URLs pointing at copies made by `manage.py refresh_sqlite_replicas` work.
+_replicas = replica_databases(os.environ.get('DATABASE_REPLICA_URLS', ''), SQLITE_PROFILE, DATABASE_POOL)
+DATABASES.update(_replicas)
+DATABASE_REPLICAS = list(_replicas)
+# After a content change every request reads from the primary until the replicas
+# have it: for server-kept replicas this many seconds (above their usual lag);
+# SQLite copies until the next refresh_sqlite_replicas run
+REPLICA_PIN_SECONDS = int(os.environ.get('REPLICA_PIN_SECONDS', 30))
+
+DATABASE_ROUTERS = ['cse_app.routers.AnalyticsRouter', 'cse_app.routers.ReplicaRouter']
 
 
 # Password validation
@@ -175,3 +209,88 @@ CKEDITOR_CONFIGS = {
         ]),
     },
 }
+
+# Buffered page-view counter (cse_app.view_counter)
+# Increments are held per worker and written in one batched UPSERT.
+VIEW_COUNTER_FLUSH_INTERVAL = int(os.environ.get('VIEW_COUNTER_FLUSH_INTERVAL', '10'))  # seconds
+VIEW_COUNTER_MAX_PENDING = int(os.environ.get('VIEW_COUNTER_MAX_PENDING', '500'))  # hits
+
+# Page-view history (cse_app.page_analytics): hourly buckets rolled up to days and months
+PAGE_VIEW_ROLLUP_INTERVAL = int(os.environ.get('PAGE_VIEW_ROLLUP_INTERVAL', '600'))  # seconds, 0 disables
+PAGE_VIEW_HOURLY_RETENTION_DAYS = 14
+PAGE_VIEW_DAILY_RETENTION_DAYS = 400
+PAGE_VIEW_MONTHLY_RETENTION_MONTHS = 60
+UNIQUE_VISITOR_RETENTION_DAYS = 90  # one 2 KB HyperLogLog sketch per page per day
+
+# Page-view beacon endpoint (cse_app.beacon): limits per request
+PAGE_VIEW_BEACON_MAX_BYTES = 8192
+PAGE_VIEW_BEACON_MAX_EVENTS = 20
+
+# Bot/prefetch filtering in front of the counter (cse_app.traffic_filter)
+TRAFFIC_FILTER_WINDOW = 60  # seconds
+TRAFFIC_FILTER_MAX_EVENTS = 30  # per client address per window
+TRAFFIC_FILTER_MAX_CLIENTS = 10000  # addresses kept in the per-worker LRU
+
+# Cache shared by all gunicorn workers, so signal-driven invalidation reaches every process.
+# Set REDIS_URL to use Redis; otherwise a file-based cache under BASE_DIR is used.
+# The file cache lists its whole directory on every write to count its entries,
+# and culls a third of them at random once it holds MAX_ENTRIES. Entries of
+# superseded versions linger as files until they expire, so every versioned
+# entry carries a timeout and the limit stays near the live full-page, facet,
+# profile and version entries rather than far above them, which keeps that
+# listing short. Its incr() is a read and a rewrite, not atomic: the
+# hit/miss and traffic-filter tallies kept in the cache are best-effort figures
+# (use Redis for exact ones); cache versions are set outright and never incremented.
+if os.environ.get('REDIS_URL'):
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': os.environ['REDIS_URL'],
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+            'LOCATION': os.path.join(BASE_DIR, '.django_cache'),
+            'OPTIONS': {
+                'MAX_ENTRIES': int(os.environ.get('CACHE_MAX_ENTRIES', '5000')),
+                'CULL_FREQUENCY': 3,
+            },
+        }
+    }
+
+# Upper bound on how long the assembled home page context is reused (seconds)
+HOME_PAGE_CACHE_TIMEOUT = int(os.environ.get('HOME_PAGE_CACHE_TIMEOUT', '300'))
+
+# Assembled faculty profiles (cse_app.faculty_profiles); invalidated by signals, this only bounds memory
+FACULTY_PROFILE_CACHE_TIMEOUT = 3600  # seconds
+
+# Notice attachment delivery (cse_app.file_delivery)
+# 'nginx' sends X-Accel-Redirect, 'apache' sends X-Sendfile; unset streams from Django.
+FILE_DELIVERY_BACKEND = os.environ.get('FILE_DELIVERY_BACKEND') or None
+FILE_DELIVERY_ACCEL_PREFIX = os.environ.get('FILE_DELIVERY_ACCEL_PREFIX', '/protected-media/')
+
+# Responsive image derivatives (cse_app.image_derivatives)
+IMAGE_DERIVATIVE_WIDTHS = (320, 640, 960, 1280)
+IMAGE_DERIVATIVE_QUALITY = 80
+
+# Anonymous full-page cache (cse_app.page_cache); entries are also purged by model tags
+PAGE_CACHE_TIMEOUT = int(os.environ.get('PAGE_CACHE_TIMEOUT', '600'))
+
+# Listing pages load only the columns their cards render (cse_app.projections)
+LIST_PROJECTIONS = True
+
+# Cached listing totals for the keyset paginator (cse_app.pagination); also purged by model tags
+PAGINATION_COUNT_TIMEOUT = 600  # seconds
+
+# Cached facet counts of the faculty and staff directories (cse_app.facets); also purged by model tags
+FACET_CACHE_TIMEOUT = 600  # seconds
+
+# Tailwind standalone CLI used by `manage.py build_tailwind_css` (downloaded when unset and not on PATH)
+TAILWIND_CLI = os.environ.get('TAILWIND_CLI') or None
+# SHA-256 of the downloaded CLI per release target, from the release's sha256sums.txt,
+# e.g. TAILWIND_CLI_SHA256="linux-x64=<sha256>,macos-arm64=<sha256>"; unpinned downloads are refused
+TAILWIND_CLI_SHA256 = dict(
+    pin.strip().split('=', 1) for pin in os.environ.get('TAILWIND_CLI_SHA256', '').split(',') if '=' in pin
+)
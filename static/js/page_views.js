@@ -0,0 +1,63 @@
+// Report page views off the critical path. Events are queued in sessionStorage
+// (so a view whose beacon never left is retried from the next page) and posted
+// in one batch with navigator.sendBeacon when the page is hidden or unloaded.
+(function () {
+    var script = document.currentScript;
+    if (!script || !navigator.sendBeacon) {
+        return;
+    }
+    var endpoint = script.dataset.endpoint;
+    var storageKey = 'cse:page-views';
+    var maxBatch = 20;
+
+    function stored() {
+        try {
+            return JSON.parse(sessionStorage.getItem(storageKey)) || [];
+        } catch (e) {
+            return [];
+        }
+    }
+
+    function store(events) {
+        try {
+            sessionStorage.setItem(storageKey, JSON.stringify(events));
+        } catch (e) {
+            // Private mode or storage full: the in-memory queue still gets sent
+        }
+    }
+
+    var queue = stored();
+
+    function enqueue() {
+        queue = queue.concat([{
+            id: Date.now().toString(36) + Math.random().toString(36).slice(2, 10),
+            page: script.dataset.pageView
+        }]).slice(-maxBatch);
+        store(queue);
+    }
+
+    // A speculatively prerendered page only counts once the visitor actually opens it
+    if (document.prerendering) {
+        document.addEventListener('prerenderingchange', enqueue, {once: true});
+    } else {
+        enqueue();
+    }
+
+    function flush() {
+        if (!queue.length) {
+            return;
+        }
+        var body = new Blob([JSON.stringify({views: queue})], {type: 'text/plain'});
+        if (navigator.sendBeacon(endpoint, body)) {
+            queue = [];
+            store(queue);
+        }
+    }
+
+    document.addEventListener('visibilitychange', function () {
+        if (document.visibilityState === 'hidden') {
+            flush();
+        }
+    });
+    window.addEventListener('pagehide', flush);
+})();
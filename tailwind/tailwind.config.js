@@ -0,0 +1,29 @@
+/** Tailwind build for `python manage.py build_tailwind_css` (run from the project root). */
+module.exports = {
+  content: [
+    './templates/**/*.html',
+    './cse_app/**/*.py',
+  ],
+  theme: {
+    extend: {
+      fontFamily: {
+        'sans': ['Nunito Sans', 'ui-sans-serif', 'system-ui', '-apple-system', 'BlinkMacSystemFont', 'Segoe UI', 'Roboto', 'Helvetica Neue', 'Arial', 'Noto Sans', 'sans-serif'],
+      },
+      // Brand green (also --custom-green in base.html), so ring-/focus:/hover: variants and opacities exist
+      colors: {
+        'custom-green': '#02644A',
+      },
+      // animate-fade-in is added by the About page's scroll observer
+      keyframes: {
+        'fade-in': {
+          from: { opacity: '0', transform: 'translateY(20px)' },
+          to: { opacity: '1', transform: 'translateY(0)' },
+        },
+      },
+      animation: {
+        'fade-in': 'fade-in 0.6s ease-out forwards',
+      },
+    },
+  },
+  plugins: [],
+}